@@ -7,11 +7,11 @@ de la interfaz gráfica del simulador.
 
 import tkinter as tk
 from tkinter import ttk, messagebox
+import _tkinter
+import asyncio
 import threading
 import time
-from typing import Dict, Any, Callable, Optional, List
-import pandas as pd
-import networkx as nx
+from typing import Dict, Callable, List
 
 from ..panels.panel_control import PanelControl
 from ..panels.panel_visualizacion import PanelVisualizacion
@@ -27,11 +27,20 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 
 from Simulador.core.simulador import SimuladorCiclorutas
 from Simulador.core.configuracion import ConfiguracionSimulacion
+from Simulador.utils.grafo_utils import GrafoUtils
+from Simulador.utils.cinematica_utils import CinematicaUtils
 
 
 class InterfazSimulacion:
     """Interfaz gráfica principal para controlar la simulación de ciclorutas"""
     
+    # Pasos simulados entre cesiones al bucle de eventos al terminar la simulación
+    PASOS_POR_CESION = 50
+    
+    # Tiempo (ms) que los avisos quedan visibles en la barra de estado
+    DURACION_AVISO_MS = 3000
+    DURACION_AVISO_FIN_MS = 10000
+    
     def __init__(self, root):
         self.root = root
         self.root.title("🚴 Simulador de Ciclorutas - Control Avanzado")
@@ -43,26 +52,49 @@ class InterfazSimulacion:
         self.config = ConfiguracionSimulacion()
         self.simulador = SimuladorCiclorutas(self.config)
         
+        # La interfaz y el simulador comparten el mismo objeto de configuración
+        if self.simulador.config is not self.config:
+            self.simulador.config = self.config
+        
         # Variables para el grafo
         self.grafo_actual = None
+        self._conteo_grafo = (0, 0)  # (nodos, arcos) del grafo cargado, se calcula al cargarlo
+        self._atributos_grafo = frozenset()  # Atributos de arcos (sin 'weight'), idem
         self.pos_grafo_actual = None
         self.perfiles_df = None
+        self._fila_por_perfil = {}  # PERFILES -> etiqueta de fila en perfiles_df
         self.rutas_df = None
         self.nombre_archivo_excel = None
         
         # Variables de control
         self.simulacion_activa = False
-        self.hilo_simulacion = None
         self.ventana_cerrada = False
         
+        # Integración asyncio + Tk (un solo hilo para simulación e interfaz)
+        self._loop_async = None
+        self._tarea_simulacion = None
+        
+        # Sin bucle asyncio los pasos se encadenan con root.after en el hilo de Tk
+        # (el ritmo de ambos sale de config.intervalo_paso_interfaz y config.pasos_por_cuadro)
+        self._id_tick = None
+        
+        # Contenedor horizontal de paneles (se crea en crear_interfaz)
+        self.paned_main = None
+        
+        # after() que borra el aviso de la barra de estado (ver mostrar_aviso)
+        self._id_fin_aviso = None
+        
         # Variables para paneles opcionales
         self.panel_estadisticas_visible = True
         self.panel_distribuciones_visible = True
         
-        # Cache de datos de interfaz
-        self._cache_interfaz = None
-        self._ultima_actualizacion_cache = 0
-        self._intervalo_cache = 0.1  # Actualizar cache cada 100ms
+        # Refresco de ciclistas y estadísticas durante la simulación (ver actualizar_interfaz)
+        self._ultimo_refresco_completo = None  # None fuerza el refresco en el próximo paso
+        self._intervalo_refresco = 0.1  # Como máximo cada 100ms
+        
+        # Firma (entorno, estado, tiempo, ciclistas) de las últimas estadísticas mostradas por
+        # actualizar_estadisticas; None si el panel se actualizó por otra vía
+        self._firma_estadisticas = None
         
         # Configurar manejo de cierre de ventana
         self.root.protocol("WM_DELETE_WINDOW", self.cerrar_aplicacion)
@@ -70,6 +102,9 @@ class InterfazSimulacion:
         # Configurar redimensionamiento
         self.root.bind('<Configure>', self._on_window_resize)
         
+        # Compilar (o cargar de la cache) los kernels numéricos en segundo plano mientras se arma la interfaz
+        threading.Thread(target=CinematicaUtils.precompilar, daemon=True).start()
+        
         # Configurar estilo
         EstiloUtils.configurar_estilo_ttk()
         
@@ -83,6 +118,54 @@ class InterfazSimulacion:
         # Actualizar estadísticas iniciales
         self.actualizar_estadisticas()
     
+    def ejecutar(self):
+        """Ejecuta la aplicación con un bucle asyncio que también atiende los eventos de Tk
+        
+        Reemplaza a root.mainloop(): la simulación corre como tarea asyncio en el
+        mismo hilo que la interfaz, evitando accesos a Tk desde otros hilos.
+        """
+        try:
+            asyncio.run(self._bucle_principal_async())
+        except tk.TclError:
+            pass  # Ventana ya fue destruida
+    
+    async def _bucle_principal_async(self):
+        """Bucle principal: procesa eventos Tk pendientes y cede el control a asyncio"""
+        self._loop_async = asyncio.get_running_loop()
+        try:
+            while not self.ventana_cerrada:
+                # Procesar todos los eventos Tk pendientes sin bloquear
+                while self.root.tk.dooneevent(_tkinter.DONT_WAIT) > 0:
+                    pass
+                await asyncio.sleep(0.01)
+        finally:
+            self._detener_bucle_simulacion()
+            self._loop_async = None
+    
+    def _lanzar_bucle_simulacion(self):
+        """Lanza el bucle de simulación como tarea asyncio (o con root.after si no hay bucle asyncio)"""
+        if self._loop_async is not None:
+            # Una sola tarea de simulación: si la anterior aún no terminó (p. ej. pausar y
+            # reanudar antes de que despierte) sigue siendo ella la que avanza el simulador
+            if self._tarea_simulacion is None or self._tarea_simulacion.done():
+                self._tarea_simulacion = self._loop_async.create_task(self.ejecutar_simulacion_async())
+        elif self._id_tick is None:
+            # Compatibilidad cuando se usa root.mainloop() directamente
+            self._id_tick = self.root.after(0, self._tick_simulacion)
+    
+    def _detener_bucle_simulacion(self):
+        """Cancela la tarea (o el paso programado) de simulación en curso, si existe"""
+        if self._tarea_simulacion is not None and not self._tarea_simulacion.done():
+            self._tarea_simulacion.cancel()
+        self._tarea_simulacion = None
+        
+        if self._id_tick is not None:
+            try:
+                self.root.after_cancel(self._id_tick)
+            except tk.TclError:
+                pass
+            self._id_tick = None
+    
     def crear_interfaz(self):
         """Crea todos los elementos de la interfaz con diseño responsive"""
         # Frame principal
@@ -155,10 +238,23 @@ class InterfazSimulacion:
         )
         self.btn_toggle_distribuciones.pack(side=tk.LEFT, padx=(0, 5))
         
+        # Botón para descartar el layout cacheado y recalcularlo
+        self.btn_recalcular_layout = EstiloUtils.crear_button_con_estilo(
+            toolbar_frame, 
+            "🧭 Recalcular layout", 
+            'TButton',
+            command=self.recalcular_layout
+        )
+        self.btn_recalcular_layout.pack(side=tk.LEFT, padx=(0, 5))
+        
         # Separador
         separator = EstiloUtils.crear_separador(toolbar_frame, 'vertical')
         separator.pack(side=tk.LEFT, fill=tk.Y, padx=10)
         
+        # Barra de estado: avisos no modales de las operaciones que terminan bien
+        self.label_aviso = EstiloUtils.crear_label_con_estilo(toolbar_frame, "", 'Success.TLabel')
+        self.label_aviso.pack(side=tk.LEFT, padx=(0, 5))
+        
         # Información de estado de la ventana
         self.label_info_ventana = EstiloUtils.crear_label_con_estilo(
             toolbar_frame, 
@@ -211,13 +307,9 @@ class InterfazSimulacion:
     def aplicar_velocidades(self, vel_min: float, vel_max: float):
         """Aplica los cambios de velocidad configurados"""
         try:
-            # Actualizar configuración
+            # El simulador comparte self.config: una sola escritura basta
             self.config.actualizar_velocidades(vel_min, vel_max)
             
-            # Actualizar simulador si existe
-            if hasattr(self, 'simulador') and self.simulador:
-                self.simulador.config.actualizar_velocidades(vel_min, vel_max)
-            
         except Exception as e:
             messagebox.showerror("Error", f"Error al aplicar velocidades: {str(e)}")
     
@@ -239,13 +331,9 @@ class InterfazSimulacion:
                                    f"en máquinas locales.")
                 return
             
-            # Actualizar configuración
+            # El simulador comparte self.config: una sola escritura basta
             self.config.actualizar_duracion(duracion)
             
-            # Actualizar simulador si existe
-            if hasattr(self, 'simulador') and self.simulador:
-                self.simulador.config.actualizar_duracion(duracion)
-            
         except Exception as e:
             messagebox.showerror("Error", f"Error al aplicar duración: {str(e)}")
     
@@ -265,8 +353,13 @@ class InterfazSimulacion:
             
             # Guardar datos
             self.grafo_actual = grafo
+            self._conteo_grafo = (grafo.number_of_nodes(), grafo.number_of_edges())
+            self._atributos_grafo = frozenset(
+                key for _, _, datos in grafo.edges(data=True) for key in datos if key != 'weight'
+            )
             self.pos_grafo_actual = pos_grafo
             self.perfiles_df = perfiles_df
+            self._fila_por_perfil = self._indexar_perfiles(perfiles_df)
             self.rutas_df = rutas_df
             self.nombre_archivo_excel = os.path.basename(archivo)
             
@@ -277,22 +370,76 @@ class InterfazSimulacion:
             # Reinicializar la simulación para que esté lista para ejecutar
             self.simulador.inicializar_simulacion()
             
-            # Actualizar paneles
-            self.actualizar_paneles_con_grafo()
-            
-            # Actualizar visualización para mostrar el estado inicial
-            self.actualizar_visualizacion()
+            # Actualizar paneles y visualización con un único redibujado al final
+            with self.panel_visualizacion.suspender_dibujado():
+                self.actualizar_paneles_con_grafo()
+                
+                # Actualizar visualización para mostrar el estado inicial
+                self.actualizar_visualizacion()
+            self.root.update_idletasks()
             
-            # Mostrar mensaje de éxito
-            ArchivoUtils.mostrar_dialogo_carga_exitosa(archivo, grafo, perfiles_df, rutas_df)
+            num_nodos, num_arcos = self._conteo_grafo
+            self.mostrar_aviso(f"✅ Grafo cargado: {self.nombre_archivo_excel} "
+                               f"({num_nodos} nodos, {num_arcos} arcos)")
             
         except Exception as e:
             messagebox.showerror("Error", f"No se pudo cargar el archivo: {str(e)}")
     
+    def mostrar_aviso(self, texto: str, duracion_ms: int = None, estilo: str = 'Success.TLabel'):
+        """Muestra un aviso en la barra de estado y lo borra pasado un tiempo
+        
+        Reemplaza a los messagebox.showinfo de las operaciones exitosas: no bloquea
+        el bucle de eventos ni la simulación esperando a que el usuario acepte.
+        Los avisos de problemas no críticos se muestran con estilo='Warning.TLabel'.
+        """
+        if self.ventana_cerrada:
+            return
+        if self._id_fin_aviso is not None:
+            self.root.after_cancel(self._id_fin_aviso)
+        self.label_aviso.config(text=texto, style=estilo)
+        self._id_fin_aviso = self.root.after(duracion_ms or self.DURACION_AVISO_MS, self._borrar_aviso)
+    
+    def _borrar_aviso(self):
+        """Borra el aviso de la barra de estado (programado por mostrar_aviso)"""
+        self._id_fin_aviso = None
+        self.label_aviso.config(text="")
+    
+    def recalcular_layout(self):
+        """Recalcula las posiciones del grafo con un layout automático nuevo
+        
+        El layout recalculado reemplaza al cacheado (memoria y disco) del grafo, así
+        que recargar el mismo archivo lo conserva. Los grafos con coordenadas
+        LAT/LON no cambian.
+        """
+        try:
+            if not self.grafo_actual:
+                return
+            
+            # Detener la simulación en curso: las posiciones cambian
+            self.simulacion_activa = False
+            self._detener_bucle_simulacion()
+            
+            self.pos_grafo_actual = GrafoUtils.calcular_posiciones_grafo(self.grafo_actual, seed=42,
+                                                                         recalcular=True)
+            self.simulador.configurar_grafo(self.grafo_actual, self.pos_grafo_actual, 
+                                            self.perfiles_df, self.rutas_df, 
+                                            self.simulador.nombre_grafo_actual)
+            self.simulador.inicializar_simulacion()
+            
+            with self.panel_visualizacion.suspender_dibujado():
+                self.actualizar_paneles_con_grafo()
+                self.actualizar_visualizacion()
+                self.panel_control.resetear_boton_pausa()
+                self.panel_control.desbloquear_botones_simulacion()
+            
+        except Exception as e:
+            messagebox.showerror("Error", f"No se pudo recalcular el layout: {str(e)}")
+    
     def actualizar_paneles_con_grafo(self):
         """Actualiza todos los paneles cuando se carga un grafo"""
         # Actualizar panel de control
-        info_grafo = f"Red Ciclorutas: {len(self.grafo_actual.nodes())} nodos, {len(self.grafo_actual.edges())} arcos"
+        num_nodos, num_arcos = self._conteo_grafo
+        info_grafo = f"Red Ciclorutas: {num_nodos} nodos, {num_arcos} arcos"
         if self.nombre_archivo_excel:
             info_grafo += f"\n📁 Archivo: {self.nombre_archivo_excel}"
         self.panel_control.actualizar_info_grafo(info_grafo)
@@ -328,25 +475,16 @@ class InterfazSimulacion:
         if not self.grafo_actual:
             return []
         
-        atributos_disponibles = set()
-        for edge in self.grafo_actual.edges(data=True):
-            for key in edge[2].keys():
-                if key not in ['weight']:
-                    atributos_disponibles.add(key)
-        
-        return list(atributos_disponibles)
+        # Calculados una vez al cargar el grafo (no cambia después de la carga)
+        return list(self._atributos_grafo)
     
     def _obtener_atributos_perfiles_disponibles(self) -> List[str]:
         """Obtiene la lista de atributos disponibles tanto en el grafo como en los perfiles (dinámicamente)"""
         if not self.grafo_actual:
             return []
         
-        # Obtener atributos del grafo (en minúsculas)
-        atributos_grafo = set()
-        for edge in self.grafo_actual.edges(data=True):
-            for key in edge[2].keys():
-                if key not in ['weight']:
-                    atributos_grafo.add(key)
+        # Atributos del grafo (en minúsculas), calculados al cargarlo
+        atributos_grafo = self._atributos_grafo
         
         # Obtener atributos de perfiles si existen
         atributos_perfiles = set()
@@ -368,10 +506,11 @@ class InterfazSimulacion:
     def nueva_simulacion(self):
         """Crea una nueva simulación con los parámetros actuales"""
         try:
-            # Detener simulación actual si está corriendo
-            if self.simulacion_activa:
-                self.simulacion_activa = False
-                time.sleep(0.1)
+            # Detener simulación actual: la cancelación de la tarea (o del paso programado)
+            # es inmediata en el hilo de Tk, sin esperas fijas
+            self.simulacion_activa = False
+            self._detener_bucle_simulacion()
+            self._ultimo_refresco_completo = None  # El próximo paso refresca todo con el nuevo simulador
             
             # Obtener velocidades del panel de control
             vel_min, vel_max = self.panel_control.obtener_velocidades()
@@ -404,7 +543,7 @@ class InterfazSimulacion:
             # Resetear botón de pausa
             self.panel_control.resetear_boton_pausa()
             
-            messagebox.showinfo("Nueva Simulación", "Simulación creada exitosamente con los nuevos parámetros!")
+            self.mostrar_aviso("✅ Simulación creada con los nuevos parámetros")
             
         except Exception as e:
             messagebox.showerror("Error", f"Error al crear la simulación: {str(e)}")
@@ -416,59 +555,91 @@ class InterfazSimulacion:
             self.simulacion_activa = True
             self.panel_control.actualizar_estado("EJECUTANDO", self.simulador.tiempo_actual)
             
-            # Iniciar hilo de simulación
-            self.hilo_simulacion = threading.Thread(target=self.ejecutar_simulacion)
-            self.hilo_simulacion.daemon = True
-            self.hilo_simulacion.start()
-    
-    def ejecutar_simulacion(self):
-        """Ejecuta la simulación en un hilo separado"""
-        while self.simulacion_activa and self.simulador.estado == "ejecutando" and not self.ventana_cerrada:
-            if self.simulador.ejecutar_paso():
-                # Actualizar interfaz en el hilo principal
-                if not self.ventana_cerrada and self.root.winfo_exists():
-                    self.root.after(0, self.actualizar_interfaz)
-                time.sleep(0.05)  # Control de velocidad
-            else:
-                # La simulación ha terminado
-                if not self.ventana_cerrada and self.root.winfo_exists():
-                    self.root.after(0, self.simulacion_terminada)
-                break
-    
-    def actualizar_interfaz(self):
-        """Actualiza la interfaz con los datos actuales"""
-        if self.ventana_cerrada or not self.root.winfo_exists():
+            # Iniciar bucle de simulación
+            self._lanzar_bucle_simulacion()
+    
+    async def ejecutar_simulacion_async(self):
+        """Ejecuta la simulación como tarea asyncio en el hilo de la interfaz"""
+        # La tarea queda ligada al simulador con el que se lanzó: si se reemplaza
+        # (nueva simulación o carga de archivo) termina sin tocar el nuevo
+        simulador = self.simulador
+        loop = asyncio.get_running_loop()
+        proximo_paso = loop.time()
+        try:
+            while (self.simulacion_activa and self.simulador is simulador and
+                   simulador.estado == "ejecutando" and not self.ventana_cerrada):
+                # Varios pasos por cuadro: un solo refresco de la interfaz por lote
+                if not simulador.ejecutar_n_pasos(self.config.pasos_por_cuadro):
+                    break
+                self.actualizar_interfaz()
+                
+                # Control de velocidad a ritmo fijo: el tiempo del paso y del redibujado se
+                # descuenta de la espera (si se va con retraso no se acumulan pasos en ráfaga)
+                ahora = loop.time()
+                proximo_paso = max(proximo_paso + self.config.intervalo_paso_interfaz, ahora)
+                await asyncio.sleep(proximo_paso - ahora)
+            
+            # La simulación llegó a su fin de forma natural
+            if (self.simulacion_activa and self.simulador is simulador and
+                    simulador.estado == "completada" and not self.ventana_cerrada):
+                self.simulacion_terminada()
+        except asyncio.CancelledError:
+            pass
+    
+    def _tick_simulacion(self):
+        """Ejecuta un lote de pasos de simulación y se reprograma con root.after
+        
+        Se usa cuando no hay bucle asyncio (root.mainloop() directo): el propio
+        bucle de eventos de Tk marca el ritmo, sin hilos ni colas de mensajes.
+        """
+        self._id_tick = None
+        if not self.simulacion_activa or self.ventana_cerrada:
+            return
+        
+        if self.simulador.estado == "ejecutando":
+            inicio = time.monotonic()
+            if self.simulador.ejecutar_n_pasos(self.config.pasos_por_cuadro):
+                self.actualizar_interfaz()
+                # Descontar de la espera lo que tardaron los pasos y el redibujado
+                transcurrido = time.monotonic() - inicio
+                espera_ms = max(0, int((self.config.intervalo_paso_interfaz - transcurrido) * 1000))
+                self._id_tick = self.root.after(espera_ms, self._tick_simulacion)
+                return
+        
+        # La simulación llegó a su fin de forma natural
+        if self.simulador.estado == "completada":
+            self.simulacion_terminada()
+    
+    def actualizar_interfaz(self, forzar: bool = False):
+        """Actualiza la interfaz con los datos actuales
+        
+        Si la ventana sigue abierta se decide solo con ventana_cerrada (se marca en
+        cerrar_aplicacion antes de destruirla): winfo_exists sería un viaje a Tcl por paso.
+        
+        Args:
+            forzar: Refrescar ciclistas y estadísticas aunque no haya pasado el intervalo
+        """
+        if self.ventana_cerrada:
             return
         
         try:
-            # Cache de datos para evitar recálculos costosos
-            tiempo_actual = time.time()
-            if (self._cache_interfaz is None or 
-                tiempo_actual - self._ultima_actualizacion_cache > self._intervalo_cache):
-                
-                # Actualizar cache con datos del simulador
-                estado = self.simulador.obtener_estado_actual()
-                ciclistas_activos = self.simulador.obtener_ciclistas_activos()
-                estadisticas = self.simulador.obtener_estadisticas()
-                
-                self._cache_interfaz = {
-                    'estado': estado,
-                    'ciclistas_activos': ciclistas_activos,
-                    'estadisticas': estadisticas,
-                    'timestamp': tiempo_actual
-                }
-                self._ultima_actualizacion_cache = tiempo_actual
-            else:
-                # Usar datos del cache
-                estado = self._cache_interfaz['estado']
-                ciclistas_activos = self._cache_interfaz['ciclistas_activos']
-                estadisticas = self._cache_interfaz['estadisticas']
+            # El estado y el tiempo se muestran en cada paso (solo tocan Tk si cambian)
+            self.panel_control.actualizar_estado(self.simulador.estado, self.simulador.tiempo_actual)
+            
+            # Ciclistas y estadísticas se refrescan como máximo una vez por intervalo: los
+            # pasos intermedios no vuelven a consultar el simulador ni a reconfigurar labels
+            ahora = time.monotonic()
+            if (not forzar and self._ultimo_refresco_completo is not None and
+                    ahora - self._ultimo_refresco_completo < self._intervalo_refresco):
+                return
+            self._ultimo_refresco_completo = ahora
             
-            # Actualizar interfaz con datos
-            self.panel_control.actualizar_estado(estado['estado'], estado['tiempo_actual'])
+            ciclistas_activos = self.simulador.obtener_ciclistas_activos()
+            estadisticas = self.simulador.obtener_estadisticas()
             self.panel_visualizacion.actualizar_visualizacion(ciclistas_activos)
             
             # Actualizar estadísticas con validación
+            self._firma_estadisticas = None
             if estadisticas and isinstance(estadisticas, dict):
                 self.panel_estadisticas.actualizar_estadisticas(estadisticas)
             else:
@@ -476,12 +647,13 @@ class InterfazSimulacion:
                 self.panel_estadisticas.limpiar_estadisticas()
             
         except tk.TclError:
-            # Widget ya fue destruido
-            pass
+            # La ventana fue destruida sin pasar por cerrar_aplicacion: recordarlo en Python
+            # para no volver a consultar a Tcl en cada paso
+            self.ventana_cerrada = True
     
     def pausar_simulacion(self):
         """Pausa o reanuda la simulación"""
-        if self.ventana_cerrada or not self.root.winfo_exists():
+        if self.ventana_cerrada:
             return
         
         try:
@@ -489,62 +661,77 @@ class InterfazSimulacion:
                 # Pausar
                 self.simulador.pausar_simulacion()
                 self.panel_control.actualizar_estado("PAUSADO", self.simulador.tiempo_actual)
+                self.panel_control.establecer_boton_pausa(True)
+                self.panel_visualizacion.establecer_modo_pausa(True)
+                self.actualizar_visualizacion()  # Mostrar el instante exacto de la pausa
             else:
                 # Reanudar
                 self.simulador.estado = "ejecutando"
                 self.simulacion_activa = True
                 self.panel_control.actualizar_estado("EJECUTANDO", self.simulador.tiempo_actual)
+                self.panel_control.establecer_boton_pausa(False)
+                self.panel_visualizacion.establecer_modo_pausa(False)
                 
-                # Reiniciar hilo de simulación
-                self.hilo_simulacion = threading.Thread(target=self.ejecutar_simulacion)
-                self.hilo_simulacion.daemon = True
-                self.hilo_simulacion.start()
+                # Reiniciar bucle de simulación
+                self._lanzar_bucle_simulacion()
                 
         except tk.TclError:
             pass
     
     def terminar_simulacion(self):
         """Termina la simulación llevándola a su estado final"""
-        # Ejecutar la simulación hasta el final
-        while self.simulador.ejecutar_paso():
-            pass
+        # Detener primero el bucle de simulación: nadie más debe avanzar el simulador
+        # mientras se drena (si estaba en pausa o sin iniciar, se reanuda para terminarla)
+        self.simulacion_activa = False
+        self._detener_bucle_simulacion()
+        if self.simulador.estado in ("pausado", "detenido"):
+            self.simulador.estado = "ejecutando"
+        
+        if self._loop_async is not None:
+            # Drenado cooperativo como tarea asyncio (nueva, reiniciar o cerrar la cancelan);
+            # mientras tanto solo quedan habilitados los botones de nueva y reiniciar
+            self.panel_control.bloquear_botones_simulacion_terminada()
+            self._tarea_simulacion = self._loop_async.create_task(self._terminar_simulacion_async())
+            return
+        
+        # Sin bucle asyncio: ejecutar hasta el final por lotes, repintando entre lotes
+        self.simulador.ejecutar_hasta_final(al_avanzar=self.root.update_idletasks)
+        self._finalizar_terminacion()
+    
+    async def _terminar_simulacion_async(self):
+        """Lleva la simulación hasta el final cediendo el control a la interfaz entre lotes
         
+        Cada PASOS_POR_CESION pasos se cede con asyncio.sleep(0), que solo vuelve a
+        encolar la tarea (sin programar un temporizador): el bucle principal sigue
+        atendiendo a Tk y el grueso del tiempo se dedica a simular.
+        """
+        simulador = self.simulador
+        try:
+            while simulador.ejecutar_n_pasos(self.PASOS_POR_CESION):
+                self.actualizar_interfaz()  # Limitada internamente a un refresco por intervalo
+                await asyncio.sleep(0)
+                if self.simulador is not simulador or self.ventana_cerrada:
+                    return
+            self._finalizar_terminacion()
+        except asyncio.CancelledError:
+            pass
+    
+    def _finalizar_terminacion(self):
+        """Marca la simulación como terminada, genera los resultados y los muestra"""
         # Marcar como terminada
-        self.simulacion_activa = False
         self.simulador.estado = "completada"
         
         # Generar archivo Excel con resultados
         ruta_excel = self.simulador.generar_resultados_manual()
         
         # Actualizar interfaz
-        if not self.ventana_cerrada and self.root.winfo_exists():
+        if not self.ventana_cerrada:
             try:
                 self.panel_control.actualizar_estado("TERMINADA", self.simulador.tiempo_actual)
                 # Bloquear botones de iniciar, pausar, terminar y adelantar
                 self.panel_control.bloquear_botones_simulacion_terminada()
-                self.actualizar_interfaz()
-                
-                mensaje = "¡La simulación ha sido terminada exitosamente!\n\n"
-                mensaje += "Todos los ciclistas han completado sus rutas.\n\n"
-                if ruta_excel:
-                    nombre_archivo = os.path.basename(ruta_excel)
-                    mensaje += f"📊 Archivo Excel generado:\n{nombre_archivo}"
-                elif self.simulador.excel_generado and self.simulador.ruta_excel_generado:
-                    nombre_archivo = os.path.basename(self.simulador.ruta_excel_generado)
-                    mensaje += f"📊 Archivo Excel generado automáticamente:\n{nombre_archivo}"
-                else:
-                    mensaje += "⚠️ No se pudo generar el archivo Excel"
-                
-                # Mostrar modal primero
-                messagebox.showinfo("Simulación Terminada", mensaje)
-                
-                # Después de aceptar el modal, abrir ventana del gráfico
-                try:
-                    if hasattr(self.simulador, 'eventos_arcos') and self.simulador.eventos_arcos:
-                        from ..panels.ventana_grafico_ocupacion import VentanaGraficoOcupacion
-                        VentanaGraficoOcupacion(self.root, self.simulador)
-                except Exception as e:
-                    print(f"⚠️ No se pudo abrir la ventana del gráfico: {e}")
+                self.actualizar_interfaz(forzar=True)
+                self._anunciar_fin_simulacion("🏁 Simulación terminada", ruta_excel)
             except tk.TclError:
                 pass
     
@@ -552,50 +739,56 @@ class InterfazSimulacion:
         """Maneja cuando la simulación termina naturalmente"""
         self.simulacion_activa = False
         
-        if self.ventana_cerrada or not self.root.winfo_exists():
+        if self.ventana_cerrada:
             return
         
         try:
             self.panel_control.actualizar_estado("COMPLETADA", self.simulador.tiempo_actual)
             # Bloquear botones de iniciar, pausar, terminar y adelantar
             self.panel_control.bloquear_botones_simulacion_terminada()
+            # Cuadro y estadísticas finales (el último paso pudo caer dentro del intervalo de refresco)
+            self.actualizar_visualizacion()
             self.actualizar_estadisticas()
             
             # Generar archivo Excel con resultados
             ruta_excel = self.simulador.generar_resultados_manual()
             
-            mensaje = "¡La simulación ha terminado! Puedes:\n\n"
-            mensaje += "• Hacer clic en 'NUEVA' para crear una nueva simulación\n"
-            mensaje += "• Hacer clic en 'REINICIAR' para repetir la misma simulación\n"
-            mensaje += "• Modificar parámetros y crear una nueva simulación\n\n"
-            if ruta_excel:
-                nombre_archivo = os.path.basename(ruta_excel)
-                mensaje += f"📊 Archivo Excel generado:\n{nombre_archivo}"
-            elif self.simulador.excel_generado and self.simulador.ruta_excel_generado:
-                nombre_archivo = os.path.basename(self.simulador.ruta_excel_generado)
-                mensaje += f"📊 Archivo Excel generado automáticamente:\n{nombre_archivo}"
-            else:
-                mensaje += "⚠️ No se pudo generar el archivo Excel"
-            
-            # Mostrar modal primero
-            messagebox.showinfo("Simulación Completada", mensaje)
-            
-            # Después de aceptar el modal, abrir ventana del gráfico
-            try:
-                if hasattr(self.simulador, 'eventos_arcos') and self.simulador.eventos_arcos:
-                    from ..panels.ventana_grafico_ocupacion import VentanaGraficoOcupacion
-                    VentanaGraficoOcupacion(self.root, self.simulador)
-            except Exception as e:
-                print(f"⚠️ No se pudo abrir la ventana del gráfico: {e}")
+            # Avisar cuando la interfaz ya refleje el estado final
+            self.root.after_idle(self._anunciar_fin_simulacion, "✅ Simulación completada", ruta_excel)
         except tk.TclError:
             pass
     
+    def _anunciar_fin_simulacion(self, titulo: str, ruta_excel):
+        """Avisa el fin de la simulación en la barra de estado y abre el gráfico de ocupación"""
+        if self.ventana_cerrada:
+            return
+        
+        estilo = 'Success.TLabel'
+        if ruta_excel:
+            detalle = f"📊 Excel generado: {os.path.basename(ruta_excel)}"
+        elif self.simulador.excel_generado and self.simulador.ruta_excel_generado:
+            detalle = f"📊 Excel generado automáticamente: {os.path.basename(self.simulador.ruta_excel_generado)}"
+        else:
+            detalle = "⚠️ No se pudo generar el archivo Excel"
+            estilo = 'Warning.TLabel'
+        self.mostrar_aviso(f"{titulo} · {detalle}", self.DURACION_AVISO_FIN_MS, estilo)
+        
+        try:
+            if self.simulador.eventos_arcos:
+                from ..panels.ventana_grafico_ocupacion import VentanaGraficoOcupacion
+                VentanaGraficoOcupacion(self.root, self.simulador)
+        except Exception as e:
+            print(f"⚠️ No se pudo abrir la ventana del gráfico: {e}")
+    
     def adelantar_simulacion(self):
         """Adelanta la simulación varios pasos"""
-        for _ in range(10):  # Adelantar 10 pasos
-            if not self.simulador.ejecutar_paso():
-                break
-        self.actualizar_interfaz()
+        # Adelantar 10 pasos en un solo lote dentro del simulador
+        sigue_ejecutando = self.simulador.ejecutar_n_pasos(10)
+        self.actualizar_interfaz(forzar=True)  # Mostrar siempre el resultado del salto
+        
+        # El salto pudo alcanzar el final de la simulación
+        if not sigue_ejecutando and self.simulador.estado == "completada":
+            self.simulacion_terminada()
     
     def reiniciar_simulacion(self):
         """Reinicia la simulación actual con los mismos parámetros"""
@@ -603,20 +796,22 @@ class InterfazSimulacion:
             # Reinicializar el simulador actual
             self.simulador.inicializar_simulacion()
             
-            # Resetear estado
-            self.simulacion_activa = False
-            self.panel_control.actualizar_estado("LISTO", 0.0)
-            
-            # Actualizar visualización
-            self.actualizar_visualizacion()
-            self.actualizar_estadisticas()
-            
-            # Resetear botón de pausa
-            self.panel_control.resetear_boton_pausa()
-            # Desbloquear todos los botones para reiniciar simulación
-            self.panel_control.desbloquear_botones_simulacion()
+            # Resetear estado y paneles con un único redibujado al final
+            with self.panel_visualizacion.suspender_dibujado():
+                self.simulacion_activa = False
+                self.panel_control.actualizar_estado("LISTO", 0.0)
+                
+                # Actualizar visualización
+                self.actualizar_visualizacion()
+                self.actualizar_estadisticas()
+                
+                # Resetear botón de pausa
+                self.panel_control.resetear_boton_pausa()
+                # Desbloquear todos los botones para reiniciar simulación
+                self.panel_control.desbloquear_botones_simulacion()
+            self.root.update_idletasks()
             
-            messagebox.showinfo("Simulación Reiniciada", "La simulación ha sido reiniciada exitosamente!")
+            self.mostrar_aviso("🔄 Simulación reiniciada")
             
         except Exception as e:
             messagebox.showerror("Error", f"Error al reiniciar la simulación: {str(e)}")
@@ -637,6 +832,13 @@ class InterfazSimulacion:
     
     def actualizar_estadisticas(self):
         """Actualiza las estadísticas mostradas con validación mejorada"""
+        # Si nada cambió desde la última llamada, no recalcular ni redibujar
+        # (el entorno SimPy se recrea en cada inicialización: su id distingue simulaciones)
+        firma = (id(self.simulador.env), self.simulador.estado,
+                 self.simulador.tiempo_actual, self.simulador.ciclistas_registrados)
+        if firma == self._firma_estadisticas:
+            return
+        
         try:
             # Obtener estadísticas del simulador
             stats = self.simulador.obtener_estadisticas()
@@ -646,16 +848,15 @@ class InterfazSimulacion:
                 print("Advertencia: El simulador no retorno estadisticas")
                 stats = {}
             
-            # Agregar información adicional del estado actual
-            estado_actual = self.simulador.obtener_estado_actual()
-            stats['estado_simulacion'] = estado_actual.get('estado', 'detenido')
-            stats['tiempo_actual'] = estado_actual.get('tiempo_actual', 0)
+            # Agregar información adicional del estado actual (lectura directa, sin
+            # copiar coordenadas/colores como hace obtener_estado_actual)
+            stats['estado_simulacion'] = self.simulador.estado or 'detenido'
+            stats['tiempo_actual'] = self.simulador.tiempo_actual or 0
             
             # Agregar información del grafo si está disponible
             if self.grafo_actual:
                 stats['grafo_cargado'] = True
-                stats['grafo_nodos'] = len(self.grafo_actual.nodes())
-                stats['grafo_arcos'] = len(self.grafo_actual.edges())
+                stats['grafo_nodos'], stats['grafo_arcos'] = self._conteo_grafo
                 stats['usando_grafo_real'] = True
             else:
                 stats['grafo_cargado'] = False
@@ -663,6 +864,7 @@ class InterfazSimulacion:
             
             # Actualizar el panel de estadísticas
             self.panel_estadisticas.actualizar_estadisticas(stats)
+            self._firma_estadisticas = firma
             
         except Exception as e:
             print(f"Error actualizando estadisticas: {e}")
@@ -677,10 +879,42 @@ class InterfazSimulacion:
         """Aplica una distribución a un nodo específico"""
         self.simulador.actualizar_distribucion_nodo(nodo_id, tipo, parametros)
     
+    @staticmethod
+    def _indexar_perfiles(perfiles_df) -> Dict:
+        """Construye una sola vez el índice PERFILES -> etiqueta de fila del DataFrame"""
+        if perfiles_df is None or 'PERFILES' not in perfiles_df.columns:
+            return {}
+        return dict(zip(perfiles_df['PERFILES'].tolist(), perfiles_df.index))
+    
+    def _aplicar_cambios_perfiles(self):
+        """Reconfigura el simulador y el panel de perfiles tras editar perfiles_df"""
+        if self.grafo_actual and self.pos_grafo_actual:
+            self.simulador.configurar_grafo(
+                self.grafo_actual, self.pos_grafo_actual, 
+                self.perfiles_df, self.rutas_df, self.simulador.nombre_grafo_actual
+            )
+        
+        atributos_perfiles_disponibles = self._obtener_atributos_perfiles_disponibles()
+        self.panel_distribuciones.actualizar_panel_perfiles(self.perfiles_df, atributos_perfiles_disponibles)
+    
     def actualizar_perfil_ciclista(self, perfil_id: int, pesos_vars: Dict):
-        """Actualiza un perfil de ciclista"""
-        # Esta funcionalidad se implementaría aquí
-        print(f"Actualizando perfil {perfil_id} con pesos: {pesos_vars}")
+        """Actualiza los pesos de un perfil de ciclista"""
+        try:
+            fila = self._fila_por_perfil.get(perfil_id)
+            if self.perfiles_df is None or fila is None or not pesos_vars:
+                print(f"⚠️ Perfil {perfil_id} no encontrado para actualizar")
+                return
+            
+            # Una sola escritura de todas las columnas de la fila (sin recorrer el DataFrame)
+            columnas = list(pesos_vars.keys())
+            self.perfiles_df.loc[fila, columnas] = [var.get() for var in pesos_vars.values()]
+            
+            self._aplicar_cambios_perfiles()
+            print(f"✅ Perfil {perfil_id} actualizado: {', '.join(columnas)}")
+            
+        except Exception as e:
+            print(f"❌ Error actualizando perfil {perfil_id}: {e}")
+            messagebox.showerror("Error", f"Error al actualizar perfil: {str(e)}")
     
     def actualizar_probabilidades_perfiles(self, prob_vars: Dict):
         """Actualiza las probabilidades de selección de perfiles"""
@@ -688,21 +922,13 @@ class InterfazSimulacion:
             # Actualizar el DataFrame de perfiles
             if self.perfiles_df is not None:
                 for perfil_id, var in prob_vars.items():
-                    # Encontrar la fila correspondiente al perfil
-                    mask = self.perfiles_df['PERFILES'] == perfil_id
-                    if mask.any():
-                        self.perfiles_df.loc[mask, 'PROBABILIDAD'] = var.get()
-                
-                # Reconfigurar el simulador con las nuevas probabilidades
-                if self.grafo_actual and self.pos_grafo_actual:
-                    self.simulador.configurar_grafo(
-                        self.grafo_actual, self.pos_grafo_actual, 
-                        self.perfiles_df, self.rutas_df, self.nombre_grafo_actual
-                    )
+                    # Fila correspondiente al perfil desde el índice precalculado
+                    fila = self._fila_por_perfil.get(perfil_id)
+                    if fila is not None:
+                        self.perfiles_df.at[fila, 'PROBABILIDAD'] = var.get()
                 
-                # Actualizar el panel de distribuciones
-                atributos_perfiles_disponibles = self._obtener_atributos_perfiles_disponibles()
-                self.panel_distribuciones.actualizar_panel_perfiles(self.perfiles_df, atributos_perfiles_disponibles)
+                # Reconfigurar el simulador y el panel con las nuevas probabilidades
+                self._aplicar_cambios_perfiles()
                 
                 print(f"✅ Probabilidades de perfiles actualizadas: {prob_vars}")
             else:
@@ -729,9 +955,8 @@ class InterfazSimulacion:
             if self.simulador:
                 self.simulador.detener_simulacion()
         
-        # Esperar a que el hilo termine
-        if self.hilo_simulacion and self.hilo_simulacion.is_alive():
-            self.hilo_simulacion.join(timeout=1.0)
+        # Cancelar la tarea asyncio o el paso programado de simulación
+        self._detener_bucle_simulacion()
         
         # Destruir la ventana
         self.root.destroy()
@@ -807,9 +1032,8 @@ class InterfazSimulacion:
             # Ajustar pesos de paneles según el tamaño
             if width < 1000:  # Pantalla pequeña
                 # En pantallas pequeñas, dar más espacio a visualización
-                if hasattr(self, 'paned_main'):
-                    # Ajustar pesos dinámicamente: control, visualización, distribuciones
-                    self._ajustar_pesos_paneles(1, 3, 1)
+                # Ajustar pesos dinámicamente: control, visualización, distribuciones
+                self._ajustar_pesos_paneles(1, 3, 1)
             elif width < 1400:  # Pantalla mediana
                 self._ajustar_pesos_paneles(1, 2, 1)
             else:  # Pantalla grande
@@ -825,7 +1049,7 @@ class InterfazSimulacion:
     def _ajustar_pesos_paneles(self, peso_control, peso_visualizacion, peso_distribuciones):
         """Ajusta los pesos de los paneles en el PanedWindow"""
         try:
-            if hasattr(self, 'paned_main'):
+            if self.paned_main is not None:
                 # Obtener paneles actuales
                 paneles = self.paned_main.panes()
                 
@@ -845,7 +1069,7 @@ def main():
     """Función principal para ejecutar la interfaz"""
     root = tk.Tk()
     app = InterfazSimulacion(root)
-    root.mainloop()
+    app.ejecutar()
 
 
 if __name__ == "__main__":
@@ -23,6 +23,21 @@ class PanelControl:
         self.vel_min_var = tk.DoubleVar(value=10.0)
         self.vel_max_var = tk.DoubleVar(value=15.0)
         self.duracion_var = tk.DoubleVar(value=300.0)  # Duración por defecto: 300 segundos
+        self.tiempo_var = tk.StringVar(value="0.0s")
+        
+        # Últimos textos mostrados de estado y tiempo (evita .config redundantes)
+        self._ultimo_estado = None
+        self._ultimo_tiempo = None
+        
+        # Referencia directa al botón de pausa y su estado (se asignan al crearlo)
+        self.boton_pausa = None
+        self._pausado = False
+        
+        # Botones de control por nombre (se llenan al crearlos)
+        self.botones_control = {}
+        
+        # Spinboxes y botones que habilitar_controles activa o desactiva (se registran al crearlos)
+        self._controles_habilitables = []
         
         # Variables para scroll
         self.canvas = None
@@ -108,36 +123,7 @@ class PanelControl:
     
     def _bind_mousewheel(self):
         """Vincula el scroll del mouse al canvas"""
-        def _on_mousewheel(event):
-            # Solo procesar si el mouse está sobre el canvas o el frame scrollable
-            widget = event.widget
-            if widget == self.canvas or widget == self.scrollable_frame or widget.master == self.canvas:
-                # Windows y MacOS
-                if event.delta:
-                    self.canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
-                # Linux
-                elif event.num == 4:
-                    self.canvas.yview_scroll(-1, "units")
-                elif event.num == 5:
-                    self.canvas.yview_scroll(1, "units")
-        
-        def _on_enter(event):
-            # Cuando el mouse entra al canvas, vincular eventos
-            self.canvas.bind_all("<MouseWheel>", _on_mousewheel)
-            self.canvas.bind_all("<Button-4>", _on_mousewheel)
-            self.canvas.bind_all("<Button-5>", _on_mousewheel)
-        
-        def _on_leave(event):
-            # Cuando el mouse sale del canvas, desvincular eventos
-            self.canvas.unbind_all("<MouseWheel>")
-            self.canvas.unbind_all("<Button-4>")
-            self.canvas.unbind_all("<Button-5>")
-        
-        # Vincular eventos de entrada y salida del canvas
-        self.canvas.bind("<Enter>", _on_enter)
-        self.canvas.bind("<Leave>", _on_leave)
-        self.scrollable_frame.bind("<Enter>", _on_enter)
-        self.scrollable_frame.bind("<Leave>", _on_leave)
+        EstiloUtils.vincular_rueda_mouse(self.canvas, self.scrollable_frame)
     
     def _crear_seccion_velocidades(self):
         """Crea la sección de configuración de velocidades"""
@@ -154,25 +140,29 @@ class PanelControl:
         
         # Velocidad mínima
         ttk.Label(vel_frame, text="Velocidad Mínima (m/s):", 
-                 font=EstiloUtils.FUENTES['normal']).grid(row=0, column=0, sticky=tk.W, pady=5)
+                 font=EstiloUtils.obtener_fuente('normal')).grid(row=0, column=0, sticky=tk.W, pady=5)
         vel_min_spin = ttk.Spinbox(vel_frame, from_=1.0, to=20.0, increment=0.5, 
                                   textvariable=self.vel_min_var, width=10)
         vel_min_spin.grid(row=0, column=1, sticky=tk.W, pady=5, padx=(10, 0))
+        self._controles_habilitables.append(vel_min_spin)
         
         # Velocidad máxima
         ttk.Label(vel_frame, text="Velocidad Máxima (m/s):", 
-                 font=EstiloUtils.FUENTES['normal']).grid(row=1, column=0, sticky=tk.W, pady=5)
+                 font=EstiloUtils.obtener_fuente('normal')).grid(row=1, column=0, sticky=tk.W, pady=5)
         vel_max_spin = ttk.Spinbox(vel_frame, from_=1.0, to=30.0, increment=0.5, 
                                   textvariable=self.vel_max_var, width=10)
         vel_max_spin.grid(row=1, column=1, sticky=tk.W, pady=5, padx=(10, 0))
+        self._controles_habilitables.append(vel_max_spin)
         
         # Botón para aplicar cambios
-        EstiloUtils.crear_button_con_estilo(
+        btn_aplicar = EstiloUtils.crear_button_con_estilo(
             vel_frame, 
             "✅ Aplicar Velocidades",
             'Accent.TButton',
             command=self._aplicar_velocidades
-        ).grid(row=2, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=10)
+        )
+        btn_aplicar.grid(row=2, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=10)
+        self._controles_habilitables.append(btn_aplicar)
     
     def _crear_seccion_duracion(self):
         """Crea la sección de configuración de duración de simulación"""
@@ -189,25 +179,28 @@ class PanelControl:
         
         # Duración de simulación
         ttk.Label(duracion_frame, text="Duración (segundos):", 
-                 font=EstiloUtils.FUENTES['normal']).grid(row=0, column=0, sticky=tk.W, pady=5)
+                 font=EstiloUtils.obtener_fuente('normal')).grid(row=0, column=0, sticky=tk.W, pady=5)
         duracion_spin = ttk.Spinbox(duracion_frame, from_=60.0, to=1800.0, increment=30.0, 
                                    textvariable=self.duracion_var, width=10)
         duracion_spin.grid(row=0, column=1, sticky=tk.W, pady=5, padx=(10, 0))
+        self._controles_habilitables.append(duracion_spin)
         
         # Etiqueta informativa con límite máximo
         info_label = ttk.Label(duracion_frame, 
                               text="(Mín: 60s, Máx: 1800s / 30 min)", 
-                              font=EstiloUtils.FUENTES['pequeno'],
+                              font=EstiloUtils.obtener_fuente('pequeno'),
                               foreground='gray')
         info_label.grid(row=1, column=0, columnspan=2, sticky=tk.W, pady=(0, 5))
         
         # Botón para aplicar cambios
-        EstiloUtils.crear_button_con_estilo(
+        btn_aplicar = EstiloUtils.crear_button_con_estilo(
             duracion_frame, 
             "✅ Aplicar Duración",
             'Accent.TButton',
             command=self._aplicar_duracion
-        ).grid(row=2, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=10)
+        )
+        btn_aplicar.grid(row=2, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=10)
+        self._controles_habilitables.append(btn_aplicar)
     
     def _crear_seccion_grafo(self):
         """Crea la sección de información del grafo"""
@@ -227,12 +220,14 @@ class PanelControl:
         self.info_grafo_label.pack(anchor=tk.W, pady=2)
         
         # Botón para cargar grafo
-        EstiloUtils.crear_button_con_estilo(
+        btn_cargar = EstiloUtils.crear_button_con_estilo(
             self.scrollable_frame,
             "📂 CARGAR GRAFO",
             'TButton',
             command=self._cargar_grafo
-        ).pack(fill=tk.X, pady=5)
+        )
+        btn_cargar.pack(fill=tk.X, pady=5)
+        self._controles_habilitables.append(btn_cargar)
     
     def _crear_seccion_control_simulacion(self):
         """Crea la sección de control de simulación"""
@@ -261,9 +256,6 @@ class PanelControl:
             ("🔄 REINICIAR", 'Accent.TButton', self._reiniciar_simulacion, 3, 0, 2, 'reiniciar')
         ]
         
-        # Diccionario para almacenar referencias a los botones
-        self.botones_control = {}
-        
         for texto, estilo, comando, fila, col, colspan, nombre in botones_config:
             btn = EstiloUtils.crear_button_con_estilo(
                 control_frame, texto, estilo, command=comando
@@ -272,6 +264,9 @@ class PanelControl:
                     sticky=(tk.W, tk.E), pady=2, padx=2)
             # Guardar referencia al botón
             self.botones_control[nombre] = btn
+            self._controles_habilitables.append(btn)
+        
+        self.boton_pausa = self.botones_control['pausar']
     
     def _crear_seccion_estado(self):
         """Crea la sección de estado de la simulación"""
@@ -288,7 +283,7 @@ class PanelControl:
         
         # Estado de la simulación
         ttk.Label(estado_frame, text="Estado:", 
-                 font=EstiloUtils.FUENTES['normal']).grid(row=0, column=0, sticky=tk.W, pady=2)
+                 font=EstiloUtils.obtener_fuente('normal')).grid(row=0, column=0, sticky=tk.W, pady=2)
         self.estado_label = EstiloUtils.crear_label_con_estilo(
             estado_frame, "DETENIDO", 'Danger.TLabel'
         )
@@ -296,9 +291,9 @@ class PanelControl:
         
         # Tiempo actual
         ttk.Label(estado_frame, text="Tiempo:", 
-                 font=EstiloUtils.FUENTES['normal']).grid(row=1, column=0, sticky=tk.W, pady=2)
+                 font=EstiloUtils.obtener_fuente('normal')).grid(row=1, column=0, sticky=tk.W, pady=2)
         self.tiempo_label = EstiloUtils.crear_label_con_estilo(
-            estado_frame, "0.0s", 'Info.TLabel'
+            estado_frame, "0.0s", 'Info.TLabel', textvariable=self.tiempo_var
         )
         self.tiempo_label.grid(row=1, column=1, sticky=tk.W, pady=2, padx=(5, 0))
     
@@ -416,12 +411,18 @@ class PanelControl:
     
     def actualizar_estado(self, estado: str, tiempo: float):
         """Actualiza el estado y tiempo de la simulación"""
-        # Actualizar estado con color correspondiente
-        color = EstiloUtils.obtener_color_estado(estado)
-        icono = EstiloUtils.obtener_icono_estado(estado)
-        
-        self.estado_label.config(text=f"{icono} {estado.upper()}", foreground=color)
-        self.tiempo_label.config(text=f"{tiempo:.1f}s")
+        # Actualizar estado con color correspondiente solo si cambió
+        if estado != self._ultimo_estado:
+            estilo = EstiloUtils.obtener_estilo_estado(estado)
+            icono = EstiloUtils.obtener_icono_estado(estado)
+            self.estado_label.config(text=f"{icono} {estado.upper()}", style=estilo)
+            self._ultimo_estado = estado
+        
+        # El tiempo se compara ya redondeado a la décima que se muestra
+        texto_tiempo = f"{tiempo:.1f}s"
+        if texto_tiempo != self._ultimo_tiempo:
+            self.tiempo_var.set(texto_tiempo)
+            self._ultimo_tiempo = texto_tiempo
     
     def obtener_velocidades(self) -> tuple:
         """Retorna las velocidades configuradas"""
@@ -449,30 +450,24 @@ class PanelControl:
         """Habilita o deshabilita los controles del panel"""
         estado = 'normal' if habilitado else 'disabled'
         
-        # Habilitar/deshabilitar spinboxes y botones en el frame scrollable
-        def _habilitar_widgets(widget):
-            if isinstance(widget, ttk.Spinbox):
-                widget.config(state=estado)
-            elif isinstance(widget, ttk.Button):
-                widget.config(state=estado)
-            elif isinstance(widget, tk.Widget):
-                for child in widget.winfo_children():
-                    _habilitar_widgets(child)
+        # Referencias guardadas al crear el panel: sin recorrer el árbol de widgets
+        for control in self._controles_habilitables:
+            control.config(state=estado)
+    
+    def establecer_boton_pausa(self, pausado: bool):
+        """Muestra PAUSAR o REANUDAR en el botón de pausa según el estado"""
+        if self.boton_pausa is None or pausado == self._pausado:
+            return
         
-        if self.scrollable_frame:
-            _habilitar_widgets(self.scrollable_frame)
+        if pausado:
+            self.boton_pausa.configure(text="▶️ REANUDAR", style='Success.TButton')
+        else:
+            self.boton_pausa.configure(text="⏸️ PAUSAR", style='Warning.TButton')
+        self._pausado = pausado
     
     def resetear_boton_pausa(self):
         """Resetea el botón de pausa al estado original"""
-        def _buscar_boton_pausa(widget):
-            if isinstance(widget, ttk.Button) and "REANUDAR" in widget.cget("text"):
-                widget.configure(text="⏸️ PAUSAR", style='Warning.TButton')
-            elif isinstance(widget, tk.Widget):
-                for child in widget.winfo_children():
-                    _buscar_boton_pausa(child)
-        
-        if self.scrollable_frame:
-            _buscar_boton_pausa(self.scrollable_frame)
+        self.establecer_boton_pausa(False)
     
     def obtener_estado_panel(self) -> Dict[str, Any]:
         """Retorna el estado actual del panel"""
@@ -482,27 +477,25 @@ class PanelControl:
             'duracion_simulacion': self.duracion_var.get(),
             'info_grafo': self.info_grafo_label.cget('text'),
             'estado_simulacion': self.estado_label.cget('text'),
-            'tiempo_actual': self.tiempo_label.cget('text')
+            'tiempo_actual': self.tiempo_var.get()
         }
     
     def bloquear_botones_simulacion_terminada(self):
         """Bloquea los botones de iniciar, pausar y adelantar cuando la simulación termina.
         Solo deja habilitados los botones de nueva y reiniciar."""
-        if hasattr(self, 'botones_control'):
-            # Bloquear: iniciar, pausar, terminar, adelantar
-            botones_bloqueados = ['iniciar', 'pausar', 'terminar', 'adelantar']
-            for nombre in botones_bloqueados:
-                if nombre in self.botones_control:
-                    self.botones_control[nombre].config(state='disabled')
-            
-            # Mantener habilitados: nueva y reiniciar
-            botones_habilitados = ['nueva', 'reiniciar']
-            for nombre in botones_habilitados:
-                if nombre in self.botones_control:
-                    self.botones_control[nombre].config(state='normal')
+        # Bloquear: iniciar, pausar, terminar, adelantar
+        botones_bloqueados = ['iniciar', 'pausar', 'terminar', 'adelantar']
+        for nombre in botones_bloqueados:
+            if nombre in self.botones_control:
+                self.botones_control[nombre].config(state='disabled')
+        
+        # Mantener habilitados: nueva y reiniciar
+        botones_habilitados = ['nueva', 'reiniciar']
+        for nombre in botones_habilitados:
+            if nombre in self.botones_control:
+                self.botones_control[nombre].config(state='normal')
     
     def desbloquear_botones_simulacion(self):
         """Desbloquea todos los botones cuando se inicia una nueva simulación"""
-        if hasattr(self, 'botones_control'):
-            for nombre, boton in self.botones_control.items():
-                boton.config(state='normal')
+        for boton in self.botones_control.values():
+            boton.config(state='normal')
@@ -7,8 +7,10 @@ para cada nodo de la red de ciclorutas.
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-from typing import Dict, List, Any, Callable, Optional
-import pandas as pd
+from typing import TYPE_CHECKING, Dict, List, Any, Callable, Optional
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 from ..utils.estilo_utils import EstiloUtils
 
@@ -16,15 +18,78 @@ from ..utils.estilo_utils import EstiloUtils
 class PanelDistribuciones:
     """Panel de configuración de distribuciones por nodo"""
     
+    # Parámetros visibles según el tipo de distribución
+    PARAMETROS_POR_TIPO = {
+        'exponencial': ['lambda'],
+        'normal': ['media', 'desviacion'],
+        'lognormal': ['mu', 'sigma'],
+        'gamma': ['forma', 'escala'],
+        'weibull': ['forma', 'escala']
+    }
+    
+    ETIQUETAS_PARAMETROS = {
+        'lambda': "λ (Lambda):",
+        'media': "Media (μ):",
+        'desviacion': "Desv. Est. (σ):",
+        'mu': "μ (Mu):",
+        'sigma': "σ (Sigma):",
+        'forma': "Forma (α):",
+        'escala': "Escala (β):"
+    }
+    
+    VALORES_POR_DEFECTO = {
+        'lambda': 0.5,
+        'media': 3.0,
+        'desviacion': 1.0,
+        'mu': 0.0,
+        'sigma': 1.0,
+        'forma': 2.0,
+        'escala': 1.0
+    }
+    
+    # Factor para llevar cada unidad de tiempo de la interfaz a segundos
+    FACTORES_A_SEGUNDOS = {
+        'segundos': 1.0,
+        'minutos': 60.0,
+        'horas': 3600.0
+    }
+    
+    # Prefijos de la etiqueta de descripción del nodo (normal y tras aplicar)
+    PREFIJO_DESCRIPCION = "Actual: "
+    PREFIJO_APLICADA = "✅ Aplicada: "
+    
+    # Plantilla de la descripción mostrada por tipo (campos: parámetros de la interfaz y unidades)
+    PLANTILLAS_DESCRIPCION = {
+        'exponencial': "Exponencial (λ={lambda:.3f}/{unidades})",
+        'normal': "Normal (μ={media:.3f}, σ={desviacion:.3f} {unidades})",
+        'lognormal': "Log-Normal (μ={mu:.3f}, σ={sigma:.3f})",
+        'gamma': "Gamma (α={forma:.3f}, β={escala:.3f} {unidades})",
+        'weibull': "Weibull (c={forma:.3f}, λ={escala:.3f} {unidades})"
+    }
+    
+    # Pesos de perfil editables: atributo interno -> (columna Excel, color, título mostrado)
+    ATRIBUTOS_PESOS = {
+        'distancia': ('DISTANCIA', '#FF6B6B', 'Distancia'),
+        'seguridad': ('SEGURIDAD', '#4ECDC4', 'Seguridad'),
+        'luminosidad': ('LUMINOSIDAD', '#45B7D1', 'Luminosidad'),
+        'inclinacion': ('INCLINACION', '#96CEB4', 'Inclinacion')
+    }
+    
     def __init__(self, parent, callbacks: Dict[str, Callable]):
         self.parent = parent
         self.callbacks = callbacks
         
         # Variables de control
         self.grafo_actual = None
+        self._nodos_cache = []  # Lista de nodos del grafo actual (se arma una vez por carga)
+        self._firma_distribuciones = None  # Contenido mostrado en la lista de nodos
         self.perfiles_df = None
-        self.controles_distribuciones = {}
+        self.controles_distribuciones = {}  # Dict[nodo_id, configuración mostrada en la lista]
         self.controles_perfiles = {}
+        self._nodo_por_item = {}
+        self._item_por_nodo = {}
+        self.nodo_seleccionado = None
+        self._id_fin_confirmacion = None  # after() que devuelve la descripción a su estilo normal
         
         # Crear el panel
         self.crear_panel()
@@ -59,36 +124,182 @@ class PanelDistribuciones:
         tab_nodos = ttk.Frame(self.notebook_distribuciones)
         self.notebook_distribuciones.add(tab_nodos, text="📍 NODOS")
         
-        # Frame para scroll
-        canvas = tk.Canvas(tab_nodos, highlightthickness=0)
-        scrollbar = ttk.Scrollbar(tab_nodos, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas)
+        # Mensaje inicial
+        self.mensaje_distribuciones = EstiloUtils.crear_label_con_estilo(
+            tab_nodos, 
+            "📂 Carga un grafo para configurar distribuciones de nodos",
+            'Info.TLabel'
+        )
+        self.mensaje_distribuciones.pack(pady=20)
         
-        # Configurar scroll
-        scrollable_frame.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
+        # Lista de nodos (Treeview virtualizado: solo las filas visibles consumen recursos)
+        frame_lista = EstiloUtils.crear_frame_con_estilo(tab_nodos)
+        frame_lista.pack(fill="both", expand=True)
         
-        # Empaquetar canvas y scrollbar
-        canvas.pack(side="left", fill="both", expand=True)
+        self.tree_nodos = ttk.Treeview(
+            frame_lista, 
+            columns=('tipo', 'unidades', 'descripcion'),
+            show='tree headings',
+            selectmode='browse',
+            height=8
+        )
+        self.tree_nodos.heading('#0', text='Nodo')
+        self.tree_nodos.heading('tipo', text='Tipo')
+        self.tree_nodos.heading('unidades', text='Unidades')
+        self.tree_nodos.heading('descripcion', text='Distribución actual')
+        self.tree_nodos.column('#0', width=70, stretch=False)
+        self.tree_nodos.column('tipo', width=90, stretch=False)
+        self.tree_nodos.column('unidades', width=70, stretch=False)
+        self.tree_nodos.column('descripcion', width=160, stretch=True)
+        
+        scrollbar = ttk.Scrollbar(frame_lista, orient="vertical", command=self.tree_nodos.yview)
+        self.tree_nodos.configure(yscrollcommand=scrollbar.set)
+        
+        self.tree_nodos.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
         
-        # Configurar scroll con mouse wheel
-        def _on_mousewheel(event):
-            canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        canvas.bind_all("<MouseWheel>", _on_mousewheel)
+        self.tree_nodos.bind('<<TreeviewSelect>>', self._on_seleccion_nodo)
+        self.tree_nodos.bind('<Double-1>', self._editar_nodo_seleccionado)
+        self.tree_nodos.bind('<Return>', self._editar_nodo_seleccionado)
         
-        # Mensaje inicial
-        self.mensaje_distribuciones = EstiloUtils.crear_label_con_estilo(
-            scrollable_frame, 
-            "📂 Carga un grafo para configurar distribuciones de nodos",
+        # Barra de edición compartida por todos los nodos
+        self._crear_barra_edicion_nodo(tab_nodos)
+    
+    def _crear_barra_edicion_nodo(self, parent):
+        """Crea la barra de edición única que opera sobre el nodo seleccionado en la lista"""
+        self.frame_edicion_nodo = EstiloUtils.crear_label_frame_con_estilo(
+            parent, 
+            "✏️ Nodo seleccionado: -"
+        )
+        self.frame_edicion_nodo.pack(fill=tk.X, pady=5, padx=5)
+        
+        # Variables compartidas de edición
+        self.vars_edicion_nodo = {
+            'tipo': tk.StringVar(value='exponencial'),
+            'unidades': tk.StringVar(value='segundos')
+        }
+        for parametro, valor in self.VALORES_POR_DEFECTO.items():
+            self.vars_edicion_nodo[parametro] = tk.DoubleVar(value=valor)
+        
+        # Selector de tipo de distribución
+        ttk.Label(self.frame_edicion_nodo, text="Tipo:", 
+                 font=EstiloUtils.obtener_fuente('normal')).grid(row=0, column=0, sticky=tk.W, pady=2)
+        ttk.Combobox(self.frame_edicion_nodo, textvariable=self.vars_edicion_nodo['tipo'], 
+                    values=list(self.PARAMETROS_POR_TIPO.keys()),
+                    state='readonly', width=12).grid(row=0, column=1, sticky=tk.W, pady=2, padx=(5, 0))
+        
+        # Selector de unidades de tiempo
+        ttk.Label(self.frame_edicion_nodo, text="Unidades:", 
+                 font=EstiloUtils.obtener_fuente('normal')).grid(row=0, column=2, sticky=tk.W, pady=2, padx=(10, 0))
+        ttk.Combobox(self.frame_edicion_nodo, textvariable=self.vars_edicion_nodo['unidades'],
+                    values=list(self.FACTORES_A_SEGUNDOS),
+                    state='readonly', width=10).grid(row=0, column=3, sticky=tk.W, pady=2, padx=(5, 0))
+        
+        # Controles de parámetros: un frame por tipo, todos apilados en la misma celda
+        # (se crean una sola vez; cambiar de tipo solo sube el frame correspondiente)
+        self.frames_parametros_nodo = {}
+        self.controles_parametros_nodo = {}  # tipo -> {parametro: spinbox}
+        for tipo, parametros in self.PARAMETROS_POR_TIPO.items():
+            frame_tipo = ttk.Frame(self.frame_edicion_nodo)
+            frame_tipo.grid(row=1, column=0, columnspan=4, sticky=tk.NSEW)
+            
+            spins = {}
+            for fila, parametro in enumerate(parametros):
+                ttk.Label(frame_tipo, text=self.ETIQUETAS_PARAMETROS[parametro], 
+                         font=EstiloUtils.obtener_fuente('normal')).grid(row=fila, column=0, sticky=tk.W, pady=2)
+                spins[parametro] = ttk.Spinbox(frame_tipo, textvariable=self.vars_edicion_nodo[parametro], width=10)
+                spins[parametro].grid(row=fila, column=1, sticky=tk.W, pady=2, padx=(5, 0))
+                # Los frames ocultos detrás del visible no deben recibir el foco con Tab
+                # (se restaura el valor por defecto al subir el frame)
+                self._takefocus_parametros = spins[parametro].cget('takefocus')
+                spins[parametro].configure(takefocus=0)
+            
+            self.frames_parametros_nodo[tipo] = frame_tipo
+            self.controles_parametros_nodo[tipo] = spins
+        
+        # Vincular cambio de tipo con actualización de parámetros (un único trace,
+        # agrupado en una tarea ociosa por ráfaga de escrituras)
+        self._tipo_parametros_visible = None
+        self._parametros_visibles_pendiente = None
+        self.vars_edicion_nodo['tipo'].trace_add('write', self._programar_parametros_visibles)
+        self._actualizar_parametros_visibles()
+        
+        # Botón para aplicar cambios al nodo seleccionado
+        self.btn_aplicar_nodo = EstiloUtils.crear_button_con_estilo(
+            self.frame_edicion_nodo, 
+            "✅ Aplicar", 
+            'Accent.TButton',
+            command=lambda: self._aplicar_distribucion_nodo(self.nodo_seleccionado)
+        )
+        self.btn_aplicar_nodo.grid(row=4, column=0, columnspan=2, pady=5)
+        self.btn_aplicar_nodo.config(state='disabled')
+        
+        # Descripción actual
+        self.desc_label_nodo = EstiloUtils.crear_label_con_estilo(
+            self.frame_edicion_nodo, 
+            self.PREFIJO_DESCRIPCION + "-", 
             'Info.TLabel'
         )
-        self.mensaje_distribuciones.pack(pady=20)
+        self.desc_label_nodo.grid(row=5, column=0, columnspan=4, pady=2, sticky=tk.W)
+    
+    def _programar_parametros_visibles(self, *args):
+        """Agenda una sola actualización de los parámetros visibles por ráfaga de cambios"""
+        if self._parametros_visibles_pendiente is None:
+            self._parametros_visibles_pendiente = self.frame_edicion_nodo.after_idle(
+                self._actualizar_parametros_visibles
+            )
+    
+    def _actualizar_parametros_visibles(self):
+        """Muestra solo los controles de parámetros del tipo de distribución elegido"""
+        self._parametros_visibles_pendiente = None
         
-        # Guardar referencias
-        self.canvas_distribuciones = canvas
-        self.frame_distribuciones = scrollable_frame
+        # Si el tipo no cambió (p. ej. al seleccionar otro nodo del mismo tipo) no hay nada que rehacer
+        tipo = self.vars_edicion_nodo['tipo'].get()
+        if tipo == self._tipo_parametros_visible:
+            return
+        
+        # Una sola llamada a Tk: el frame del tipo queda encima de los demás
+        frame_tipo = self.frames_parametros_nodo.get(tipo)
+        if frame_tipo is not None:
+            frame_tipo.tkraise()
+            
+            # Solo los controles del frame visible entran en el recorrido con Tab
+            for spin in self.controles_parametros_nodo.get(self._tipo_parametros_visible, {}).values():
+                spin.configure(takefocus=0)
+            for spin in self.controles_parametros_nodo[tipo].values():
+                spin.configure(takefocus=self._takefocus_parametros)
+            self._tipo_parametros_visible = tipo
+    
+    def _on_seleccion_nodo(self, event=None):
+        """Carga en la barra de edición la configuración del nodo seleccionado"""
+        seleccion = self.tree_nodos.selection()
+        if not seleccion or seleccion[0] not in self._nodo_por_item:
+            return
+        
+        nodo_id = self._nodo_por_item[seleccion[0]]
+        config = self.controles_distribuciones[nodo_id]
+        self.nodo_seleccionado = nodo_id
+        
+        self.vars_edicion_nodo['tipo'].set(config['tipo'])
+        self.vars_edicion_nodo['unidades'].set(config['unidades'])
+        for parametro, valor in self.VALORES_POR_DEFECTO.items():
+            self.vars_edicion_nodo[parametro].set(config['parametros'].get(parametro, valor))
+        
+        self.frame_edicion_nodo.config(text=f"✏️ Nodo seleccionado: {nodo_id}")
+        self._mostrar_descripcion_nodo(config['descripcion'])
+        self.btn_aplicar_nodo.config(state='normal')
+    
+    def _editar_nodo_seleccionado(self, event=None):
+        """Lleva el foco al primer parámetro del nodo seleccionado para editarlo"""
+        if self.nodo_seleccionado is None:
+            return
+        
+        tipo = self.vars_edicion_nodo['tipo'].get()
+        parametros = self.PARAMETROS_POR_TIPO.get(tipo, [])
+        if parametros:
+            spin = self.controles_parametros_nodo[tipo][parametros[0]]
+            spin.focus_set()
+            spin.selection_range(0, tk.END)
     
     def _crear_tab_perfiles(self):
         """Crea la pestaña de configuración de perfiles de ciclistas"""
@@ -101,8 +312,9 @@ class PanelDistribuciones:
         scrollbar_perfiles = ttk.Scrollbar(tab_perfiles, orient="vertical", command=canvas_perfiles.yview)
         scrollable_frame_perfiles = ttk.Frame(canvas_perfiles)
         
-        # Configurar scroll
-        scrollable_frame_perfiles.bind("<Configure>", lambda e: canvas_perfiles.configure(scrollregion=canvas_perfiles.bbox("all")))
+        # Configurar scroll (la región se recalcula una vez por ráfaga de <Configure>)
+        self._scroll_perfiles_pendiente = None
+        scrollable_frame_perfiles.bind("<Configure>", self._programar_scroll_perfiles)
         canvas_perfiles.create_window((0, 0), window=scrollable_frame_perfiles, anchor="nw")
         canvas_perfiles.configure(yscrollcommand=scrollbar_perfiles.set)
         
@@ -110,10 +322,8 @@ class PanelDistribuciones:
         canvas_perfiles.pack(side="left", fill="both", expand=True)
         scrollbar_perfiles.pack(side="right", fill="y")
         
-        # Configurar scroll con mouse wheel
-        def _on_mousewheel_perfiles(event):
-            canvas_perfiles.yview_scroll(int(-1*(event.delta/120)), "units")
-        canvas_perfiles.bind_all("<MouseWheel>", _on_mousewheel_perfiles)
+        # Configurar scroll con mouse wheel solo mientras el mouse está sobre la pestaña
+        EstiloUtils.vincular_rueda_mouse(canvas_perfiles, scrollable_frame_perfiles)
         
         # Mensaje inicial
         self.mensaje_perfiles = EstiloUtils.crear_label_con_estilo(
@@ -125,38 +335,68 @@ class PanelDistribuciones:
         
         # Guardar referencias
         self.canvas_perfiles = canvas_perfiles
+        self.scrollbar_perfiles = scrollbar_perfiles
         self.frame_perfiles = scrollable_frame_perfiles
     
+    def _programar_scroll_perfiles(self, event=None):
+        """Agrupa los eventos <Configure> y recalcula la región de scroll una sola vez"""
+        if self._scroll_perfiles_pendiente is not None:
+            self.canvas_perfiles.after_cancel(self._scroll_perfiles_pendiente)
+        self._scroll_perfiles_pendiente = self.canvas_perfiles.after(30, self._actualizar_scroll_perfiles)
+    
+    def _actualizar_scroll_perfiles(self):
+        """Actualiza la región de scroll de la pestaña de perfiles"""
+        self._scroll_perfiles_pendiente = None
+        self.canvas_perfiles.configure(scrollregion=self.canvas_perfiles.bbox("all"))
+    
     def actualizar_panel_distribuciones(self, grafo_actual, distribuciones_actuales: Dict[str, Dict]):
         """Actualiza el panel de distribuciones con los nodos del grafo"""
-        self.grafo_actual = grafo_actual
+        # Recorrer el grafo solo cuando cambia, no en cada refresco del panel
+        if grafo_actual is not self.grafo_actual or not self._nodos_cache:
+            self._nodos_cache = list(grafo_actual.nodes()) if grafo_actual else []
         
-        # Limpiar controles existentes
-        for widget in self.frame_distribuciones.winfo_children():
-            widget.destroy()
+        # Si ni el grafo ni las distribuciones cambiaron, la lista ya está al día
+        firma = self._calcular_firma_distribuciones(grafo_actual, distribuciones_actuales)
+        if firma == self._firma_distribuciones:
+            return
+        self._firma_distribuciones = firma
+        self.grafo_actual = grafo_actual
         
+        # Limpiar filas existentes
+        self.tree_nodos.delete(*self.tree_nodos.get_children())
         self.controles_distribuciones = {}
+        self._nodo_por_item = {}
+        self._item_por_nodo = {}
+        self.nodo_seleccionado = None
+        self.frame_edicion_nodo.config(text="✏️ Nodo seleccionado: -")
+        self._mostrar_descripcion_nodo("-")
+        self.btn_aplicar_nodo.config(state='disabled')
         
         if not grafo_actual:
             # Mostrar mensaje si no hay grafo
-            self.mensaje_distribuciones = EstiloUtils.crear_label_con_estilo(
-                self.frame_distribuciones, 
-                "📂 Carga un grafo para configurar distribuciones",
-                'Info.TLabel'
-            )
-            self.mensaje_distribuciones.pack(pady=20)
+            self.mensaje_distribuciones.config(text="📂 Carga un grafo para configurar distribuciones")
+            self.mensaje_distribuciones.pack(pady=20, before=self.tree_nodos.master)
             return
         
-        # Crear controles para cada nodo
-        for i, nodo_id in enumerate(grafo_actual.nodes()):
-            self._crear_controles_nodo(self.frame_distribuciones, nodo_id, i, 
-                                     distribuciones_actuales.get(nodo_id, {}))
+        self.mensaje_distribuciones.pack_forget()
         
-        # Actualizar el scroll
-        self.frame_distribuciones.update_idletasks()
-        self.canvas_distribuciones.configure(scrollregion=self.canvas_distribuciones.bbox("all"))
+        # Una fila por nodo
+        for nodo_id in self._nodos_cache:
+            self._crear_fila_nodo(nodo_id, distribuciones_actuales.get(nodo_id, {}))
+    
+    def _calcular_firma_distribuciones(self, grafo_actual, distribuciones_actuales: Dict[str, Dict]) -> tuple:
+        """Firma del contenido que muestra la lista: grafo y configuración de cada nodo"""
+        if not grafo_actual:
+            return (None,)
+        
+        filas = []
+        for nodo_id in self._nodos_cache:
+            config = distribuciones_actuales.get(nodo_id, {})
+            filas.append((nodo_id, config.get('tipo'), config.get('unidades'), config.get('descripcion'),
+                          tuple(sorted(config.get('parametros', {}).items()))))
+        return (id(grafo_actual), tuple(filas))
     
-    def actualizar_panel_perfiles(self, perfiles_df: Optional[pd.DataFrame], atributos_disponibles: List[str] = None):
+    def actualizar_panel_perfiles(self, perfiles_df: Optional['pd.DataFrame'], atributos_disponibles: List[str] = None):
         """Actualiza el panel de perfiles de ciclistas"""
         self.perfiles_df = perfiles_df
         self.atributos_disponibles = atributos_disponibles or []
@@ -177,194 +417,62 @@ class PanelDistribuciones:
             self.mensaje_perfiles.pack(pady=20)
             return
         
-        # Crear controles para cada perfil
-        for i, (_, perfil_data) in enumerate(perfiles_df.iterrows()):
-            self._crear_controles_perfil(self.frame_perfiles, perfil_data, i)
+        # Crear controles para cada perfil con el canvas desmapeado, para que Tk
+        # calcule la geometría una sola vez al final y no por cada widget
+        self.canvas_perfiles.pack_forget()
+        try:
+            # Todos los perfiles comparten columnas: los pesos a mostrar se calculan una vez
+            pesos_enumerados = tuple(enumerate(self._obtener_atributos_ui(perfiles_df.columns)))
+            
+            # Registros como dicts creados en bloque (iterrows crea una Series por fila)
+            for i, perfil_data in enumerate(perfiles_df.to_dict('records')):
+                self._crear_controles_perfil(self.frame_perfiles, perfil_data, i, pesos_enumerados)
+        finally:
+            self.canvas_perfiles.pack(side="left", fill="both", expand=True, before=self.scrollbar_perfiles)
         
-        # Actualizar el scroll
+        # Actualizar el scroll (una única pasada de tareas pendientes)
         self.frame_perfiles.update_idletasks()
         self.canvas_perfiles.configure(scrollregion=self.canvas_perfiles.bbox("all"))
     
-    def _crear_controles_nodo(self, parent, nodo_id: str, index: int, config_actual: Dict[str, Any]):
-        """Crea los controles para configurar la distribución de un nodo"""
-        # Frame para el nodo
-        nodo_frame = EstiloUtils.crear_label_frame_con_estilo(
-            parent, 
-            f"📍 Nodo: {nodo_id}"
-        )
-        nodo_frame.pack(fill=tk.X, pady=5, padx=5)
-        
-        # Variables para este nodo
-        tipo_var = tk.StringVar(value=config_actual.get('tipo', 'exponencial'))
-        unidades_var = tk.StringVar(value=config_actual.get('unidades', 'segundos'))
-        lambda_var = tk.DoubleVar(value=config_actual.get('parametros', {}).get('lambda', 0.5))
-        min_var = tk.DoubleVar(value=config_actual.get('parametros', {}).get('min', 1.0))
-        max_var = tk.DoubleVar(value=config_actual.get('parametros', {}).get('max', 5.0))
-        
-        # Variables para las nuevas distribuciones
-        media_var = tk.DoubleVar(value=config_actual.get('parametros', {}).get('media', 3.0))
-        desviacion_var = tk.DoubleVar(value=config_actual.get('parametros', {}).get('desviacion', 1.0))
-        mu_var = tk.DoubleVar(value=config_actual.get('parametros', {}).get('mu', 0.0))
-        sigma_var = tk.DoubleVar(value=config_actual.get('parametros', {}).get('sigma', 1.0))
-        forma_var = tk.DoubleVar(value=config_actual.get('parametros', {}).get('forma', 2.0))
-        escala_var = tk.DoubleVar(value=config_actual.get('parametros', {}).get('escala', 1.0))
-        
-        # Guardar referencias
-        self.controles_distribuciones[nodo_id] = {
-            'tipo': tipo_var,
-            'unidades': unidades_var,
-            'lambda': lambda_var,
-            'min': min_var,
-            'max': max_var,
-            'media': media_var,
-            'desviacion': desviacion_var,
-            'mu': mu_var,
-            'sigma': sigma_var,
-            'forma': forma_var,
-            'escala': escala_var
+    def _crear_fila_nodo(self, nodo_id: str, config_actual: Dict[str, Any]):
+        """Agrega la fila de un nodo a la lista y guarda su configuración"""
+        config = {
+            'tipo': config_actual.get('tipo', 'exponencial'),
+            'unidades': config_actual.get('unidades', 'segundos'),
+            'parametros': dict(config_actual.get('parametros', {})),
+            'descripcion': config_actual.get('descripcion', 'Exponencial (λ=0.50)')
         }
+        self.controles_distribuciones[nodo_id] = config
         
-        # Selector de tipo de distribución
-        ttk.Label(nodo_frame, text="Tipo:", 
-                 font=EstiloUtils.FUENTES['normal']).grid(row=0, column=0, sticky=tk.W, pady=2)
-        tipo_combo = ttk.Combobox(nodo_frame, textvariable=tipo_var, 
-                                 values=['exponencial', 'normal', 'lognormal', 'gamma', 'weibull'],
-                                 state='readonly', width=12)
-        tipo_combo.grid(row=0, column=1, sticky=tk.W, pady=2, padx=(5, 0))
-        
-        # Selector de unidades de tiempo
-        ttk.Label(nodo_frame, text="Unidades:", 
-                 font=EstiloUtils.FUENTES['normal']).grid(row=0, column=2, sticky=tk.W, pady=2, padx=(10, 0))
-        unidades_combo = ttk.Combobox(nodo_frame, textvariable=unidades_var,
-                                     values=['segundos', 'minutos', 'horas'],
-                                     state='readonly', width=10)
-        unidades_combo.grid(row=0, column=3, sticky=tk.W, pady=2, padx=(5, 0))
-        
-        # Función para actualizar parámetros según el tipo y unidades
-        def actualizar_parametros(*args):
-            tipo = tipo_var.get()
-            unidades = unidades_var.get()
-            
-            # Ocultar todos los controles primero
-            lambda_label.grid_remove()
-            lambda_spin.grid_remove()
-            min_label.grid_remove()
-            min_spin.grid_remove()
-            max_label.grid_remove()
-            max_spin.grid_remove()
-            media_label.grid_remove()
-            media_spin.grid_remove()
-            desviacion_label.grid_remove()
-            desviacion_spin.grid_remove()
-            mu_label.grid_remove()
-            mu_spin.grid_remove()
-            sigma_label.grid_remove()
-            sigma_spin.grid_remove()
-            forma_label.grid_remove()
-            forma_spin.grid_remove()
-            escala_label.grid_remove()
-            escala_spin.grid_remove()
-            
-            # Mostrar controles según el tipo
-            if tipo == 'exponencial':
-                # Mostrar solo Lambda
-                lambda_label.grid(row=1, column=0, sticky=tk.W, pady=2)
-                lambda_spin.grid(row=1, column=1, sticky=tk.W, pady=2, padx=(5, 0))
-            elif tipo == 'normal':
-                # Mostrar Media y Desviación
-                media_label.grid(row=1, column=0, sticky=tk.W, pady=2)
-                media_spin.grid(row=1, column=1, sticky=tk.W, pady=2, padx=(5, 0))
-                desviacion_label.grid(row=2, column=0, sticky=tk.W, pady=2)
-                desviacion_spin.grid(row=2, column=1, sticky=tk.W, pady=2, padx=(5, 0))
-            elif tipo == 'lognormal':
-                # Mostrar Mu y Sigma
-                mu_label.grid(row=1, column=0, sticky=tk.W, pady=2)
-                mu_spin.grid(row=1, column=1, sticky=tk.W, pady=2, padx=(5, 0))
-                sigma_label.grid(row=2, column=0, sticky=tk.W, pady=2)
-                sigma_spin.grid(row=2, column=1, sticky=tk.W, pady=2, padx=(5, 0))
-            elif tipo == 'gamma':
-                # Mostrar Forma y Escala
-                forma_label.grid(row=1, column=0, sticky=tk.W, pady=2)
-                forma_spin.grid(row=1, column=1, sticky=tk.W, pady=2, padx=(5, 0))
-                escala_label.grid(row=2, column=0, sticky=tk.W, pady=2)
-                escala_spin.grid(row=2, column=1, sticky=tk.W, pady=2, padx=(5, 0))
-            elif tipo == 'weibull':
-                # Mostrar Forma y Escala
-                forma_label.grid(row=1, column=0, sticky=tk.W, pady=2)
-                forma_spin.grid(row=1, column=1, sticky=tk.W, pady=2, padx=(5, 0))
-                escala_label.grid(row=2, column=0, sticky=tk.W, pady=2)
-                escala_spin.grid(row=2, column=1, sticky=tk.W, pady=2, padx=(5, 0))
-        
-        # Vincular cambio de tipo con actualización de parámetros
-        tipo_var.trace('w', actualizar_parametros)
-        unidades_var.trace('w', actualizar_parametros)
-        
-        # Crear controles de parámetros
-        lambda_label = ttk.Label(nodo_frame, text="λ (Lambda):", 
-                                font=EstiloUtils.FUENTES['normal'])
-        lambda_spin = ttk.Spinbox(nodo_frame, textvariable=lambda_var, width=10)
-        
-        min_label = ttk.Label(nodo_frame, text="Min (s):", 
-                             font=EstiloUtils.FUENTES['normal'])
-        min_spin = ttk.Spinbox(nodo_frame, textvariable=min_var, width=10)
-        
-        max_label = ttk.Label(nodo_frame, text="Max (s):", 
-                             font=EstiloUtils.FUENTES['normal'])
-        max_spin = ttk.Spinbox(nodo_frame, textvariable=max_var, width=10)
-        
-        # Controles para distribución normal
-        media_label = ttk.Label(nodo_frame, text="Media (μ):", 
-                               font=EstiloUtils.FUENTES['normal'])
-        media_spin = ttk.Spinbox(nodo_frame, textvariable=media_var, width=10)
-        
-        desviacion_label = ttk.Label(nodo_frame, text="Desv. Est. (σ):", 
-                                    font=EstiloUtils.FUENTES['normal'])
-        desviacion_spin = ttk.Spinbox(nodo_frame, textvariable=desviacion_var, width=10)
-        
-        # Controles para distribución log-normal
-        mu_label = ttk.Label(nodo_frame, text="μ (Mu):", 
-                            font=EstiloUtils.FUENTES['normal'])
-        mu_spin = ttk.Spinbox(nodo_frame, textvariable=mu_var, width=10)
-        
-        sigma_label = ttk.Label(nodo_frame, text="σ (Sigma):", 
-                               font=EstiloUtils.FUENTES['normal'])
-        sigma_spin = ttk.Spinbox(nodo_frame, textvariable=sigma_var, width=10)
-        
-        # Controles para distribución gamma
-        forma_label = ttk.Label(nodo_frame, text="Forma (α):", 
-                               font=EstiloUtils.FUENTES['normal'])
-        forma_spin = ttk.Spinbox(nodo_frame, textvariable=forma_var, width=10)
-        
-        escala_label = ttk.Label(nodo_frame, text="Escala (β):", 
-                                font=EstiloUtils.FUENTES['normal'])
-        escala_spin = ttk.Spinbox(nodo_frame, textvariable=escala_var, width=10)
-        
-        # Inicializar con parámetros por defecto
-        actualizar_parametros()
-        
-        # Botón para aplicar cambios
-        aplicar_btn = EstiloUtils.crear_button_con_estilo(
-            nodo_frame, 
-            "✅ Aplicar", 
-            'Accent.TButton',
-            command=lambda: self._aplicar_distribucion_nodo(nodo_id)
-        )
-        aplicar_btn.grid(row=4, column=0, columnspan=2, pady=5)
-        
-        # Descripción actual
-        descripcion = config_actual.get('descripcion', 'Exponencial (λ=0.50)')
-        desc_label = EstiloUtils.crear_label_con_estilo(
-            nodo_frame, 
-            f"Actual: {descripcion}", 
-            'Info.TLabel'
+        item = self.tree_nodos.insert(
+            '', 'end', 
+            text=f"📍 {nodo_id}",
+            values=(config['tipo'], config['unidades'], config['descripcion'])
         )
-        desc_label.grid(row=5, column=0, columnspan=2, pady=2)
+        self._nodo_por_item[item] = nodo_id
+        self._item_por_nodo[nodo_id] = item
+    
+    def _obtener_atributos_ui(self, perfil_data) -> List[tuple]:
+        """Lista (columna, color, título) de los pesos disponibles para un perfil
         
-        # Guardar referencia a la descripción para actualizarla
-        self.controles_distribuciones[nodo_id]['descripcion'] = desc_label
+        perfil_data puede ser el registro de un perfil o directamente las columnas
+        del DataFrame de perfiles (solo se consulta la pertenencia de cada columna).
+        """
+        atributos_ui = []
+        for attr_interno in self.atributos_disponibles:
+            if attr_interno in self.ATRIBUTOS_PESOS:
+                col_excel, color, titulo = self.ATRIBUTOS_PESOS[attr_interno]
+                if col_excel in perfil_data:
+                    atributos_ui.append((col_excel, color, titulo))
+        return atributos_ui
     
-    def _crear_controles_perfil(self, parent, perfil_data: pd.Series, index: int):
-        """Crea los controles para un perfil de ciclista"""
+    def _crear_controles_perfil(self, parent, perfil_data: Dict[str, Any], index: int,
+                                pesos_enumerados: Optional[tuple] = None):
+        """Crea los controles para un perfil de ciclista
+        
+        pesos_enumerados son los pares (i, (columna, color, título)) ya calculados
+        para todos los perfiles; si no se pasan se calculan para este perfil.
+        """
         # Frame principal para el perfil
         perfil_frame = EstiloUtils.crear_label_frame_con_estilo(
             parent, 
@@ -415,23 +523,11 @@ class PanelDistribuciones:
         pesos_frame.pack(fill="x")
         
         # Crear controles para cada peso - solo los atributos disponibles
-        mapeo_atributos = {
-            'distancia': ('DISTANCIA', '#FF6B6B'),
-            'seguridad': ('SEGURIDAD', '#4ECDC4'),
-            'luminosidad': ('LUMINOSIDAD', '#45B7D1'),
-            'inclinacion': ('INCLINACION', '#96CEB4')
-        }
-        
-        # Filtrar solo los atributos que están disponibles
-        atributos_ui = []
-        for attr_interno in self.atributos_disponibles:
-            if attr_interno in mapeo_atributos:
-                col_excel, color = mapeo_atributos[attr_interno]
-                if col_excel in perfil_data:
-                    atributos_ui.append((col_excel, color))
+        if pesos_enumerados is None:
+            pesos_enumerados = tuple(enumerate(self._obtener_atributos_ui(perfil_data)))
         
         # Si no hay atributos disponibles, mostrar mensaje
-        if not atributos_ui:
+        if not pesos_enumerados:
             EstiloUtils.crear_label_con_estilo(
                 pesos_frame,
                 "⚠️ No hay atributos disponibles para este perfil",
@@ -439,16 +535,18 @@ class PanelDistribuciones:
             ).pack(pady=10)
             return
         
-        for i, (peso, color) in enumerate(atributos_ui):
+        # Una sola llamada a Tk configura todas las columnas del perfil
+        pesos_frame.columnconfigure(tuple(range(len(pesos_enumerados))), weight=1)
+        
+        for i, (peso, color, titulo) in pesos_enumerados:
             # Frame para cada peso
             peso_frame = EstiloUtils.crear_frame_con_estilo(pesos_frame)
             peso_frame.grid(row=0, column=i, padx=10, pady=5, sticky="ew")
-            pesos_frame.columnconfigure(i, weight=1)
             
             # Label del peso
             EstiloUtils.crear_label_con_estilo(
                 peso_frame, 
-                peso.title(), 
+                titulo, 
                 'Subheader.TLabel'
             ).pack()
             
@@ -469,20 +567,16 @@ class PanelDistribuciones:
     
     def _aplicar_distribucion_nodo(self, nodo_id: str):
         """Aplica la distribución configurada para un nodo específico"""
+        if nodo_id is None or nodo_id not in self.controles_distribuciones:
+            return
+        
         try:
-            controles = self.controles_distribuciones[nodo_id]
+            controles = self.vars_edicion_nodo
             tipo = controles['tipo'].get()
             unidades = controles['unidades'].get()
             
-            # Función para convertir a segundos
-            def convertir_a_segundos(valor, unidades):
-                if unidades == 'segundos':
-                    return valor
-                elif unidades == 'minutos':
-                    return valor * 60.0
-                elif unidades == 'horas':
-                    return valor * 3600.0
-                return valor
+            # Factor de conversión a segundos (unidades desconocidas se toman como segundos)
+            factor = self.FACTORES_A_SEGUNDOS.get(unidades, 1.0)
             
             # Validar y preparar parámetros según el tipo
             # Nota: Valores 0 permiten desactivar la generación de entidades en ese nodo
@@ -492,7 +586,7 @@ class PanelDistribuciones:
                     messagebox.showerror("Error", f"❌ El parámetro λ no puede ser negativo para {tipo}")
                     return
                 # Convertir lambda a segundos
-                lambda_segundos = convertir_a_segundos(lambda_val, unidades)
+                lambda_segundos = lambda_val * factor
                 parametros = {'lambda': lambda_segundos}
             elif tipo == 'normal':
                 media_val = controles['media'].get()
@@ -502,8 +596,8 @@ class PanelDistribuciones:
                     return
                 # Si desviación es 0, permitirlo (no generará arribos)
                 # Convertir a segundos
-                media_segundos = convertir_a_segundos(media_val, unidades)
-                desviacion_segundos = convertir_a_segundos(desviacion_val, unidades)
+                media_segundos = media_val * factor
+                desviacion_segundos = desviacion_val * factor
                 parametros = {
                     'media': media_segundos,
                     'desviacion': desviacion_segundos
@@ -525,7 +619,7 @@ class PanelDistribuciones:
                     messagebox.showerror("Error", "❌ Los parámetros de forma y escala no pueden ser negativos")
                     return
                 # Convertir escala a segundos
-                escala_segundos = convertir_a_segundos(escala_val, unidades)
+                escala_segundos = escala_val * factor
                 parametros = {
                     'forma': forma_val,
                     'escala': escala_segundos
@@ -537,7 +631,7 @@ class PanelDistribuciones:
                     messagebox.showerror("Error", "❌ Los parámetros de forma y escala no pueden ser negativos")
                     return
                 # Convertir escala a segundos
-                escala_segundos = convertir_a_segundos(escala_val, unidades)
+                escala_segundos = escala_val * factor
                 parametros = {
                     'forma': forma_val,
                     'escala': escala_segundos
@@ -550,39 +644,38 @@ class PanelDistribuciones:
             if 'aplicar_distribucion' in self.callbacks:
                 self.callbacks['aplicar_distribucion'](nodo_id, tipo, parametros)
             
-            # Actualizar descripción
-            if tipo == 'exponencial':
-                lambda_val = controles['lambda'].get()
-                nueva_descripcion = f"Exponencial (λ={lambda_val:.3f}/{unidades})"
-            elif tipo == 'normal':
-                media_val = controles['media'].get()
-                desviacion_val = controles['desviacion'].get()
-                nueva_descripcion = f"Normal (μ={media_val:.3f}, σ={desviacion_val:.3f} {unidades})"
-            elif tipo == 'lognormal':
-                mu_val = controles['mu'].get()
-                sigma_val = controles['sigma'].get()
-                nueva_descripcion = f"Log-Normal (μ={mu_val:.3f}, σ={sigma_val:.3f})"
-            elif tipo == 'gamma':
-                forma_val = controles['forma'].get()
-                escala_val = controles['escala'].get()
-                nueva_descripcion = f"Gamma (α={forma_val:.3f}, β={escala_val:.3f} {unidades})"
-            elif tipo == 'weibull':
-                forma_val = controles['forma'].get()
-                escala_val = controles['escala'].get()
-                nueva_descripcion = f"Weibull (c={forma_val:.3f}, λ={escala_val:.3f} {unidades})"
-            else:
-                nueva_descripcion = "Desconocida"
+            # Parámetros en las unidades de la interfaz (se leen una sola vez)
+            parametros_ui = {parametro: controles[parametro].get()
+                             for parametro in self.PARAMETROS_POR_TIPO[tipo]}
+            nueva_descripcion = self.PLANTILLAS_DESCRIPCION[tipo].format(unidades=unidades, **parametros_ui)
             
-            controles['descripcion'].config(text=f"Actual: {nueva_descripcion}")
+            # Guardar la configuración (en las unidades de la interfaz) y reflejarla en la lista
+            config = self.controles_distribuciones[nodo_id]
+            config['tipo'] = tipo
+            config['unidades'] = unidades
+            config['parametros'] = parametros_ui
+            config['descripcion'] = nueva_descripcion
+            self.tree_nodos.item(self._item_por_nodo[nodo_id], 
+                                 values=(tipo, unidades, nueva_descripcion))
+            self._firma_distribuciones = None  # La lista ya no coincide con la última firma
             
-            # Mostrar mensaje de confirmación
-            messagebox.showinfo("Distribución Aplicada", 
-                              f"✅ Distribución {tipo} aplicada al nodo {nodo_id}")
+            # Confirmación en la propia etiqueta (sin diálogo modal): verde durante 2 s
+            self._mostrar_descripcion_nodo(nueva_descripcion)
+            self.desc_label_nodo.config(text=self.PREFIJO_APLICADA + nueva_descripcion, style='Success.TLabel')
+            self._id_fin_confirmacion = self.desc_label_nodo.after(
+                2000, self._mostrar_descripcion_nodo, nueva_descripcion)
             
         except Exception as e:
             messagebox.showerror("Error", f"Error al aplicar distribución: {str(e)}")
     
-    def _editar_perfil(self, perfil_data: pd.Series):
+    def _mostrar_descripcion_nodo(self, descripcion: str):
+        """Muestra la descripción del nodo con el estilo normal, cancelando una confirmación pendiente"""
+        if self._id_fin_confirmacion is not None:
+            self.desc_label_nodo.after_cancel(self._id_fin_confirmacion)
+            self._id_fin_confirmacion = None
+        self.desc_label_nodo.config(text=self.PREFIJO_DESCRIPCION + descripcion, style='Info.TLabel')
+    
+    def _editar_perfil(self, perfil_data: Dict[str, Any]):
         """Abre una ventana para editar un perfil de ciclista con UI mejorada"""
         # Crear ventana de edición más compacta
         ventana_edicion = tk.Toplevel(self.parent)
@@ -622,20 +715,10 @@ class PanelDistribuciones:
         
         # Variables para los pesos - solo los atributos disponibles
         pesos_vars = {}
-        mapeo_atributos = {
-            'distancia': ('DISTANCIA', '#FF6B6B'),
-            'seguridad': ('SEGURIDAD', '#4ECDC4'),
-            'luminosidad': ('LUMINOSIDAD', '#45B7D1'),
-            'inclinacion': ('INCLINACION', '#96CEB4')
-        }
+        etiquetas_valor = {}
         
         # Filtrar solo los atributos que están disponibles
-        atributos_ui = []
-        for attr_interno in self.atributos_disponibles:
-            if attr_interno in mapeo_atributos:
-                col_excel, color = mapeo_atributos[attr_interno]
-                if col_excel in perfil_data:
-                    atributos_ui.append((col_excel, color))
+        atributos_ui = self._obtener_atributos_ui(perfil_data)
         
         # Frame para pesos de atributos
         pesos_frame = EstiloUtils.crear_label_frame_con_estilo(main_frame, "⚖️ Pesos de Atributos")
@@ -649,20 +732,21 @@ class PanelDistribuciones:
                 'Info.TLabel'
             ).pack(pady=10)
         else:
-            # Crear grid de controles más compacto
-            for i, (peso, color) in enumerate(atributos_ui):
+            # Crear grid de controles más compacto (2 columnas configuradas de una vez)
+            pesos_frame.columnconfigure(tuple(range(min(2, len(atributos_ui)))), weight=1)
+            
+            for i, (peso, color, titulo) in enumerate(atributos_ui):
                 # Frame para cada peso (2 columnas)
                 row = i // 2
                 col = i % 2
                 
                 peso_frame = EstiloUtils.crear_frame_con_estilo(pesos_frame)
                 peso_frame.grid(row=row, column=col, padx=10, pady=8, sticky="ew")
-                pesos_frame.columnconfigure(col, weight=1)
                 
                 # Label del peso con color
                 peso_label = EstiloUtils.crear_label_con_estilo(
                     peso_frame, 
-                    f"{peso.title()}", 
+                    titulo, 
                     'Subheader.TLabel'
                 )
                 peso_label.pack()
@@ -693,10 +777,7 @@ class PanelDistribuciones:
                                      textvariable=var, width=8, format="%.2f")
                 spinbox.pack(side=tk.RIGHT, padx=(5, 0))
                 
-                # Actualizar valor cuando cambie el slider o spinbox
-                def update_valor(peso=peso, label=valor_label, var=var):
-                    label.config(text=f"{var.get():.2f}")
-                var.trace('w', lambda *args, p=peso, l=valor_label, v=var: update_valor(p, l, v))
+                etiquetas_valor[peso] = valor_label
         
         # Frame para resumen y validación
         resumen_frame = EstiloUtils.crear_label_frame_con_estilo(main_frame, "📊 Resumen")
@@ -724,9 +805,14 @@ class PanelDistribuciones:
             suma_pesos_label.config(text=f"Suma de pesos: {suma_pesos:.2f}")
             # Los pesos pueden tener cualquier suma, no hay validación de color
         
-        # Vincular actualización de resumen
-        for var in pesos_vars.values():
-            var.trace('w', lambda *args: actualizar_resumen())
+        # Un único trace por variable: actualiza su valor numérico y el resumen
+        # (cubre slider, spinbox y normalización sin cadenas de lambdas)
+        def on_cambio_peso(var, label):
+            label.config(text=f"{var.get():.2f}")
+            actualizar_resumen()
+        
+        for peso, var in pesos_vars.items():
+            var.trace_add('write', lambda *args, v=var, l=etiquetas_valor[peso]: on_cambio_peso(v, l))
         
         # Actualizar resumen inicial
         actualizar_resumen()
@@ -778,7 +864,7 @@ class PanelDistribuciones:
             command=ventana_edicion.destroy
         ).pack(side=tk.LEFT)
     
-    def _editar_probabilidad_perfil(self, perfil_data: pd.Series):
+    def _editar_probabilidad_perfil(self, perfil_data: Dict[str, Any]):
         """Abre una ventana para editar las probabilidades de selección de perfiles"""
         # Crear ventana de edición de probabilidades
         ventana_prob = tk.Toplevel(self.parent)
@@ -825,13 +911,14 @@ class PanelDistribuciones:
         
         # Variables para las probabilidades
         prob_vars = {}
+        etiquetas_valor = {}
         
         # Frame para las probabilidades
         prob_frame = EstiloUtils.crear_label_frame_con_estilo(main_frame, "🎯 Probabilidades por Perfil")
         prob_frame.pack(fill="x", pady=(0, 15))
         
         # Crear controles para cada perfil
-        for i, (_, perfil_row) in enumerate(self.perfiles_df.iterrows()):
+        for i, perfil_row in enumerate(self.perfiles_df.to_dict('records')):
             perfil_id = int(perfil_row['PERFILES'])
             prob_actual = perfil_row['PROBABILIDAD']
             
@@ -868,10 +955,7 @@ class PanelDistribuciones:
                                  textvariable=var, width=8, format="%.3f")
             spinbox.pack(side=tk.LEFT, padx=(5, 0))
             
-            # Actualizar valor cuando cambie el slider o spinbox
-            def update_valor(perfil_id=perfil_id, label=valor_label, var=var):
-                label.config(text=f"{var.get():.3f}")
-            var.trace('w', lambda *args, p=perfil_id, l=valor_label, v=var: update_valor(p, l, v))
+            etiquetas_valor[perfil_id] = valor_label
         
         # Frame para resumen y validación
         resumen_frame = EstiloUtils.crear_label_frame_con_estilo(main_frame, "📊 Resumen")
@@ -896,9 +980,13 @@ class PanelDistribuciones:
             else:
                 suma_prob_label.config(foreground='red')
         
-        # Vincular actualización de resumen
-        for var in prob_vars.values():
-            var.trace('w', lambda *args: actualizar_resumen())
+        # Un único trace por variable: actualiza su valor numérico y el resumen
+        def on_cambio_probabilidad(var, label):
+            label.config(text=f"{var.get():.3f}")
+            actualizar_resumen()
+        
+        for perfil_id, var in prob_vars.items():
+            var.trace_add('write', lambda *args, v=var, l=etiquetas_valor[perfil_id]: on_cambio_probabilidad(v, l))
         
         # Actualizar resumen inicial
         actualizar_resumen()
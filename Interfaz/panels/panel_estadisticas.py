@@ -6,21 +6,66 @@ en tiempo real de la simulación con scroll y mejor organización.
 """
 
 import tkinter as tk
-from tkinter import ttk, scrolledtext
+from tkinter import ttk
 from typing import Dict, List, Any, Callable
 
 from ..utils.estilo_utils import EstiloUtils
 
 
+class _LabelsEstadisticas(dict):
+    """Diccionario de labels que crea cada fila de estadística la primera vez que se pide"""
+    
+    def __init__(self, panel: 'PanelEstadisticas'):
+        super().__init__()
+        self._panel = panel
+    
+    def __missing__(self, key: str) -> ttk.Label:
+        label = self._panel._crear_fila_estadistica(key)
+        self[key] = label
+        return label
+
+
 class PanelEstadisticas:
     """Panel de estadísticas con métricas en tiempo real y scroll"""
     
+    # Filas de estadísticas que se crean a demanda:
+    # clave -> (fila, columna, etiqueta, valor inicial, estilo, columnas que ocupa el valor)
+    DISPOSICION_ESTADISTICAS = {
+        'estado_simulacion': (2, 0, "Estado:", "DETENIDO", 'Info.TLabel', 1),
+        'tiempo_actual': (2, 2, "Tiempo Actual:", "0.0s", 'Info.TLabel', 1),
+        'total_ciclistas': (4, 0, "Ciclistas Activos:", "0", 'Info.TLabel', 1),
+        'velocidad_promedio': (4, 2, "Velocidad Promedio:", "0.0 m/s", 'Info.TLabel', 1),
+        'velocidad_min': (5, 0, "Velocidad Mín:", "0.0 m/s", 'Info.TLabel', 1),
+        'velocidad_max': (5, 2, "Velocidad Máx:", "0.0 m/s", 'Info.TLabel', 1),
+        'rutas_utilizadas': (9, 0, "Rutas Utilizadas:", "0", 'Info.TLabel', 1),
+        'total_viajes': (9, 2, "Total Viajes:", "0", 'Info.TLabel', 1),
+        'ruta_mas_usada': (10, 0, "Ruta Más Usada:", "N/A", 'Info.TLabel', 3),
+        'tramo_mas_concurrido': (11, 0, "Tramo Más Concurrido:", "N/A", 'Info.TLabel', 3),
+        'ciclistas_completados': (13, 0, "Ciclistas Completados:", "0", 'Success.TLabel', 1),
+        'nodo_mas_activo': (13, 2, "Nodo Más Activo:", "N/A", 'Info.TLabel', 1)
+    }
+    
+    # Largo máximo de los textos libres antes de recortarlos con "..."
+    LONGITUD_MAXIMA_TEXTO = {
+        'ruta_mas_usada': 30,
+        'tramo_mas_concurrido': 30,
+        'nodo_mas_activo': 25
+    }
+    
     def __init__(self, parent, callbacks: Dict[str, Callable]):
         self.parent = parent
         self.callbacks = callbacks
         
-        # Diccionario para almacenar referencias a los labels
-        self.stats_labels = {}
+        # Diccionario para almacenar referencias a los labels (las filas de
+        # DISPOSICION_ESTADISTICAS se crean la primera vez que se accede a ellas)
+        self.stats_labels = _LabelsEstadisticas(self)
+        
+        # Último (texto, tipo) mostrado por cada label para evitar .config redundantes
+        self._ultimas_estadisticas = {}
+        
+        # Último (valor original, texto recortado) de cada estadística de LONGITUD_MAXIMA_TEXTO
+        self._textos_recortados = {}
+        self._boton_grafico_visible = None
         
         # Variables para control de scroll
         self.canvas = None
@@ -105,36 +150,7 @@ class PanelEstadisticas:
     
     def _bind_mousewheel(self):
         """Vincula el scroll del mouse al canvas"""
-        def _on_mousewheel(event):
-            # Solo procesar si el mouse está sobre el canvas o el frame scrollable
-            widget = event.widget
-            if widget == self.canvas or widget == self.scrollable_frame or widget.master == self.canvas:
-                # Windows y MacOS
-                if event.delta:
-                    self.canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
-                # Linux
-                elif event.num == 4:
-                    self.canvas.yview_scroll(-1, "units")
-                elif event.num == 5:
-                    self.canvas.yview_scroll(1, "units")
-        
-        def _on_enter(event):
-            # Cuando el mouse entra al canvas, vincular eventos
-            self.canvas.bind_all("<MouseWheel>", _on_mousewheel)
-            self.canvas.bind_all("<Button-4>", _on_mousewheel)
-            self.canvas.bind_all("<Button-5>", _on_mousewheel)
-        
-        def _on_leave(event):
-            # Cuando el mouse sale del canvas, desvincular eventos
-            self.canvas.unbind_all("<MouseWheel>")
-            self.canvas.unbind_all("<Button-4>")
-            self.canvas.unbind_all("<Button-5>")
-        
-        # Vincular eventos de entrada y salida del canvas
-        self.canvas.bind("<Enter>", _on_enter)
-        self.canvas.bind("<Leave>", _on_leave)
-        self.scrollable_frame.bind("<Enter>", _on_enter)
-        self.scrollable_frame.bind("<Leave>", _on_leave)
+        EstiloUtils.vincular_rueda_mouse(self.canvas, self.scrollable_frame)
     
     def _crear_boton_grafico(self):
         """Crea el botón para ver el gráfico de ocupación (solo visible cuando hay datos)"""
@@ -163,7 +179,7 @@ class PanelEstadisticas:
         
         try:
             # Verificar que haya eventos de arcos registrados
-            if not hasattr(self.simulador_ref, 'eventos_arcos') or not self.simulador_ref.eventos_arcos:
+            if not self.simulador_ref.eventos_arcos:
                 from tkinter import messagebox
                 messagebox.showinfo("Información", 
                     "No hay suficientes datos de arcos para generar el gráfico.")
@@ -183,11 +199,10 @@ class PanelEstadisticas:
             return
         
         # Verificar si hay datos disponibles
-        tiene_datos = (
-            self.simulador_ref and 
-            hasattr(self.simulador_ref, 'eventos_arcos') and 
-            self.simulador_ref.eventos_arcos
-        )
+        tiene_datos = bool(self.simulador_ref and self.simulador_ref.eventos_arcos)
+        if tiene_datos == self._boton_grafico_visible:
+            return
+        self._boton_grafico_visible = tiene_datos
         
         if tiene_datos:
             self.frame_boton_grafico.grid()
@@ -210,22 +225,21 @@ class PanelEstadisticas:
         titulo_frame.grid(row=1, column=0, columnspan=4, sticky=tk.W+tk.E, padx=5, pady=(5, 10))
         
         ttk.Label(titulo_frame, text="⚡ ESTADO DE SIMULACIÓN", 
-                 font=EstiloUtils.FUENTES['subtitulo']).pack(anchor=tk.W)
+                 font=EstiloUtils.obtener_fuente('subtitulo')).pack(anchor=tk.W)
         
-        # Fila 1: Estado y tiempo
-        ttk.Label(self.scrollable_frame, text="Estado:", 
-                 font=EstiloUtils.FUENTES['normal']).grid(row=2, column=0, sticky=tk.W, padx=5, pady=2)
-        self.stats_labels['estado_simulacion'] = EstiloUtils.crear_label_con_estilo(
-            self.scrollable_frame, "DETENIDO", 'Info.TLabel'
-        )
-        self.stats_labels['estado_simulacion'].grid(row=2, column=1, sticky=tk.W, padx=(0, 20), pady=2)
+    def _crear_fila_estadistica(self, key: str) -> ttk.Label:
+        """Crea y ubica la etiqueta y el label de valor de una fila de estadística"""
+        fila, columna, etiqueta, valor_inicial, estilo, columnas = self.DISPOSICION_ESTADISTICAS[key]
         
-        ttk.Label(self.scrollable_frame, text="Tiempo Actual:", 
-                 font=EstiloUtils.FUENTES['normal']).grid(row=2, column=2, sticky=tk.W, padx=5, pady=2)
-        self.stats_labels['tiempo_actual'] = EstiloUtils.crear_label_con_estilo(
-            self.scrollable_frame, "0.0s", 'Info.TLabel'
-        )
-        self.stats_labels['tiempo_actual'].grid(row=2, column=3, sticky=tk.W, padx=(0, 20), pady=2)
+        ttk.Label(self.scrollable_frame, text=etiqueta, 
+                 font=EstiloUtils.obtener_fuente('normal')).grid(row=fila, column=columna, sticky=tk.W, padx=5, pady=2)
+        label = EstiloUtils.crear_label_con_estilo(self.scrollable_frame, valor_inicial, estilo)
+        label.grid(row=fila, column=columna + 1, columnspan=columnas, sticky=tk.W, padx=(0, 20), pady=2)
+        return label
+    
+    def _tiene_estadistica(self, key: str) -> bool:
+        """Indica si el panel muestra (o puede crear) el label de una estadística"""
+        return key in self.stats_labels or key in self.DISPOSICION_ESTADISTICAS
     
     def _crear_contenido_estadisticas(self):
         """Crea el contenido principal del panel de estadísticas con mejor organización"""
@@ -256,38 +270,8 @@ class PanelEstadisticas:
         titulo_frame.grid(row=3, column=0, columnspan=4, sticky=tk.W+tk.E, padx=5, pady=(15, 5))
         
         ttk.Label(titulo_frame, text="🚴 ESTADÍSTICAS BÁSICAS", 
-                 font=EstiloUtils.FUENTES['subtitulo']).pack(anchor=tk.W)
+                 font=EstiloUtils.obtener_fuente('subtitulo')).pack(anchor=tk.W)
         
-        # Fila 1: Ciclistas y velocidades
-        ttk.Label(self.scrollable_frame, text="Ciclistas Activos:", 
-                 font=EstiloUtils.FUENTES['normal']).grid(row=4, column=0, sticky=tk.W, padx=5, pady=2)
-        self.stats_labels['total_ciclistas'] = EstiloUtils.crear_label_con_estilo(
-            self.scrollable_frame, "0", 'Info.TLabel'
-        )
-        self.stats_labels['total_ciclistas'].grid(row=4, column=1, sticky=tk.W, padx=(0, 20), pady=2)
-        
-        ttk.Label(self.scrollable_frame, text="Velocidad Promedio:", 
-                 font=EstiloUtils.FUENTES['normal']).grid(row=4, column=2, sticky=tk.W, padx=5, pady=2)
-        self.stats_labels['velocidad_promedio'] = EstiloUtils.crear_label_con_estilo(
-            self.scrollable_frame, "0.0 m/s", 'Info.TLabel'
-        )
-        self.stats_labels['velocidad_promedio'].grid(row=4, column=3, sticky=tk.W, padx=(0, 20), pady=2)
-        
-        # Fila 2: Velocidades min/max
-        ttk.Label(self.scrollable_frame, text="Velocidad Mín:", 
-                 font=EstiloUtils.FUENTES['normal']).grid(row=5, column=0, sticky=tk.W, padx=5, pady=2)
-        self.stats_labels['velocidad_min'] = EstiloUtils.crear_label_con_estilo(
-            self.scrollable_frame, "0.0 m/s", 'Info.TLabel'
-        )
-        self.stats_labels['velocidad_min'].grid(row=5, column=1, sticky=tk.W, padx=(0, 20), pady=2)
-        
-        ttk.Label(self.scrollable_frame, text="Velocidad Máx:", 
-                 font=EstiloUtils.FUENTES['normal']).grid(row=5, column=2, sticky=tk.W, padx=5, pady=2)
-        self.stats_labels['velocidad_max'] = EstiloUtils.crear_label_con_estilo(
-            self.scrollable_frame, "0.0 m/s", 'Info.TLabel'
-        )
-        self.stats_labels['velocidad_max'].grid(row=5, column=3, sticky=tk.W, padx=(0, 20), pady=2)
-    
     def _crear_seccion_ciclistas_por_tramo(self):
         """Crea la sección que muestra ciclistas por tramo en tiempo real"""
         # Título de sección
@@ -295,7 +279,7 @@ class PanelEstadisticas:
         titulo_frame.grid(row=6, column=0, columnspan=4, sticky=tk.W+tk.E, padx=5, pady=(15, 5))
         
         ttk.Label(titulo_frame, text="CICLISTAS POR TRAMO (EN VIVO)", 
-                 font=EstiloUtils.FUENTES['subtitulo']).pack(anchor=tk.W)
+                 font=EstiloUtils.obtener_fuente('subtitulo')).pack(anchor=tk.W)
         
         # Frame para mostrar la lista de tramos con ciclistas
         self.frame_ciclistas_tramo = EstiloUtils.crear_frame_con_estilo(self.scrollable_frame)
@@ -305,7 +289,7 @@ class PanelEstadisticas:
         self.stats_labels['ciclistas_por_tramo'] = ttk.Label(
             self.frame_ciclistas_tramo,
             text="Ningún tramo con ciclistas activos",
-            font=EstiloUtils.FUENTES['normal'],
+            font=EstiloUtils.obtener_fuente('normal'),
             foreground='gray'
         )
         self.stats_labels['ciclistas_por_tramo'].pack(anchor=tk.W, padx=5, pady=2)
@@ -317,18 +301,18 @@ class PanelEstadisticas:
         titulo_frame.grid(row=3, column=0, columnspan=4, sticky=tk.W+tk.E, padx=5, pady=(15, 5))
         
         ttk.Label(titulo_frame, text="🕸️ ESTADÍSTICAS DEL GRAFO", 
-                 font=EstiloUtils.FUENTES['subtitulo']).pack(anchor=tk.W)
+                 font=EstiloUtils.obtener_fuente('subtitulo')).pack(anchor=tk.W)
         
         # Fila 1: Nodos y arcos
         ttk.Label(self.scrollable_frame, text="Nodos del Grafo:", 
-                 font=EstiloUtils.FUENTES['normal']).grid(row=4, column=0, sticky=tk.W, padx=5, pady=2)
+                 font=EstiloUtils.obtener_fuente('normal')).grid(row=4, column=0, sticky=tk.W, padx=5, pady=2)
         self.stats_labels['grafo_nodos'] = EstiloUtils.crear_label_con_estilo(
             self.scrollable_frame, "0", 'Info.TLabel'
         )
         self.stats_labels['grafo_nodos'].grid(row=4, column=1, sticky=tk.W, padx=(0, 20), pady=2)
         
         ttk.Label(self.scrollable_frame, text="Arcos del Grafo:", 
-                 font=EstiloUtils.FUENTES['normal']).grid(row=4, column=2, sticky=tk.W, padx=5, pady=2)
+                 font=EstiloUtils.obtener_fuente('normal')).grid(row=4, column=2, sticky=tk.W, padx=5, pady=2)
         self.stats_labels['grafo_arcos'] = EstiloUtils.crear_label_con_estilo(
             self.scrollable_frame, "0", 'Info.TLabel'
         )
@@ -336,7 +320,7 @@ class PanelEstadisticas:
         
         # Fila 2: Modo de simulación
         ttk.Label(self.scrollable_frame, text="Modo de Simulación:", 
-                 font=EstiloUtils.FUENTES['normal']).grid(row=5, column=0, sticky=tk.W, padx=5, pady=2)
+                 font=EstiloUtils.obtener_fuente('normal')).grid(row=5, column=0, sticky=tk.W, padx=5, pady=2)
         self.stats_labels['modo_simulacion'] = EstiloUtils.crear_label_con_estilo(
             self.scrollable_frame, "Original", 'Info.TLabel'
         )
@@ -349,18 +333,18 @@ class PanelEstadisticas:
         titulo_frame.grid(row=6, column=0, columnspan=4, sticky=tk.W+tk.E, padx=5, pady=(15, 5))
         
         ttk.Label(titulo_frame, text="📊 DISTRIBUCIONES DE PROBABILIDAD", 
-                 font=EstiloUtils.FUENTES['subtitulo']).pack(anchor=tk.W)
+                 font=EstiloUtils.obtener_fuente('subtitulo')).pack(anchor=tk.W)
         
         # Fila 1: Distribuciones y tasa
         ttk.Label(self.scrollable_frame, text="Distribuciones Configuradas:", 
-                 font=EstiloUtils.FUENTES['normal']).grid(row=7, column=0, sticky=tk.W, padx=5, pady=2)
+                 font=EstiloUtils.obtener_fuente('normal')).grid(row=7, column=0, sticky=tk.W, padx=5, pady=2)
         self.stats_labels['distribuciones_configuradas'] = EstiloUtils.crear_label_con_estilo(
             self.scrollable_frame, "0", 'Info.TLabel'
         )
         self.stats_labels['distribuciones_configuradas'].grid(row=7, column=1, sticky=tk.W, padx=(0, 20), pady=2)
         
         ttk.Label(self.scrollable_frame, text="Tasa de Arribo Promedio:", 
-                 font=EstiloUtils.FUENTES['normal']).grid(row=7, column=2, sticky=tk.W, padx=5, pady=2)
+                 font=EstiloUtils.obtener_fuente('normal')).grid(row=7, column=2, sticky=tk.W, padx=5, pady=2)
         self.stats_labels['tasa_arribo_promedio'] = EstiloUtils.crear_label_con_estilo(
             self.scrollable_frame, "0.0", 'Info.TLabel'
         )
@@ -368,7 +352,7 @@ class PanelEstadisticas:
         
         # Fila 2: Duración
         ttk.Label(self.scrollable_frame, text="Duración de Simulación:", 
-                 font=EstiloUtils.FUENTES['normal']).grid(row=8, column=0, sticky=tk.W, padx=5, pady=2)
+                 font=EstiloUtils.obtener_fuente('normal')).grid(row=8, column=0, sticky=tk.W, padx=5, pady=2)
         self.stats_labels['duracion_simulacion'] = EstiloUtils.crear_label_con_estilo(
             self.scrollable_frame, "300s", 'Info.TLabel'
         )
@@ -381,39 +365,8 @@ class PanelEstadisticas:
         titulo_frame.grid(row=8, column=0, columnspan=4, sticky=tk.W+tk.E, padx=5, pady=(15, 5))
         
         ttk.Label(titulo_frame, text="🛣️ ESTADÍSTICAS DE RUTAS", 
-                 font=EstiloUtils.FUENTES['subtitulo']).pack(anchor=tk.W)
-        
-        # Fila 1: Rutas utilizadas y total viajes
-        ttk.Label(self.scrollable_frame, text="Rutas Utilizadas:", 
-                 font=EstiloUtils.FUENTES['normal']).grid(row=9, column=0, sticky=tk.W, padx=5, pady=2)
-        self.stats_labels['rutas_utilizadas'] = EstiloUtils.crear_label_con_estilo(
-            self.scrollable_frame, "0", 'Info.TLabel'
-        )
-        self.stats_labels['rutas_utilizadas'].grid(row=9, column=1, sticky=tk.W, padx=(0, 20), pady=2)
+                 font=EstiloUtils.obtener_fuente('subtitulo')).pack(anchor=tk.W)
         
-        ttk.Label(self.scrollable_frame, text="Total Viajes:", 
-                 font=EstiloUtils.FUENTES['normal']).grid(row=9, column=2, sticky=tk.W, padx=5, pady=2)
-        self.stats_labels['total_viajes'] = EstiloUtils.crear_label_con_estilo(
-            self.scrollable_frame, "0", 'Info.TLabel'
-        )
-        self.stats_labels['total_viajes'].grid(row=9, column=3, sticky=tk.W, padx=(0, 20), pady=2)
-        
-        # Fila 2: Ruta más usada
-        ttk.Label(self.scrollable_frame, text="Ruta Más Usada:", 
-                 font=EstiloUtils.FUENTES['normal']).grid(row=10, column=0, sticky=tk.W, padx=5, pady=2)
-        self.stats_labels['ruta_mas_usada'] = EstiloUtils.crear_label_con_estilo(
-            self.scrollable_frame, "N/A", 'Info.TLabel'
-        )
-        self.stats_labels['ruta_mas_usada'].grid(row=10, column=1, columnspan=3, sticky=tk.W, padx=(0, 20), pady=2)
-        
-        # Fila 3: Tramo más concurrido (NUEVA ESTADÍSTICA)
-        ttk.Label(self.scrollable_frame, text="Tramo Más Concurrido:", 
-                 font=EstiloUtils.FUENTES['normal']).grid(row=11, column=0, sticky=tk.W, padx=5, pady=2)
-        self.stats_labels['tramo_mas_concurrido'] = EstiloUtils.crear_label_con_estilo(
-            self.scrollable_frame, "N/A", 'Info.TLabel'
-        )
-        self.stats_labels['tramo_mas_concurrido'].grid(row=11, column=1, columnspan=3, sticky=tk.W, padx=(0, 20), pady=2)
-    
     def _crear_seccion_estadisticas_adicionales(self):
         """Crea la sección de estadísticas adicionales"""
         # Título de sección
@@ -421,23 +374,8 @@ class PanelEstadisticas:
         titulo_frame.grid(row=12, column=0, columnspan=4, sticky=tk.W+tk.E, padx=5, pady=(15, 5))
         
         ttk.Label(titulo_frame, text="📈 ESTADÍSTICAS ADICIONALES", 
-                 font=EstiloUtils.FUENTES['subtitulo']).pack(anchor=tk.W)
+                 font=EstiloUtils.obtener_fuente('subtitulo')).pack(anchor=tk.W)
         
-        # Fila 1: Ciclistas completados y nodo más activo
-        ttk.Label(self.scrollable_frame, text="Ciclistas Completados:", 
-                 font=EstiloUtils.FUENTES['normal']).grid(row=13, column=0, sticky=tk.W, padx=5, pady=2)
-        self.stats_labels['ciclistas_completados'] = EstiloUtils.crear_label_con_estilo(
-            self.scrollable_frame, "0", 'Success.TLabel'
-        )
-        self.stats_labels['ciclistas_completados'].grid(row=13, column=1, sticky=tk.W, padx=(0, 20), pady=2)
-        
-        ttk.Label(self.scrollable_frame, text="Nodo Más Activo:", 
-                 font=EstiloUtils.FUENTES['normal']).grid(row=13, column=2, sticky=tk.W, padx=5, pady=2)
-        self.stats_labels['nodo_mas_activo'] = EstiloUtils.crear_label_con_estilo(
-            self.scrollable_frame, "N/A", 'Info.TLabel'
-        )
-        self.stats_labels['nodo_mas_activo'].grid(row=13, column=3, sticky=tk.W, padx=(0, 20), pady=2)
-    
     def actualizar_estadisticas(self, stats: Dict[str, Any]):
         """Actualiza las estadísticas mostradas con validación mejorada"""
         try:
@@ -469,26 +407,15 @@ class PanelEstadisticas:
             self._actualizar_estadistica('rutas_utilizadas', self._validar_numero(stats.get('rutas_utilizadas', 0)))
             self._actualizar_estadistica('total_viajes', self._validar_numero(stats.get('total_viajes', 0)))
             
-            # Ruta más usada (truncar si es muy larga)
-            ruta_mas_usada = stats.get('ruta_mas_usada', 'N/A')
-            if isinstance(ruta_mas_usada, str) and len(ruta_mas_usada) > 30:
-                ruta_mas_usada = ruta_mas_usada[:27] + "..."
-            self._actualizar_estadistica('ruta_mas_usada', str(ruta_mas_usada))
-            
-            # Tramo más concurrido (NUEVA ESTADÍSTICA)
-            tramo_mas_concurrido = stats.get('tramo_mas_concurrido', 'N/A')
-            if isinstance(tramo_mas_concurrido, str) and len(tramo_mas_concurrido) > 30:
-                tramo_mas_concurrido = tramo_mas_concurrido[:27] + "..."
-            self._actualizar_estadistica('tramo_mas_concurrido', str(tramo_mas_concurrido))
+            # Ruta más usada y tramo más concurrido (recortados si son muy largos)
+            self._actualizar_texto_recortado('ruta_mas_usada', stats.get('ruta_mas_usada', 'N/A'))
+            self._actualizar_texto_recortado('tramo_mas_concurrido', stats.get('tramo_mas_concurrido', 'N/A'))
             
             # Ciclistas completados
             self._actualizar_estadistica('ciclistas_completados', self._validar_numero(stats.get('ciclistas_completados', 0)), 'exito')
             
-            # Nodo más activo (truncar si es muy largo)
-            nodo_mas_activo = stats.get('nodo_mas_activo', 'N/A')
-            if isinstance(nodo_mas_activo, str) and len(nodo_mas_activo) > 25:
-                nodo_mas_activo = nodo_mas_activo[:22] + "..."
-            self._actualizar_estadistica('nodo_mas_activo', str(nodo_mas_activo))
+            # Nodo más activo (recortado si es muy largo)
+            self._actualizar_texto_recortado('nodo_mas_activo', stats.get('nodo_mas_activo', 'N/A'))
             
             # Actualizar ciclistas por tramo en tiempo real
             self._actualizar_ciclistas_por_tramo(stats.get('ciclistas_por_tramo_tiempo_real', {}))
@@ -545,13 +472,55 @@ class PanelEstadisticas:
         }
         
         for key, valor in valores_por_defecto.items():
-            if key in self.stats_labels:
-                self.stats_labels[key].config(text=valor)
+            if self._tiene_estadistica(key):
+                self._establecer_texto_si_cambia(key, valor)
     
     def _actualizar_estadistica(self, key: str, valor: Any, tipo: str = 'normal'):
-        """Actualiza una estadística específica"""
-        if key in self.stats_labels:
-            EstiloUtils.aplicar_estilo_estadistica(self.stats_labels[key], valor, tipo)
+        """Actualiza una estadística específica solo si cambió lo que se muestra"""
+        if not self._tiene_estadistica(key):
+            return
+        
+        # Comparar con el texto ya formateado (redondeado a la precisión mostrada)
+        texto = EstiloUtils.formatear_valor_estadistica(valor)
+        estado = (texto, tipo)
+        if self._ultimas_estadisticas.get(key) == estado:
+            return
+        
+        EstiloUtils.aplicar_estilo_estadistica(self.stats_labels[key], valor, tipo, texto)
+        self._ultimas_estadisticas[key] = estado
+    
+    def _actualizar_texto_recortado(self, key: str, valor: Any):
+        """Actualiza una estadística de texto libre recortándola a LONGITUD_MAXIMA_TEXTO
+        
+        El recorte se recuerda por estadística: mientras el valor no cambie se
+        reutiliza el texto ya armado en lugar de volver a cortarlo en cada paso.
+        """
+        anterior = self._textos_recortados.get(key)
+        if anterior is not None and anterior[0] == valor:
+            texto = anterior[1]
+        else:
+            texto = str(valor)
+            maximo = self.LONGITUD_MAXIMA_TEXTO[key]
+            if len(texto) > maximo:
+                texto = f"{texto[:maximo - 3]}..."
+            self._textos_recortados[key] = (valor, texto)
+        self._actualizar_estadistica(key, texto)
+    
+    def _establecer_texto_si_cambia(self, key: str, texto: str):
+        """Cambia solo el texto de un label si difiere del mostrado (conserva su color)"""
+        anterior = self._ultimas_estadisticas.get(key)
+        if anterior is not None and anterior[0] == texto:
+            return
+        self.stats_labels[key].config(text=texto)
+        self._ultimas_estadisticas[key] = (texto, anterior[1] if anterior else None)
+    
+    def _configurar_label_si_cambia(self, key: str, texto: str, color: str):
+        """Configura texto y color de un label solo si difieren de los actuales"""
+        estado = (texto, color)
+        if self._ultimas_estadisticas.get(key) == estado:
+            return
+        self.stats_labels[key].config(text=texto, foreground=color)
+        self._ultimas_estadisticas[key] = estado
     
     def _actualizar_ciclistas_por_tramo(self, ciclistas_por_tramo: Dict[str, int]):
         """Actualiza la información de ciclistas por tramo en tiempo real"""
@@ -559,10 +528,7 @@ class PanelEstadisticas:
             return
         
         if not ciclistas_por_tramo:
-            self.stats_labels['ciclistas_por_tramo'].config(
-                text="Ningún tramo con ciclistas activos",
-                foreground='gray'
-            )
+            self._configurar_label_si_cambia('ciclistas_por_tramo', "Ningún tramo con ciclistas activos", 'gray')
             return
         
         # Ordenar tramos por cantidad de ciclistas (descendente)
@@ -584,10 +550,7 @@ class PanelEstadisticas:
         texto_final = "\n".join(texto_lineas) if texto_lineas else "Ningún tramo con ciclistas activos"
         
         # Actualizar el label
-        self.stats_labels['ciclistas_por_tramo'].config(
-            text=texto_final,
-            foreground='black'
-        )
+        self._configurar_label_si_cambia('ciclistas_por_tramo', texto_final, 'black')
     
     
     def limpiar_estadisticas(self):
@@ -610,8 +573,8 @@ class PanelEstadisticas:
         }
         
         for key, valor in valores_por_defecto.items():
-            if key in self.stats_labels:
-                self.stats_labels[key].config(text=valor)
+            if self._tiene_estadistica(key):
+                self._establecer_texto_si_cambia(key, valor)
         
         # Actualizar scroll después de limpiar
         if self.canvas:
@@ -7,9 +7,10 @@ para mostrar el grafo y los ciclistas en tiempo real.
 
 import tkinter as tk
 from tkinter import ttk
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+import time
 import networkx as nx
+import numpy as np
+from contextlib import contextmanager
 from typing import Dict, List, Tuple, Optional, Any, Callable
 
 from ..utils.estilo_utils import EstiloUtils
@@ -18,6 +19,41 @@ from ..utils.estilo_utils import EstiloUtils
 class PanelVisualizacion:
     """Panel de visualización con matplotlib"""
     
+    # Resolución del buffer Agg (menos píxeles = redibujado más rápido)
+    DPI_BASE = 72
+    DPI_ALTA_CALIDAD = 100
+    FACTORES_RECORTE = (1, 2, 4)
+    
+    # Columnas (columna, mínimo) a probar en orden para las opciones de distancia
+    COLUMNAS_DISTANCIA_REAL = (('distancia_real', None), ('distancia', None), ('weight', 10.0))
+    COLUMNAS_DISTANCIA_ORIGINAL = (('distancia', None), ('weight', 10.0))
+    
+    # Nombres alternativos (en inglés) de los atributos de arcos
+    ALIAS_ATRIBUTOS = {
+        'safety': 'seguridad',
+        'luminosity': 'luminosidad',
+        'inclination': 'inclinacion'
+    }
+    
+    # Prefijo de la opción del combobox por atributo (el resto usa PREFIJO_ATRIBUTO_GENERICO)
+    PREFIJOS_ATRIBUTO = {
+        'seguridad': "[SEGURIDAD]", 'safety': "[SEGURIDAD]",
+        'luminosidad': "[LUZ]", 'luminosity': "[LUZ]", 'light': "[LUZ]",
+        'inclinacion': "[MONTAÑA]", 'inclination': "[MONTAÑA]", 'slope': "[MONTAÑA]"
+    }
+    PREFIJO_ATRIBUTO_GENERICO = "[DATOS]"
+    
+    # Formato de etiqueta por atributo (el resto usa FORMATO_ATRIBUTO_GENERICO)
+    FORMATOS_ATRIBUTO = {
+        'seguridad': "%.1f/10",
+        'luminosidad': "%.1f/10",
+        'inclinacion': "%.1f%%"
+    }
+    FORMATO_ATRIBUTO_GENERICO = "%.2f"
+    
+    # Máximo de etiquetas de arcos dibujadas (en redes densas se muestra una de cada k)
+    MAX_ETIQUETAS_ARCOS = 200
+    
     def __init__(self, parent, callbacks: Dict[str, Callable]):
         self.parent = parent
         self.callbacks = callbacks
@@ -27,6 +63,36 @@ class PanelVisualizacion:
         self.pos_grafo_actual = None
         self.nombre_archivo_excel = None
         
+        # Control de resolución del canvas
+        self.factor_recorte = 1
+        self.alta_calidad_en_pausa = tk.BooleanVar(value=True)
+        self._en_pausa = False
+        self._bg = None  # Fondo cacheado del canvas (se invalida en cada redibujado pedido)
+        
+        # Geometría de arcos precalculada (se recalcula solo al cambiar el grafo)
+        self._arcos_lista = []
+        self._puntos_medios_arcos = np.empty((0, 2))
+        self._grafo_geometria_id = None
+        self._columnas_arcos = {}  # Atributo -> valores por arco (NaN si falta)
+        self._etiquetas_cache = {}  # (grafo, posiciones, selección) -> (índices, textos)
+        self._firma_grafico = None  # (grafo, posiciones, archivo) de la red dibujada
+        self._atributo_etiquetas = None  # Atributo de las etiquetas de arcos dibujadas
+        self._resolucion_por_opcion = {}  # Opción del combo -> (columnas, formato)
+        self._opciones_combo = []  # Opciones del combo para el último conjunto de atributos
+        self._clave_opciones_combo = None  # Conjunto de atributos con que se armaron
+        self._edge_label_artists = []
+        
+        # Agrupación de redibujados (ver suspender_dibujado)
+        self._dibujado_suspendido = 0
+        self._redibujo_pendiente = False
+        self._visualizacion_pendiente = False
+        self._ciclistas_pendientes = None
+        
+        # Figura y scatter de ciclistas (se crean en crear_panel)
+        self.fig = None
+        self.scatter = None
+        self._ciclistas_dibujados = 0  # Puntos del scatter en el último cuadro bliteado
+        
         # Crear el panel
         self.crear_panel()
     
@@ -87,30 +153,173 @@ class PanelVisualizacion:
             'Info.TLabel'
         )
         self.info_simulacion_label.grid(row=0, column=3, sticky=(tk.W, tk.E), padx=(15, 0))
+        
+        # Selector de resolución del canvas (factor de recorte del DPI)
+        EstiloUtils.crear_label_con_estilo(
+            controles_frame, 
+            "[CALIDAD] Resolución:", 
+            'Info.TLabel'
+        ).grid(row=1, column=0, sticky=tk.W, padx=(0, 10), pady=(5, 0))
+        
+        self.combo_recorte = ttk.Combobox(
+            controles_frame, 
+            state="readonly", 
+            width=8,
+            values=[f"1/{factor}" for factor in self.FACTORES_RECORTE]
+        )
+        self.combo_recorte.set("1/1")
+        self.combo_recorte.grid(row=1, column=1, sticky=tk.W, padx=(0, 10), pady=(5, 0))
+        self.combo_recorte.bind("<<ComboboxSelected>>", self._on_cambio_recorte)
+        
+        ttk.Checkbutton(
+            controles_frame,
+            text="Alta calidad en pausa",
+            variable=self.alta_calidad_en_pausa,
+            command=self._aplicar_dpi
+        ).grid(row=1, column=2, columnspan=2, sticky=tk.W, pady=(5, 0))
+    
+    def _on_cambio_recorte(self, event=None):
+        """Aplica el factor de recorte seleccionado en el combobox"""
+        try:
+            self.factor_recorte = int(self.combo_recorte.get().split('/')[-1])
+        except ValueError:
+            self.factor_recorte = 1
+        self._aplicar_dpi()
+    
+    def _aplicar_dpi(self):
+        """Ajusta el DPI de la figura según el factor de recorte y el modo pausa"""
+        if self.fig is None:
+            return
+        
+        if self._en_pausa and self.alta_calidad_en_pausa.get():
+            dpi = self.DPI_ALTA_CALIDAD
+        else:
+            dpi = self.DPI_BASE / self.factor_recorte
+        
+        if self.fig.get_dpi() != dpi:
+            self.fig.set_dpi(dpi)
+            
+            # set_dpi conserva el tamaño en pulgadas y, sin manager (canvas embebido en
+            # Tk), no redimensiona el widget: se ajustan las pulgadas para que la figura
+            # vuelva a ocupar exactamente los píxeles del widget
+            widget = self.canvas.get_tk_widget()
+            ancho, alto = widget.winfo_width(), widget.winfo_height()
+            if ancho > 1 and alto > 1:
+                self.fig.set_size_inches(ancho / dpi, alto / dpi, forward=False)
+            self._solicitar_redibujo()  # También descarta el fondo del tamaño anterior
+    
+    def _solicitar_redibujo(self):
+        """Pide un redibujado del canvas, o lo difiere si el dibujado está suspendido
+        
+        El fondo cacheado se descarta de inmediato: hasta que el redibujado completo
+        lo recapture, los cuadros de ciclistas no se blitean sobre una red obsoleta.
+        """
+        self._bg = None
+        if self._dibujado_suspendido:
+            self._redibujo_pendiente = True
+        else:
+            self.canvas.draw_idle()
+    
+    @contextmanager
+    def suspender_dibujado(self):
+        """Agrupa varias actualizaciones del gráfico en un único redibujado al salir
+        
+        Mientras está activo, actualizar_visualizacion solo guarda los últimos datos
+        recibidos y los redibujados se acumulan; al salir se aplica el último
+        estado de los ciclistas y se hace un solo draw_idle.
+        """
+        self._dibujado_suspendido += 1
+        try:
+            yield
+        finally:
+            self._dibujado_suspendido -= 1
+            if not self._dibujado_suspendido:
+                if self._visualizacion_pendiente:
+                    ciclistas, self._ciclistas_pendientes = self._ciclistas_pendientes, None
+                    self._visualizacion_pendiente = False
+                    self._ultima_actualizacion = 0  # No descartar por control de frecuencia
+                    self.actualizar_visualizacion(ciclistas)
+                if self._redibujo_pendiente:
+                    self._redibujo_pendiente = False
+                    self.canvas.draw_idle()
+    
+    def establecer_modo_pausa(self, pausado: bool):
+        """Indica al panel si la simulación está en pausa (permite subir la calidad)"""
+        self._en_pausa = pausado
+        self._aplicar_dpi()
     
     def _crear_figura_matplotlib(self):
         """Crea la figura de matplotlib"""
-        # Crear figura con configuración optimizada
-        self.fig, self.ax = plt.subplots(figsize=(10, 6))
+        # Importación diferida y sin pyplot: el backend Tk solo se carga al construir
+        # la figura, y la figura no queda registrada en el gestor global de pyplot
+        from matplotlib import style
+        from matplotlib.figure import Figure
+        from matplotlib.font_manager import FontProperties
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
         
         # Configurar estilo de matplotlib optimizado
-        plt.style.use('default')
+        style.use('default')
+        
+        # Crear figura con DPI reducido: menos píxeles que rasterizar en cada redibujado
+        self.fig = Figure(figsize=(10, 6), dpi=self.DPI_BASE)
+        self.ax = self.fig.add_subplot()
         self.ax.set_facecolor('#f8f9fa')
         
         # Optimizaciones de rendimiento
         self.fig.patch.set_facecolor('#f8f9fa')
         self.ax.set_autoscale_on(False)  # Desactivar autoescalado para mejor rendimiento
         
+        # Fuente y caja de las etiquetas de arcos, creadas una vez y compartidas por todas
+        # (caja cuadrada: sin trazado de esquinas redondeadas por etiqueta)
+        self._fuente_etiquetas_arcos = FontProperties(size=8)
+        self._caja_etiquetas_arcos = dict(boxstyle="square,pad=0.1", ec=(1.0, 1.0, 1.0), fc=(1.0, 1.0, 1.0))
+        
         # Crear canvas
         self.canvas = FigureCanvasTkAgg(self.fig, self.frame_principal)
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
         
         # Configurar eventos
         self.canvas.mpl_connect('button_press_event', self._on_click)
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+        self.canvas.mpl_connect('resize_event', self._on_resize)
         
         # Variables para control de actualización
         self._ultima_actualizacion = 0
         self._intervalo_actualizacion = 0.1  # Actualizar máximo cada 100ms
+        
+        # Último cuadro recibido dentro del intervalo (los intermedios se descartan)
+        self._cuadro_pendiente = None
+        self._id_cuadro_pendiente = None
+    
+    def _on_draw(self, event):
+        """Tras cada redibujado completo, guarda el fondo estático y pinta los ciclistas
+        
+        El scatter es 'animated', así que el redibujado completo no lo incluye: el
+        fondo capturado contiene solo la red (arcos, nodos, etiquetas) y se reutiliza
+        en cada cuadro con blitting. Solo se guarda la región de los ejes, que es
+        la única que cambia entre cuadros.
+        
+        No hace falta llamar a blit aquí: el evento se emite dentro de draw() y
+        FigureCanvasTkAgg copia la figura completa a la pantalla al terminar.
+        """
+        self._bg = self.canvas.copy_from_bbox(self.ax.bbox)
+        if self.scatter is not None:
+            self.ax.draw_artist(self.scatter)
+    
+    def _on_resize(self, event):
+        """Invalida el fondo cacheado: ya no coincide con el nuevo tamaño del canvas"""
+        self._bg = None
+    
+    def _dibujar_ciclistas(self):
+        """Redibuja solo el scatter de ciclistas sobre el fondo cacheado (blitting)"""
+        if self._bg is None or self._dibujado_suspendido:
+            # Sin fondo válido: un redibujado completo lo vuelve a capturar
+            self._solicitar_redibujo()
+            return
+        
+        self.canvas.restore_region(self._bg)
+        self.ax.draw_artist(self.scatter)
+        self.canvas.blit(self.ax.bbox)
     
     def _on_click(self, event):
         """Maneja clics en el gráfico"""
@@ -125,6 +334,7 @@ class PanelVisualizacion:
     
     def configurar_grafico_inicial(self):
         """Configura el gráfico inicial sin grafo cargado"""
+        self._firma_grafico = None
         self.ax.clear()
         self.ax.set_title("[BICICLETA] SIMULADOR DE CICLORUTAS v2.0", 
                          fontsize=14, fontweight='bold', color='#212529', pad=15)
@@ -143,7 +353,7 @@ class PanelVisualizacion:
         
         # Scatter plot para ciclistas (vacío inicialmente)
         self.scatter = self.ax.scatter([], [], s=120, alpha=0.95, edgecolors='white', 
-                                     linewidth=2, zorder=10)
+                                     linewidth=2, zorder=10, animated=True)
         
         # Mensaje inicial - SOLO mensaje, sin red básica
         self.ax.text(0.5, 0.5, '[ARCHIVO] Carga un grafo Excel para comenzar la simulación\n\n' +
@@ -161,7 +371,7 @@ class PanelVisualizacion:
         self.ax.set_xlim(0, 1)
         self.ax.set_ylim(0, 1)
         
-        self.canvas.draw_idle()
+        self._solicitar_redibujo()
     
     def _dibujar_red_basica(self):
         """Dibuja la red básica en forma de Y"""
@@ -195,16 +405,39 @@ class PanelVisualizacion:
         self.ax.set_xlim(-10, 60)
         self.ax.set_ylim(-40, 40)
     
-    def configurar_grafico_con_grafo(self, grafo: nx.Graph, pos_grafo: Dict, nombre_archivo: str = None):
-        """Configura el gráfico cuando hay un grafo cargado"""
+    def configurar_grafico_con_grafo(self, grafo: nx.Graph, pos_grafo: Dict, nombre_archivo: str = None,
+                                     forzar: bool = False):
+        """Configura el gráfico cuando hay un grafo cargado
+        
+        La red (nodos, arcos, ejes) solo se redibuja cuando cambian el grafo, las
+        posiciones o el archivo; si solo cambió el atributo elegido se reemplazan
+        las etiquetas de los arcos. Si nada cambió no se hace nada (salvo con forzar=True).
+        """
+        firma = (id(grafo), id(pos_grafo), nombre_archivo)
+        atributo = self.combo_atributo.get()
+        if not forzar and firma == self._firma_grafico:
+            if atributo != self._atributo_etiquetas:
+                self._reemplazar_etiquetas_arcos()
+                self._solicitar_redibujo()
+            return
+        
         self.grafo_actual = grafo
         self.pos_grafo_actual = pos_grafo
         self.nombre_archivo_excel = nombre_archivo
+        self._firma_grafico = firma
+        self._dibujar_grafo_estatico()
+        self._solicitar_redibujo()  # El fondo se recaptura en el próximo redibujado completo
+    
+    def _dibujar_grafo_estatico(self):
+        """Dibuja desde cero la red del grafo actual, sus etiquetas y el scatter de ciclistas"""
+        grafo = self.grafo_actual
+        nombre_archivo = self.nombre_archivo_excel
         
         self.ax.clear()
+        self._edge_label_artists = []  # ax.clear() ya quitó los textos anteriores
         
         # Dibujar el grafo NetworkX
-        nx.draw(grafo, pos_grafo, ax=self.ax, 
+        nx.draw(grafo, self.pos_grafo_actual, ax=self.ax, 
                 with_labels=True, node_color="#2E86AB", edge_color="#AAB7B8",
                 node_size=800, font_size=10, font_color="white", font_weight='bold')
         
@@ -239,86 +472,164 @@ class PanelVisualizacion:
         
         # Scatter plot para ciclistas con zorder alto
         self.scatter = self.ax.scatter([], [], s=120, alpha=0.95, edgecolors='white', 
-                                     linewidth=2, zorder=10)
+                                     linewidth=2, zorder=10, animated=True)
+    
+    def _precalcular_geometria_arcos(self):
+        """Precalcula la lista de arcos y sus puntos medios una sola vez por grafo"""
+        clave = (id(self.grafo_actual), id(self.pos_grafo_actual))
+        if clave == self._grafo_geometria_id:
+            return
         
-        self.canvas.draw_idle()
+        # Mapear nodos a un arreglo contiguo de posiciones
+        nodos = list(self.pos_grafo_actual.keys())
+        indice_nodo = {nodo: i for i, nodo in enumerate(nodos)}
+        posiciones = np.array([self.pos_grafo_actual[n] for n in nodos], dtype=float).reshape(-1, 2)
+        
+        self._arcos_lista = [(u, v, datos) for u, v, datos in self.grafo_actual.edges(data=True)
+                             if u in indice_nodo and v in indice_nodo]
+        
+        if self._arcos_lista:
+            origenes = np.fromiter((indice_nodo[u] for u, _, _ in self._arcos_lista), dtype=int)
+            destinos = np.fromiter((indice_nodo[v] for _, v, _ in self._arcos_lista), dtype=int)
+            self._puntos_medios_arcos = 0.5 * (posiciones[origenes] + posiciones[destinos])
+        else:
+            self._puntos_medios_arcos = np.empty((0, 2))
+        
+        self._columnas_arcos = {}
+        self._etiquetas_cache = {}
+        self._grafo_geometria_id = clave
+    
+    def _reemplazar_etiquetas_arcos(self):
+        """Quita las etiquetas de arcos actuales y dibuja las del atributo elegido"""
+        for artista in self._edge_label_artists:
+            artista.remove()
+        self._edge_label_artists = []
+        self._agregar_etiquetas_arcos()
     
     def _agregar_etiquetas_arcos(self):
         """Agrega etiquetas a los arcos del grafo"""
+        self._atributo_etiquetas = self.combo_atributo.get()
         if not self.grafo_actual or not self.pos_grafo_actual:
             return
         
-        etiquetas = {}
-        atributo_seleccionado = self.combo_atributo.get()
-        
-        for edge in self.grafo_actual.edges(data=True):
-            origen, destino, datos = edge
-            valor_mostrar = self._obtener_valor_mostrar(datos, atributo_seleccionado)
-            
-            if valor_mostrar is not None:
-                etiquetas[(origen, destino)] = valor_mostrar
-        
-        # Dibujar etiquetas
-        nx.draw_networkx_edge_labels(self.grafo_actual, self.pos_grafo_actual, 
-                                   edge_labels=etiquetas, ax=self.ax, font_size=8)
+        self._precalcular_geometria_arcos()
+        
+        # Las etiquetas solo dependen del grafo y del atributo elegido
+        clave = (self._grafo_geometria_id, self.combo_atributo.get())
+        etiquetas = self._etiquetas_cache.get(clave)
+        if etiquetas is None:
+            etiquetas = self._calcular_etiquetas_arcos(clave[1])
+            self._etiquetas_cache[clave] = etiquetas
+        indices, textos = etiquetas
+        
+        # Crear los textos directamente en los puntos medios precalculados
+        for (x, y), valor_mostrar in zip(self._puntos_medios_arcos[indices].tolist(), textos):
+            self._edge_label_artists.append(
+                self.ax.text(x, y, valor_mostrar, fontproperties=self._fuente_etiquetas_arcos,
+                             ha='center', va='center', bbox=self._caja_etiquetas_arcos,
+                             zorder=1, clip_on=True)
+            )
+    
+    def _obtener_columna_arcos(self, columna: str) -> np.ndarray:
+        """Valores de un atributo para todos los arcos (NaN donde falta o no es numérico)
+        
+        Se extrae una sola vez por grafo y queda cacheado junto a la geometría.
+        """
+        valores = self._columnas_arcos.get(columna)
+        if valores is None:
+            valores = np.fromiter(
+                (self._a_flotante(datos.get(columna)) for _, _, datos in self._arcos_lista),
+                dtype=float, count=len(self._arcos_lista)
+            )
+            self._columnas_arcos[columna] = valores
+        return valores
     
-    def _obtener_valor_mostrar(self, datos_arco: Dict, atributo_seleccionado: str) -> Optional[str]:
-        """Obtiene el valor a mostrar para un arco según la selección"""
+    @staticmethod
+    def _a_flotante(valor) -> float:
+        """Convierte un valor de atributo a float (NaN si no es numérico)"""
+        try:
+            return float(valor)
+        except (TypeError, ValueError):
+            return np.nan
+    
+    def _calcular_etiquetas_arcos(self, atributo_seleccionado: str) -> Tuple[np.ndarray, List[str]]:
+        """Calcula en bloque los textos de las etiquetas de arcos
+        
+        Returns:
+            (índices de los arcos con etiqueta, textos correspondientes)
+        """
+        resolucion = self._resolucion_por_opcion.get(atributo_seleccionado)
+        if resolucion is None:
+            resolucion = self._resolver_atributo_etiqueta(atributo_seleccionado)
+        columnas, formato = resolucion
+        valores = np.full(len(self._arcos_lista), np.nan)
+        
+        # Rellenar por orden de preferencia solo donde aún no hay valor
+        for columna, minimo in columnas:
+            candidatos = self._obtener_columna_arcos(columna)
+            usar = np.isnan(valores) & ~np.isnan(candidatos)
+            if minimo is not None:
+                usar &= candidatos >= minimo
+            valores = np.where(usar, candidatos, valores)
+        
+        indices = np.flatnonzero(~np.isnan(valores))
+        if indices.size == 0:
+            return indices, []
+        
+        # Redes densas: muestreo regular para no superar MAX_ETIQUETAS_ARCOS textos
+        if indices.size > self.MAX_ETIQUETAS_ARCOS:
+            paso = -(-indices.size // self.MAX_ETIQUETAS_ARCOS)
+            indices = indices[::paso]
+        return indices, np.char.mod(formato, valores[indices]).tolist()
+    
+    def _resolver_atributo_etiqueta(self, atributo_seleccionado: str) -> Tuple[tuple, Optional[str]]:
+        """Columnas candidatas (columna, mínimo) y formato de etiqueta según la selección
+        
+        Se evalúa una vez por opción al cargar los atributos del grafo (ver
+        actualizar_controles_visualizacion); después basta una búsqueda en el dict.
+        """
         if not atributo_seleccionado:
-            return None
+            return (), None
         
         # Determinar qué valor mostrar según la selección
         if "Distancia Real (Simulación)" in atributo_seleccionado:
-            if 'distancia_real' in datos_arco:
-                return f"{datos_arco['distancia_real']:.0f}m"
-            elif 'distancia' in datos_arco:
-                return f"{datos_arco['distancia']:.0f}m"
-            elif 'weight' in datos_arco and datos_arco['weight'] >= 10.0:
-                return f"{datos_arco['weight']:.0f}m"
-                
+            return self.COLUMNAS_DISTANCIA_REAL, "%.0fm"
+        
         elif "Distancia Original" in atributo_seleccionado:
-            if 'distancia' in datos_arco:
-                return f"{datos_arco['distancia']:.0f}m"
-            elif 'weight' in datos_arco and datos_arco['weight'] >= 10.0:
-                return f"{datos_arco['weight']:.0f}m"
+            return self.COLUMNAS_DISTANCIA_ORIGINAL, "%.0fm"
         
-        else:
-            # Buscar atributo específico seleccionado
-            attr_name = atributo_seleccionado.split(' ', 1)[-1].lower()
-            
-            # Mapear nombres de atributos
-            attr_mapping = {
-                'seguridad': 'seguridad',
-                'luminosidad': 'luminosidad', 
-                'inclinacion': 'inclinacion',
-                'safety': 'seguridad',
-                'luminosity': 'luminosidad',
-                'inclination': 'inclinacion'
-            }
-            
-            attr_key = attr_mapping.get(attr_name, attr_name)
-            
-            if attr_key in datos_arco:
-                valor = datos_arco[attr_key]
-                if attr_key in ['seguridad', 'luminosidad']:
-                    return f"{valor:.1f}/10"
-                elif attr_key == 'inclinacion':
-                    return f"{valor:.1f}%"
-                else:
-                    return f"{valor:.2f}"
+        # Buscar atributo específico seleccionado
+        attr_name = atributo_seleccionado.split(' ', 1)[-1].lower()
         
-        return None
+        # Mapear nombres de atributos (los que no tienen alias se usan tal cual)
+        attr_key = self.ALIAS_ATRIBUTOS.get(attr_name, attr_name)
+        return ((attr_key, None),), self.FORMATOS_ATRIBUTO.get(attr_key, self.FORMATO_ATRIBUTO_GENERICO)
     
     def actualizar_visualizacion(self, ciclistas_activos: Dict[str, List] = None):
         """Actualiza la visualización con los datos actuales"""
-        if not hasattr(self, 'scatter'):
+        if self.scatter is None:
+            return
+        
+        if self._dibujado_suspendido:
+            # Se aplicará una sola vez al terminar la suspensión
+            self._ciclistas_pendientes = ciclistas_activos
+            self._visualizacion_pendiente = True
+            return
+        
+        # Control de frecuencia: dentro del intervalo solo se guarda el último cuadro y
+        # se programa una única aplicación diferida, para no perder el estado final
+        tiempo_actual = time.monotonic()
+        restante = self._intervalo_actualizacion - (tiempo_actual - self._ultima_actualizacion)
+        if restante > 0:
+            self._cuadro_pendiente = ciclistas_activos
+            if self._id_cuadro_pendiente is None:
+                self._id_cuadro_pendiente = self.canvas.get_tk_widget().after(
+                    int(restante * 1000) + 1, self._aplicar_cuadro_pendiente
+                )
             return
         
-        # Control de frecuencia de actualización para optimizar rendimiento
-        import time
-        tiempo_actual = time.time()
-        if tiempo_actual - self._ultima_actualizacion < self._intervalo_actualizacion:
-            return  # Saltar esta actualización si es muy frecuente
+        # Este cuadro es más reciente que cualquiera pendiente
+        self._descartar_cuadro_pendiente()
         
         self._ultima_actualizacion = tiempo_actual
         
@@ -333,130 +644,98 @@ class PanelVisualizacion:
             }
         
         try:
-            if not ciclistas_activos['coordenadas']:
-                # No hay ciclistas activos para mostrar
-                import numpy as np
-                self.scatter.set_offsets(np.empty((0, 2)))  # Array 2D vacío
-                self.canvas.draw_idle()
-                return
-            
-            # Verificar que las coordenadas tengan el formato correcto
-            coordenadas = ciclistas_activos['coordenadas']
-            
-            if not coordenadas or len(coordenadas) == 0:
-                import numpy as np
-                self.scatter.set_offsets(np.empty((0, 2)))  # Array 2D vacío
-                self.canvas.draw_idle()
-                return
+            # Todas las posiciones en un único arreglo (N, 2) para el PathCollection
+            offsets = self._coordenadas_a_offsets(ciclistas_activos['coordenadas'])
+            self.scatter.set_offsets(offsets)
             
-            # Verificar que las coordenadas sean una lista
-            if not isinstance(coordenadas, list):
-                print(f"⚠️ Coordenadas no es una lista: {type(coordenadas)}")
-                import numpy as np
-                self.scatter.set_offsets(np.empty((0, 2)))  # Array 2D vacío
-                self.canvas.draw_idle()
+            if len(offsets) == 0:
+                # No hay ciclistas activos para mostrar: si el cuadro anterior tampoco
+                # tenía, la pantalla ya está al día y no hace falta blitear
+                if self._ciclistas_dibujados:
+                    self._dibujar_ciclistas()
+                    self._ciclistas_dibujados = 0
                 return
             
-            # Verificar que la lista no esté vacía
-            if len(coordenadas) == 0:
-                import numpy as np
-                self.scatter.set_offsets(np.empty((0, 2)))  # Array 2D vacío
-                self.canvas.draw_idle()
-                return
-            
-            # Verificar que el primer elemento sea una tupla válida
-            # Manejar tanto listas como arrays de numpy
-            try:
-                primer_elemento = coordenadas[0]
-                if not isinstance(primer_elemento, (tuple, list)) or len(primer_elemento) != 2:
-                    print(f"⚠️ Formato de coordenadas inválido: {type(primer_elemento)} - {primer_elemento}")
-                    import numpy as np
-                    self.scatter.set_offsets(np.empty((0, 2)))  # Array 2D vacío
-                    self.canvas.draw_idle()
-                    return
-            except (IndexError, TypeError) as e:
-                print(f"⚠️ Error accediendo a coordenadas[0]: {e}")
-                import numpy as np
-                self.scatter.set_offsets(np.empty((0, 2)))  # Array 2D vacío
-                self.canvas.draw_idle()
-                return
-            
-            # Extraer coordenadas de ciclistas activos
-            try:
-                # Convertir a lista si es un array de numpy
-                if hasattr(coordenadas, 'tolist'):
-                    coordenadas = coordenadas.tolist()
-                elif not isinstance(coordenadas, list):
-                    coordenadas = list(coordenadas)
-                
-                # Verificar que todas las coordenadas sean tuplas válidas
-                coordenadas_validas = []
-                for coord in coordenadas:
-                    if isinstance(coord, (tuple, list)) and len(coord) == 2:
-                        try:
-                            x_val = float(coord[0])
-                            y_val = float(coord[1])
-                            coordenadas_validas.append((x_val, y_val))
-                        except (ValueError, TypeError):
-                            print(f"⚠️ Coordenada inválida ignorada: {coord}")
-                            continue
-                    else:
-                        print(f"⚠️ Formato de coordenada inválido ignorado: {coord}")
-                        continue
-                
-                if not coordenadas_validas:
-                    print("⚠️ No hay coordenadas válidas para mostrar")
-                    import numpy as np
-                    self.scatter.set_offsets(np.empty((0, 2)))  # Array 2D vacío
-                    self.canvas.draw_idle()
-                    return
-                
-                x, y = zip(*coordenadas_validas)
-            except (ValueError, TypeError) as e:
-                print(f"⚠️ Error procesando coordenadas: {e}")
-                import numpy as np
-                self.scatter.set_offsets(np.empty((0, 2)))  # Array 2D vacío
-                self.canvas.draw_idle()
-                return
-            
-            # Actualizar posiciones de los ciclistas activos
-            self.scatter.set_offsets(list(zip(x, y)))
-            
             # Ajustar colores para que coincidan con el número de coordenadas válidas
-            num_coordenadas_validas = len(coordenadas_validas)
-            colores_ajustados = ciclistas_activos['colores'][:num_coordenadas_validas]
-            if len(colores_ajustados) < num_coordenadas_validas:
-                # Si no hay suficientes colores, usar el último color disponible
-                color_default = colores_ajustados[-1] if colores_ajustados else '#6C757D'
-                colores_ajustados.extend([color_default] * (num_coordenadas_validas - len(colores_ajustados)))
-            
-            self.scatter.set_color(colores_ajustados)
-            
-            # Configurar apariencia de los ciclistas activos
-            self.scatter.set_sizes([120] * num_coordenadas_validas)
-            self.scatter.set_alpha(0.95)
-            
-            # Configurar bordes según si hay grafo o no
-            if self.grafo_actual:
-                # Con grafo: bordes blancos para contraste
-                self.scatter.set_edgecolors('white')
-                self.scatter.set_linewidth(2)
+            num_coordenadas_validas = len(offsets)
+            colores_rgba = ciclistas_activos.get('colores_rgba')
+            if colores_rgba is not None and len(colores_rgba) == num_coordenadas_validas:
+                # Colores ya parseados por el simulador: sin conversión de cadenas por cuadro
+                self.scatter.set_facecolors(colores_rgba)
             else:
-                # Sin grafo: bordes blancos para contraste con la red básica
-                self.scatter.set_edgecolors('white')
-                self.scatter.set_linewidth(2)
+                colores_ajustados = ciclistas_activos['colores'][:num_coordenadas_validas]
+                if len(colores_ajustados) < num_coordenadas_validas:
+                    # Si no hay suficientes colores, usar el último color disponible
+                    color_default = colores_ajustados[-1] if colores_ajustados else '#6C757D'
+                    colores_ajustados.extend([color_default] * (num_coordenadas_validas - len(colores_ajustados)))
+                
+                # Solo el relleno: set_color también pisaría el borde blanco del scatter
+                self.scatter.set_facecolors(colores_ajustados)
+            
+            # Tamaño (120), alpha (0.95) y borde blanco se fijan al crear el scatter y no
+            # cambian entre cuadros: volver a asignarlos solo invalidaría el artista
             
             # Actualizar canvas de forma optimizada
-            self.canvas.draw_idle()  # draw_idle es más eficiente que draw()
+            self._dibujar_ciclistas()  # Solo se repintan los ciclistas sobre el fondo cacheado
+            self._ciclistas_dibujados = num_coordenadas_validas
             
         except Exception as e:
             print(f"⚠️ Error actualizando visualización: {e}")
             # En caso de error, intentar redibujar el gráfico
             if self.grafo_actual:
-                self.configurar_grafico_con_grafo(self.grafo_actual, self.pos_grafo_actual, self.nombre_archivo_excel)
+                self.configurar_grafico_con_grafo(self.grafo_actual, self.pos_grafo_actual,
+                                                  self.nombre_archivo_excel, forzar=True)
             else:
                 self.configurar_grafico_inicial()
     
+    def _descartar_cuadro_pendiente(self):
+        """Cancela la aplicación diferida del último cuadro retenido, si existe"""
+        if self._id_cuadro_pendiente is not None:
+            self.canvas.get_tk_widget().after_cancel(self._id_cuadro_pendiente)
+            self._id_cuadro_pendiente = None
+        self._cuadro_pendiente = None
+    
+    def _aplicar_cuadro_pendiente(self):
+        """Aplica el último cuadro retenido por el control de frecuencia"""
+        self._id_cuadro_pendiente = None
+        ciclistas, self._cuadro_pendiente = self._cuadro_pendiente, None
+        self.actualizar_visualizacion(ciclistas)
+    
+    @staticmethod
+    def _coordenadas_a_offsets(coordenadas) -> np.ndarray:
+        """Convierte las coordenadas de los ciclistas en un arreglo (N, 2) de floats
+        
+        El caso normal (lista de pares o arreglo de NumPy) se convierte en una sola
+        llamada; solo si los datos vienen mal formados se filtran uno a uno.
+        """
+        if coordenadas is None or len(coordenadas) == 0:
+            return np.empty((0, 2))
+        
+        try:
+            offsets = np.asarray(coordenadas, dtype=float)
+            if offsets.ndim == 2 and offsets.shape[1] == 2:
+                return offsets
+        except (ValueError, TypeError):
+            pass
+        
+        # Datos irregulares: conservar solo los pares numéricos válidos
+        coordenadas_validas = []
+        for coord in coordenadas:
+            if isinstance(coord, (tuple, list)) and len(coord) == 2:
+                try:
+                    coordenadas_validas.append((float(coord[0]), float(coord[1])))
+                except (ValueError, TypeError):
+                    pass
+        
+        # Un solo aviso por cuadro (no una línea por coordenada descartada)
+        descartadas = len(coordenadas) - len(coordenadas_validas)
+        if descartadas:
+            print(f"⚠️ {descartadas} coordenadas inválidas ignoradas")
+        
+        if not coordenadas_validas:
+            return np.empty((0, 2))
+        return np.array(coordenadas_validas, dtype=float)
+    
     def limpiar_mensaje_inicial(self):
         """Limpia el mensaje inicial para mostrar la simulación"""
         # Limpiar el texto del mensaje inicial
@@ -464,7 +743,7 @@ class PanelVisualizacion:
             if 'Simulador de Ciclorutas v2.0' in text.get_text():
                 text.remove()
                 break
-        self.canvas.draw_idle()
+        self._solicitar_redibujo()
     
     def actualizar_controles_visualizacion(self, atributos_disponibles: List[str]):
         """Actualiza la lista desplegable con los atributos disponibles"""
@@ -476,27 +755,18 @@ class PanelVisualizacion:
             self.info_simulacion_label.config(text="[INFO] Carga un grafo para ver sus atributos reales")
             return
         
-        # Crear lista de opciones para el combobox
-        opciones = []
-        
-        # Agregar opciones especiales solo si existen en el grafo
-        if 'distancia_real' in atributos_disponibles:
-            opciones.append("[DISTANCIA] Distancia Real (Simulación)")
-        if 'distancia' in atributos_disponibles:
-            opciones.append("[DISTANCIA] Distancia Original")
-        
-        # Agregar todos los atributos individuales que están realmente en el grafo
-        for attr in sorted(atributos_disponibles):
-            if attr not in ['distancia_real', 'distancia']:
-                # Agregar prefijo según el tipo de atributo
-                if attr.lower() in ['seguridad', 'safety']:
-                    opciones.append(f"[SEGURIDAD] {attr.title()}")
-                elif attr.lower() in ['luminosidad', 'luminosity', 'light']:
-                    opciones.append(f"[LUZ] {attr.title()}")
-                elif attr.lower() in ['inclinacion', 'inclination', 'slope']:
-                    opciones.append(f"[MONTAÑA] {attr.title()}")
-                else:
-                    opciones.append(f"[DATOS] {attr.title()}")
+        # Las opciones (y su resolución) solo dependen del conjunto de atributos: se
+        # construyen una vez por grafo y se reutilizan en las siguientes llamadas
+        clave = frozenset(atributos_disponibles)
+        if clave != self._clave_opciones_combo:
+            opciones = self._construir_opciones_combo(atributos_disponibles)
+            
+            # Tabla de despacho opción -> (columnas, formato), resuelta una sola vez por carga
+            self._resolucion_por_opcion = {opcion: self._resolver_atributo_etiqueta(opcion)
+                                           for opcion in opciones}
+            self._opciones_combo = opciones
+            self._clave_opciones_combo = clave
+        opciones = self._opciones_combo
         
         # Actualizar combobox
         self.combo_atributo['values'] = opciones
@@ -519,6 +789,25 @@ class PanelVisualizacion:
         else:
             self.info_simulacion_label.config(text="[INFO] Simulación: distancias reales | Visualización: solo distancias")
     
+    def _construir_opciones_combo(self, atributos_disponibles: List[str]) -> List[str]:
+        """Arma las opciones del combobox para un conjunto de atributos de arcos"""
+        opciones = []
+        
+        # Agregar opciones especiales solo si existen en el grafo
+        if 'distancia_real' in atributos_disponibles:
+            opciones.append("[DISTANCIA] Distancia Real (Simulación)")
+        if 'distancia' in atributos_disponibles:
+            opciones.append("[DISTANCIA] Distancia Original")
+        
+        # Agregar todos los atributos individuales que están realmente en el grafo,
+        # con el prefijo según el tipo de atributo
+        for attr in sorted(atributos_disponibles):
+            if attr not in ('distancia_real', 'distancia'):
+                prefijo = self.PREFIJOS_ATRIBUTO.get(attr.lower(), self.PREFIJO_ATRIBUTO_GENERICO)
+                opciones.append(f"{prefijo} {attr.title()}")
+        
+        return opciones
+    
     def obtener_atributo_seleccionado(self) -> str:
         """Retorna el atributo actualmente seleccionado"""
         return self.combo_atributo.get()
@@ -529,15 +818,17 @@ class PanelVisualizacion:
     
     def limpiar_visualizacion(self):
         """Limpia la visualización actual"""
-        if hasattr(self, 'scatter'):
-            import numpy as np
+        if self.scatter is not None:
+            self._descartar_cuadro_pendiente()
             self.scatter.set_offsets(np.empty((0, 2)))  # Array 2D vacío
-            self.canvas.draw_idle()
+            self._dibujar_ciclistas()
+            self._ciclistas_dibujados = 0
     
     def redibujar_grafo(self):
         """Redibuja el grafo con la configuración actual"""
         if self.grafo_actual and self.pos_grafo_actual:
-            self.configurar_grafico_con_grafo(self.grafo_actual, self.pos_grafo_actual, self.nombre_archivo_excel)
+            self.configurar_grafico_con_grafo(self.grafo_actual, self.pos_grafo_actual,
+                                              self.nombre_archivo_excel, forzar=True)
     
     def obtener_estado_panel(self) -> Dict[str, Any]:
         """Retorna el estado actual del panel"""
@@ -8,8 +8,6 @@ del Top 5 de rutas más concurridas al finalizar la simulación.
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from typing import Optional
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import os
 
 from ..utils.estilo_utils import EstiloUtils
@@ -108,8 +106,12 @@ class VentanaGraficoOcupacion:
                 self.ventana.destroy()
                 return
             
-            # Crear figura de matplotlib
-            self.fig_grafico, self.ax_grafico = plt.subplots(figsize=(12, 7))
+            # Crear figura de matplotlib (importación diferida y sin pyplot)
+            from matplotlib.figure import Figure
+            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+            
+            self.fig_grafico = Figure(figsize=(12, 7))
+            self.ax_grafico = self.fig_grafico.add_subplot()
             self.fig_grafico.patch.set_facecolor('#f8f9fa')
             self.ax_grafico.set_facecolor('#ffffff')
             
@@ -168,9 +170,11 @@ class VentanaGraficoOcupacion:
             self.fig_grafico.tight_layout()
             
             # Crear canvas para tkinter
+            # draw_idle: el primer render se hace ya con el tamaño final tras empaquetar
+            # (un draw() aquí rasterizaría la figura dos veces: antes y después del pack)
             self.canvas_grafico = FigureCanvasTkAgg(self.fig_grafico, self.frame_grafico)
-            self.canvas_grafico.draw()
             self.canvas_grafico.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+            self.canvas_grafico.draw_idle()
             
         except Exception as e:
             messagebox.showerror("Error", f"Error al generar el gráfico: {str(e)}")
@@ -206,7 +210,7 @@ class VentanaGraficoOcupacion:
     
     def _cerrar_ventana(self):
         """Cierra la ventana y limpia recursos"""
-        if self.fig_grafico:
-            plt.close(self.fig_grafico)
+        # La figura no está registrada en pyplot: basta con soltar la referencia
+        self.fig_grafico = None
         self.ventana.destroy()
 
@@ -5,13 +5,16 @@ Este módulo contiene funciones para cargar, validar y procesar
 archivos Excel con datos de grafos de ciclorutas.
 """
 
-import pandas as pd
+import numpy as np
 import networkx as nx
 import os
-import math
-from typing import Dict, List, Tuple, Optional, Any
+from typing import TYPE_CHECKING, Dict, List, Tuple, Optional, Any
 from tkinter import filedialog, messagebox
 
+# pandas tarda en importarse: se carga al leer o exportar un archivo, no al abrir la interfaz
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 class ArchivoUtils:
     """Utilidades para manejo de archivos Excel"""
@@ -44,77 +47,88 @@ class ArchivoUtils:
             if not os.path.exists(archivo):
                 return False, "El archivo no existe"
             
-            # Leer el archivo Excel
-            excel_file = pd.ExcelFile(archivo)
-            hojas_disponibles = excel_file.sheet_names
-            
-            # Verificar hojas obligatorias
-            hojas_obligatorias = ['NODOS', 'ARCOS']
-            hojas_faltantes = [hoja for hoja in hojas_obligatorias if hoja not in hojas_disponibles]
-            
-            if hojas_faltantes:
-                return False, f"Faltan las hojas obligatorias: {', '.join(hojas_faltantes)}"
-            
-            # Validar estructura de cada hoja obligatoria
-            for hoja in hojas_obligatorias:
-                df = pd.read_excel(archivo, sheet_name=hoja, engine="openpyxl")
-                columnas_esperadas = ArchivoUtils.HOJAS_ESPERADAS[hoja]
-                
-                # Verificar que al menos una columna esperada esté presente
-                columnas_presentes = [col for col in columnas_esperadas if col in df.columns]
-                if not columnas_presentes:
-                    return False, f"La hoja '{hoja}' no tiene las columnas esperadas: {', '.join(columnas_esperadas)}"
-            
-            # Validar hoja PERFILES si existe (debe tener PERFILES y PROBABILIDAD)
-            if "PERFILES" in hojas_disponibles:
-                df_perfiles = pd.read_excel(archivo, sheet_name="PERFILES", engine="openpyxl")
-                columnas_perfiles_obligatorias = ['PERFILES', 'PROBABILIDAD']
-                columnas_faltantes = [col for col in columnas_perfiles_obligatorias if col not in df_perfiles.columns]
-                
-                if columnas_faltantes:
-                    return False, f"La hoja PERFILES debe tener las columnas obligatorias: {', '.join(columnas_faltantes)}"
-                
-                # Validar que las probabilidades sumen 1.0
-                try:
-                    probabilidades = df_perfiles['PROBABILIDAD'].values
-                    suma_probabilidades = sum(probabilidades)
-                    if abs(suma_probabilidades - 1.0) > 0.01:
-                        return False, f"Las probabilidades en PERFILES suman {suma_probabilidades:.4f}, deben sumar 1.0"
-                except Exception:
-                    return False, "Error al validar probabilidades en PERFILES"
-            
-            return True, "Archivo válido"
+            # Leer las hojas a validar en una sola pasada del libro
+            hojas = ArchivoUtils._leer_hojas_excel(archivo, ["NODOS", "ARCOS", "PERFILES"])
+            return ArchivoUtils._validar_hojas(hojas)
             
         except Exception as e:
             return False, f"Error al validar el archivo: {str(e)}"
     
+    @staticmethod
+    def _validar_hojas(hojas: Dict[str, 'pd.DataFrame']) -> Tuple[bool, str]:
+        """Valida la estructura de las hojas ya leídas del libro"""
+        # Verificar hojas obligatorias
+        hojas_obligatorias = ['NODOS', 'ARCOS']
+        hojas_faltantes = [hoja for hoja in hojas_obligatorias if hoja not in hojas]
+        
+        if hojas_faltantes:
+            return False, f"Faltan las hojas obligatorias: {', '.join(hojas_faltantes)}"
+        
+        # Validar estructura de cada hoja obligatoria
+        for hoja in hojas_obligatorias:
+            df = hojas[hoja]
+            columnas_esperadas = ArchivoUtils.HOJAS_ESPERADAS[hoja]
+            
+            # Verificar que al menos una columna esperada esté presente
+            columnas_presentes = [col for col in columnas_esperadas if col in df.columns]
+            if not columnas_presentes:
+                return False, f"La hoja '{hoja}' no tiene las columnas esperadas: {', '.join(columnas_esperadas)}"
+        
+        # Validar hoja PERFILES si existe (debe tener PERFILES y PROBABILIDAD)
+        df_perfiles = hojas.get("PERFILES")
+        if df_perfiles is not None:
+            columnas_perfiles_obligatorias = ['PERFILES', 'PROBABILIDAD']
+            columnas_faltantes = [col for col in columnas_perfiles_obligatorias if col not in df_perfiles.columns]
+            
+            if columnas_faltantes:
+                return False, f"La hoja PERFILES debe tener las columnas obligatorias: {', '.join(columnas_faltantes)}"
+            
+            # Validar que las probabilidades sumen 1.0
+            try:
+                probabilidades = df_perfiles['PROBABILIDAD'].values
+                suma_probabilidades = sum(probabilidades)
+                if abs(suma_probabilidades - 1.0) > 0.01:
+                    return False, f"Las probabilidades en PERFILES suman {suma_probabilidades:.4f}, deben sumar 1.0"
+            except Exception:
+                return False, "Error al validar probabilidades en PERFILES"
+        
+        return True, "Archivo válido"
+    
     @staticmethod
     def cargar_datos_desde_excel(archivo: str) -> Tuple[Optional[nx.Graph], Optional[Dict], 
-                                                       Optional[pd.DataFrame], Optional[pd.DataFrame], str]:
+                                                       Optional['pd.DataFrame'], Optional['pd.DataFrame'], str]:
         """Carga datos desde archivo Excel y crea el grafo"""
         try:
-            # Validar archivo primero
-            es_valido, mensaje = ArchivoUtils.validar_archivo_excel(archivo)
+            if not os.path.exists(archivo):
+                return None, None, None, None, "El archivo no existe"
+            
+            # Leer todas las hojas en una sola pasada del libro (modo solo lectura) y
+            # validarlas sobre lo ya leído, sin volver a abrir el archivo
+            hojas = ArchivoUtils._leer_hojas_excel(archivo, ["NODOS", "ARCOS", "PERFILES", "RUTAS"])
+            es_valido, mensaje = ArchivoUtils._validar_hojas(hojas)
             if not es_valido:
                 return None, None, None, None, mensaje
             
-            # Leer datos del Excel
-            nodos_df = pd.read_excel(archivo, sheet_name="NODOS", engine="openpyxl")
-            arcos_df = pd.read_excel(archivo, sheet_name="ARCOS", engine="openpyxl")
+            nodos_df = hojas["NODOS"]
+            arcos_df = hojas["ARCOS"]
+            
+            # Validar el esquema antes de construir el grafo para no dejarlo a medias
+            es_valido, mensaje = ArchivoUtils._validar_esquema_grafo(nodos_df, arcos_df)
+            if not es_valido:
+                return None, None, None, None, mensaje
             
             # Verificar si hay hojas adicionales
-            excel_file = pd.ExcelFile(archivo)
-            perfiles_df = None
-            rutas_df = None
+            perfiles_df = hojas.get("PERFILES")
+            rutas_df = hojas.get("RUTAS")
             
-            if "PERFILES" in excel_file.sheet_names:
-                perfiles_df = pd.read_excel(archivo, sheet_name="PERFILES", engine="openpyxl")
+            if perfiles_df is not None:
                 print("✅ Hoja PERFILES encontrada")
             
-            if "RUTAS" in excel_file.sheet_names:
-                rutas_df = pd.read_excel(archivo, sheet_name="RUTAS", engine="openpyxl")
+            if rutas_df is not None:
                 print("✅ Hoja RUTAS encontrada")
             
+            import pandas as pd
+            
             # Crear grafo NetworkX
             G = nx.Graph()
             
@@ -122,25 +136,22 @@ class ArchivoUtils:
             tiene_lat_lon = 'LAT' in nodos_df.columns and 'LON' in nodos_df.columns
             coordenadas_nodos = {}
             
-            # Agregar nodos y almacenar coordenadas si existen
+            # Agregar nodos en bloque y almacenar coordenadas si existen
             columna_nodos = ArchivoUtils._encontrar_columna_nodos(nodos_df)
-            for idx, fila in nodos_df.iterrows():
-                nodo = fila[columna_nodos]
-                G.add_node(nodo)
-                
-                # Guardar coordenadas si existen
-                if tiene_lat_lon:
-                    try:
-                        lat = float(fila['LAT'])
-                        lon = float(fila['LON'])
+            nodos = nodos_df[columna_nodos].tolist()
+            G.add_nodes_from(nodos)
+            
+            if tiene_lat_lon:
+                # Conversión vectorizada: valores no numéricos o vacíos quedan como NaN
+                lats = pd.to_numeric(nodos_df['LAT'], errors='coerce')
+                lons = pd.to_numeric(nodos_df['LON'], errors='coerce')
+                validos = (lats.notna() & lons.notna()).tolist()
+                for nodo, lat, lon, valido in zip(nodos, lats.tolist(), lons.tolist(), validos):
+                    if valido:
                         coordenadas_nodos[nodo] = (lat, lon)
                         G.nodes[nodo]['lat'] = lat
                         G.nodes[nodo]['lon'] = lon
-                        print(f"✅ Nodo agregado: {nodo} (LAT: {lat:.6f}, LON: {lon:.6f})")
-                    except (ValueError, KeyError):
-                        print(f"✅ Nodo agregado: {nodo} (sin coordenadas válidas)")
-                else:
-                    print(f"✅ Nodo agregado: {nodo}")
+            print(f"✅ Nodos agregados: {G.number_of_nodes()}")
             
             if tiene_lat_lon:
                 total_nodos = len(G.nodes())
@@ -156,6 +167,8 @@ class ArchivoUtils:
                 else:
                     print(f"✅ Todos los nodos tienen coordenadas geográficas - se usará organización espacial")
             
+            from Simulador.utils.grafo_utils import GrafoUtils
+            
             # Verificar atributos disponibles en arcos (dinámicamente)
             atributos_disponibles = ArchivoUtils._verificar_atributos_arcos(arcos_df)
             print(f"📊 Atributos encontrados en ARCOS: {atributos_disponibles}")
@@ -174,30 +187,24 @@ class ArchivoUtils:
                     print("📐 Calculando distancias euclidianas desde coordenadas LAT/LON...")
                 
                 # Calcular distancias euclidianas desde coordenadas
+                # Calcular en bloque (Haversine vectorizado); arcos con algún nodo sin
+                # coordenadas usan 100 metros por defecto
                 col_origen, col_destino = ArchivoUtils._encontrar_columnas_arco(arcos_df)
-                distancias_calculadas = []
+                distancias_calculadas, arcos_sin_coordenadas = GrafoUtils.calcular_distancias_arcos(
+                    arcos_df[col_origen].tolist(), arcos_df[col_destino].tolist(), coordenadas_nodos
+                )
                 
-                for _, fila in arcos_df.iterrows():
-                    origen = fila[col_origen]
-                    destino = fila[col_destino]
-                    
-                    if origen in coordenadas_nodos and destino in coordenadas_nodos:
-                        lat1, lon1 = coordenadas_nodos[origen]
-                        lat2, lon2 = coordenadas_nodos[destino]
-                        distancia = ArchivoUtils._calcular_distancia_euclidiana(lat1, lon1, lat2, lon2)
-                        distancias_calculadas.append(distancia)
-                    else:
-                        # Si faltan coordenadas para algún nodo, usar distancia por defecto
-                        distancias_calculadas.append(100.0)  # 100 metros por defecto
-                        print(f"⚠️ Nodo {origen if origen not in coordenadas_nodos else destino} sin coordenadas, usando distancia por defecto")
+                if arcos_sin_coordenadas:
+                    print(f"⚠️ {arcos_sin_coordenadas} arcos con nodos sin coordenadas, usando distancia por defecto")
                 
                 # Reemplazar/Agregar columna DISTANCIA con valores calculados
                 arcos_df['DISTANCIA'] = distancias_calculadas
                 if 'DISTANCIA' not in atributos_disponibles:
                     atributos_disponibles.append('DISTANCIA')
                 print(f"✅ Distancias euclidianas calculadas: {len(distancias_calculadas)} arcos")
-                print(f"   Rango: {min(distancias_calculadas):.1f} - {max(distancias_calculadas):.1f} metros")
-                print(f"   Promedio: {sum(distancias_calculadas)/len(distancias_calculadas):.1f} metros")
+                if len(distancias_calculadas):
+                    print(f"   Rango: {distancias_calculadas.min():.1f} - {distancias_calculadas.max():.1f} metros")
+                    print(f"   Promedio: {distancias_calculadas.mean():.1f} metros")
             
             # Preparar datos - calcular distancia real si hay DISTANCIA
             if 'DISTANCIA' in atributos_disponibles:
@@ -207,41 +214,33 @@ class ArchivoUtils:
             # Agregar arcos con todos los atributos
             col_origen, col_destino = ArchivoUtils._encontrar_columnas_arco(arcos_df)
             
-            for _, fila in arcos_df.iterrows():
-                origen, destino = fila[col_origen], fila[col_destino]
-                
-                # Crear diccionario de atributos
-                atributos = {}
-                for col in arcos_df.columns:
-                    if col not in [col_origen, col_destino]:
-                        atributos[col.lower()] = fila[col]
-                
-                # Configurar pesos para diferentes usos:
-                # - weight: para algoritmos de pathfinding (se calculará dinámicamente por usuario)
-                # - distancia_real: para simulación de tiempos (distancia real ajustada)
-                if 'distancia' in atributos:
-                    atributos['weight'] = atributos['distancia']  # Usar distancia como peso base
-                
-                # Asegurar que siempre tengamos distancia_real para simulación
-                if 'distancia_real' not in atributos and 'distancia' in atributos:
-                    atributos['distancia_real'] = atributos['distancia']
-                
-                G.add_edge(origen, destino, **atributos)
-                
-                # Mostrar información del arco
-                info_arco = f"{origen} -> {destino}"
-                if 'distancia' in atributos:
-                    info_arco += f" (dist: {atributos['distancia']:.0f})"
-                if 'peso_compuesto' in atributos:
-                    info_arco += f" (peso: {atributos['peso_compuesto']:.3f})"
-                print(f"✅ Arco agregado: {info_arco}")
+            columnas_atributos = [col for col in arcos_df.columns if col not in (col_origen, col_destino)]
+            claves_atributos = [str(col).lower() for col in columnas_atributos]
+            
+            # Configurar pesos para diferentes usos:
+            # - weight: para algoritmos de pathfinding (se calculará dinámicamente por usuario)
+            # - distancia_real: para simulación de tiempos (distancia real ajustada)
+            usar_distancia_como_peso = 'distancia' in claves_atributos
+            copiar_distancia_real = usar_distancia_como_peso and 'distancia_real' not in claves_atributos
+            
+            def _generar_arcos():
+                filas = arcos_df[[col_origen, col_destino] + columnas_atributos].itertuples(index=False, name=None)
+                for origen, destino, *valores in filas:
+                    atributos = dict(zip(claves_atributos, valores))
+                    if usar_distancia_como_peso:
+                        atributos['weight'] = atributos['distancia']  # Usar distancia como peso base
+                    if copiar_distancia_real:
+                        atributos['distancia_real'] = atributos['distancia']
+                    yield origen, destino, atributos
+            
+            G.add_edges_from(_generar_arcos())
+            print(f"✅ Arcos agregados: {G.number_of_edges()}")
             
             # Verificar que el grafo tenga al menos 2 nodos
             if len(G.nodes()) < 2:
                 return None, None, None, None, "El grafo debe tener al menos 2 nodos para la simulación"
             
             # Calcular posiciones del grafo usando coordenadas si están disponibles
-            from Simulador.utils.grafo_utils import GrafoUtils
             pos = GrafoUtils.calcular_posiciones_grafo(G, seed=42)
             
             return G, pos, perfiles_df, rutas_df, "Archivo cargado exitosamente"
@@ -250,7 +249,109 @@ class ArchivoUtils:
             return None, None, None, None, f"Error al cargar el archivo: {str(e)}"
     
     @staticmethod
-    def _encontrar_columna_nodos(nodos_df: pd.DataFrame) -> str:
+    def _leer_hojas_excel(archivo: str, hojas: List[str]) -> Dict[str, 'pd.DataFrame']:
+        """Lee las hojas indicadas abriendo el libro una sola vez
+        
+        Si python-calamine está instalado se usa su lector (Rust), mucho más
+        rápido; si no, openpyxl en modo solo lectura, que consume las filas en
+        streaming sin materializar el libro completo en memoria.
+        
+        Args:
+            archivo: Ruta del archivo Excel
+            hojas: Nombres de las hojas a leer (las que no existan se omiten)
+            
+        Returns:
+            Diccionario {nombre_hoja: DataFrame} solo con las hojas presentes
+        """
+        try:
+            from python_calamine import CalamineWorkbook
+        except ImportError:  # python-calamine es opcional
+            CalamineWorkbook = None
+        
+        resultado = {}
+        if CalamineWorkbook is not None:
+            libro = CalamineWorkbook.from_path(archivo)
+            for hoja in hojas:
+                if hoja in libro.sheet_names:
+                    filas = libro.get_sheet_by_name(hoja).to_python()
+                    resultado[hoja] = ArchivoUtils._construir_dataframe_hoja(
+                        ArchivoUtils._normalizar_fila_calamine(fila) for fila in filas
+                    )
+            return resultado
+        
+        from openpyxl import load_workbook
+        
+        libro = load_workbook(archivo, read_only=True, data_only=True)
+        try:
+            for hoja in hojas:
+                if hoja in libro.sheetnames:
+                    resultado[hoja] = ArchivoUtils._construir_dataframe_hoja(
+                        libro[hoja].iter_rows(values_only=True)
+                    )
+        finally:
+            libro.close()
+        
+        return resultado
+    
+    @staticmethod
+    def _normalizar_fila_calamine(fila: List[Any]) -> tuple:
+        """Adapta una fila de calamine a los valores que entrega openpyxl
+        
+        Calamine devuelve '' para celdas vacías y float para todo número; se
+        convierten a None y a int (si el número es entero) para que los IDs de
+        nodos coincidan con los de las demás hojas.
+        """
+        return tuple(
+            None if valor == '' else
+            int(valor) if isinstance(valor, float) and valor.is_integer() else
+            valor
+            for valor in fila
+        )
+    
+    @staticmethod
+    def _construir_dataframe_hoja(filas) -> 'pd.DataFrame':
+        """Construye el DataFrame de una hoja a partir de sus filas (la primera es el encabezado)"""
+        import pandas as pd
+        
+        filas = iter(filas)
+        encabezado = next(filas, None)
+        if encabezado is None:
+            return pd.DataFrame()
+        
+        # Recortar columnas vacías al final del encabezado
+        encabezado = list(encabezado)
+        while encabezado and encabezado[-1] is None:
+            encabezado.pop()
+        num_columnas = len(encabezado)
+        columnas = [col if col is not None else f"Unnamed: {i}" for i, col in enumerate(encabezado)]
+        
+        # Descartar filas completamente vacías (formato residual de Excel)
+        datos = [fila[:num_columnas] for fila in filas
+                 if any(valor is not None for valor in fila[:num_columnas])]
+        return pd.DataFrame.from_records(datos, columns=columnas)
+    
+    @staticmethod
+    def _validar_esquema_grafo(nodos_df: 'pd.DataFrame', arcos_df: 'pd.DataFrame') -> Tuple[bool, str]:
+        """Valida el número de columnas y el tipo de DISTANCIA antes de crear el grafo"""
+        if nodos_df.shape[1] < 1:
+            return False, "La hoja NODOS debe tener al menos una columna con los identificadores de nodo"
+        
+        if arcos_df.shape[1] < 3:
+            return False, (f"La hoja ARCOS debe tener al menos 3 columnas (origen, destino y un atributo), "
+                           f"pero tiene {arcos_df.shape[1]}")
+        
+        # Convertir DISTANCIA a float64 en bloque (evita conversiones fila a fila al crear arcos)
+        if 'DISTANCIA' in arcos_df.columns:
+            import pandas as pd
+            try:
+                arcos_df['DISTANCIA'] = pd.to_numeric(arcos_df['DISTANCIA'], errors='raise').astype('float64')
+            except (ValueError, TypeError):
+                return False, "La columna DISTANCIA de la hoja ARCOS contiene valores no numéricos"
+        
+        return True, "Esquema válido"
+    
+    @staticmethod
+    def _encontrar_columna_nodos(nodos_df: 'pd.DataFrame') -> str:
         """Encuentra la columna correcta para los nodos"""
         for col in ArchivoUtils.HOJAS_ESPERADAS['NODOS']:
             if col in nodos_df.columns:
@@ -258,7 +359,7 @@ class ArchivoUtils:
         return nodos_df.columns[0]  # Fallback a la primera columna
     
     @staticmethod
-    def _encontrar_columnas_arco(arcos_df: pd.DataFrame) -> Tuple[str, str]:
+    def _encontrar_columnas_arco(arcos_df: 'pd.DataFrame') -> Tuple[str, str]:
         """Encuentra las columnas correctas para origen y destino"""
         columnas_esperadas = ArchivoUtils.HOJAS_ESPERADAS['ARCOS']
         
@@ -280,7 +381,7 @@ class ArchivoUtils:
         return origen, destino
     
     @staticmethod
-    def _verificar_atributos_arcos(arcos_df: pd.DataFrame) -> List[str]:
+    def _verificar_atributos_arcos(arcos_df: 'pd.DataFrame') -> List[str]:
         """Verifica qué atributos están disponibles dinámicamente en los arcos"""
         # Obtener columnas obligatorias (ORIGEN y DESTINO)
         col_origen, col_destino = ArchivoUtils._encontrar_columnas_arco(arcos_df)
@@ -298,32 +399,35 @@ class ArchivoUtils:
     def obtener_informacion_archivo(archivo: str) -> Dict[str, Any]:
         """Obtiene información detallada del archivo Excel"""
         try:
-            excel_file = pd.ExcelFile(archivo)
-            hojas_disponibles = excel_file.sheet_names
-            
-            info = {
-                'nombre_archivo': os.path.basename(archivo),
-                'ruta_completa': archivo,
-                'hojas_disponibles': hojas_disponibles,
-                'tamaño_archivo': os.path.getsize(archivo),
-                'hojas_validas': []
-            }
+            import pandas as pd
             
-            # Validar cada hoja
-            for hoja in hojas_disponibles:
-                try:
-                    df = pd.read_excel(archivo, sheet_name=hoja, engine="openpyxl")
-                    info['hojas_validas'].append({
-                        'nombre': hoja,
-                        'filas': len(df),
-                        'columnas': len(df.columns),
-                        'columnas_nombres': list(df.columns)
-                    })
-                except Exception as e:
-                    info['hojas_validas'].append({
-                        'nombre': hoja,
-                        'error': str(e)
-                    })
+            # Un solo ExcelFile: el libro se abre una vez y cada hoja se lee de él
+            with pd.ExcelFile(archivo, engine="openpyxl") as excel_file:
+                hojas_disponibles = excel_file.sheet_names
+                
+                info = {
+                    'nombre_archivo': os.path.basename(archivo),
+                    'ruta_completa': archivo,
+                    'hojas_disponibles': hojas_disponibles,
+                    'tamaño_archivo': os.path.getsize(archivo),
+                    'hojas_validas': []
+                }
+                
+                # Validar cada hoja
+                for hoja in hojas_disponibles:
+                    try:
+                        df = excel_file.parse(hoja)
+                        info['hojas_validas'].append({
+                            'nombre': hoja,
+                            'filas': len(df),
+                            'columnas': len(df.columns),
+                            'columnas_nombres': list(df.columns)
+                        })
+                    except Exception as e:
+                        info['hojas_validas'].append({
+                            'nombre': hoja,
+                            'error': str(e)
+                        })
             
             return info
             
@@ -332,44 +436,6 @@ class ArchivoUtils:
                 'error': f"Error al obtener información del archivo: {str(e)}"
             }
     
-    @staticmethod
-    def mostrar_dialogo_carga_exitosa(archivo: str, grafo: nx.Graph, 
-                                    perfiles_df: Optional[pd.DataFrame] = None,
-                                    rutas_df: Optional[pd.DataFrame] = None):
-        """Muestra un diálogo con información de carga exitosa"""
-        num_nodos = len(grafo.nodes())
-        num_arcos = len(grafo.edges())
-        
-        # Obtener atributos disponibles
-        atributos_encontrados = set()
-        for edge in grafo.edges(data=True):
-            for key in edge[2].keys():
-                if key not in ['weight']:
-                    atributos_encontrados.add(key)
-        
-        mensaje = f"✅ Grafo cargado exitosamente!\n\n📊 Estadísticas:\n• Nodos: {num_nodos}\n• Arcos: {num_arcos}\n• Atributos: {len(atributos_encontrados)}"
-        
-        if len(atributos_encontrados) > 1:
-            mensaje += f"\n• Peso compuesto: ✅"
-        else:
-            mensaje += f"\n• Peso compuesto: ❌ (solo distancia)"
-        
-        if perfiles_df is not None:
-            mensaje += f"\n• Perfiles: {len(perfiles_df)} disponibles"
-        
-        if rutas_df is not None:
-            mensaje += f"\n• Matriz de rutas: ✅"
-        
-        if perfiles_df is not None and rutas_df is not None:
-            mensaje += f"\n\n🎭 SISTEMA AVANZADO ACTIVADO:"
-            mensaje += f"\n• Perfiles de ciclistas: {len(perfiles_df)} tipos"
-            mensaje += f"\n• Rutas probabilísticas: ✅"
-            mensaje += f"\n• Simulación realista: ✅"
-        else:
-            mensaje += f"\n\n🚴 La simulación ahora usa pesos mejorados"
-        
-        messagebox.showinfo("Grafo Cargado", mensaje)
-    
     @staticmethod
     def mostrar_dialogo_error_carga(error: str):
         """Muestra un diálogo de error de carga"""
@@ -379,6 +445,8 @@ class ArchivoUtils:
     def exportar_estadisticas_simulacion(estadisticas: Dict[str, Any], archivo: str):
         """Exporta estadísticas de simulación a un archivo Excel"""
         try:
+            import pandas as pd
+            
             with pd.ExcelWriter(archivo, engine='openpyxl') as writer:
                 # Hoja de estadísticas generales
                 stats_generales = {
@@ -417,73 +485,34 @@ class ArchivoUtils:
             return False, f"Error al exportar estadísticas: {str(e)}"
     
     @staticmethod
-    def _calcular_peso_compuesto(arcos_df: pd.DataFrame, atributos_disponibles: List[str]) -> pd.DataFrame:
-        """Prepara los datos para cálculo dinámico de pesos compuestos por usuario"""
-        df_resultado = arcos_df.copy()
+    def _calcular_peso_compuesto(arcos_df: 'pd.DataFrame', atributos_disponibles: List[str]) -> 'pd.DataFrame':
+        """Prepara los datos para cálculo dinámico de pesos compuestos por usuario
         
+        Agrega la columna distancia_real sobre el mismo DataFrame (el llamador
+        reemplaza su referencia con el resultado, así que no se copia la tabla).
+        """
         # NO calcular peso compuesto fijo aquí - se hará dinámicamente por usuario
         # Solo calcular distancia real para simulación
-        df_resultado['distancia_real'] = ArchivoUtils._calcular_distancia_real(arcos_df, atributos_disponibles)
+        arcos_df['distancia_real'] = ArchivoUtils._calcular_distancia_real(arcos_df, atributos_disponibles)
         
-        print(f"📏 Distancia real calculada:")
-        print(f"   Rango: {df_resultado['distancia_real'].min():.1f} - {df_resultado['distancia_real'].max():.1f} metros")
-        print(f"   Promedio: {df_resultado['distancia_real'].mean():.1f} metros")
+        # El rango y el promedio ya los reporta _calcular_distancia_real
         print(f"ℹ️ Los pesos compuestos se calcularán dinámicamente por perfil de usuario")
         
-        return df_resultado
-    
-    @staticmethod
-    def _calcular_distancia_euclidiana(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-        """Calcula distancia entre dos coordenadas usando fórmula de Haversine
-        
-        Para coordenadas geográficas (LAT/LON en grados), usa la fórmula de Haversine
-        que calcula la distancia real en línea recta sobre la superficie de la Tierra.
-        Ideal para distancias urbanas dentro de una ciudad para simular desplazamientos en bicicleta.
-        
-        Para distancias cortas urbanas (< 10 km), la precisión de Haversine es óptima y proporciona
-        una buena aproximación de la distancia real entre nodos de ciclorutas.
-        
-        Args:
-            lat1, lon1: Coordenadas del punto origen (en grados decimales, ej: 4.6097, -74.0817)
-            lat2, lon2: Coordenadas del punto destino (en grados decimales)
-            
-        Returns:
-            Distancia en metros (distancia real en línea recta entre los puntos)
-        """
-        # Detectar si las coordenadas están en grados (valores pequeños) o metros (valores grandes)
-        if abs(lat1) < 1000 and abs(lat2) < 1000 and abs(lon1) < 1000 and abs(lon2) < 1000:
-            # Coordenadas geográficas en grados - usar FÓRMULA DE HAVERSINE
-            # Radio medio de la Tierra en metros (6371 km)
-            R = 6371000
-            
-            # Convertir grados a radianes
-            lat1_rad = math.radians(lat1)
-            lat2_rad = math.radians(lat2)
-            delta_lat = math.radians(lat2 - lat1)
-            delta_lon = math.radians(lon2 - lon1)
-            
-            # Fórmula de Haversine para distancia en esfera
-            # Calcula la distancia real en línea recta sobre la superficie terrestre
-            a = (math.sin(delta_lat / 2) ** 2 + 
-                 math.cos(lat1_rad) * math.cos(lat2_rad) * 
-                 math.sin(delta_lon / 2) ** 2)
-            c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-            distancia = R * c
-        else:
-            # Coordenadas ya están en metros o UTM - usar euclidiana plana
-            distancia = math.sqrt((lat2 - lat1)**2 + (lon2 - lon1)**2)
-        
-        return distancia
+        return arcos_df
     
     @staticmethod
-    def _calcular_distancia_real(arcos_df: pd.DataFrame, atributos_disponibles: List[str]) -> pd.Series:
+    def _calcular_distancia_real(arcos_df: 'pd.DataFrame', atributos_disponibles: List[str]) -> np.ndarray:
         """Calcula la distancia real igual a la distancia original (sin ajustes)"""
-        # La distancia real es igual a la distancia original
-        distancias_reales = arcos_df['DISTANCIA'].copy()
+        # La distancia real es igual a la distancia original; la asignación a la
+        # nueva columna ya hace su propia copia, así que aquí basta con la vista
+        distancias_reales = arcos_df['DISTANCIA'].to_numpy()
         
         print(f"📏 Distancia real = Distancia original (sin ajustes)")
-        print(f"   Rango: {distancias_reales.min():.1f} - {distancias_reales.max():.1f} metros")
-        print(f"   Promedio: {distancias_reales.mean():.1f} metros")
+        if distancias_reales.size:
+            # Un solo recorrido por estadística (sin repetirlos en cada print)
+            minimo, maximo, promedio = distancias_reales.min(), distancias_reales.max(), distancias_reales.mean()
+            print(f"   Rango: {minimo:.1f} - {maximo:.1f} metros")
+            print(f"   Promedio: {promedio:.1f} metros")
         print(f"ℹ️ Los otros atributos afectarán la velocidad, no la distancia")
         
         return distancias_reales
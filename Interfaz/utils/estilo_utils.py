@@ -7,7 +7,8 @@ de la interfaz del simulador.
 
 import tkinter as tk
 from tkinter import ttk
-from typing import Dict, Any
+from tkinter import font as tkfont
+from typing import Dict, Any, Optional
 
 
 class EstiloUtils:
@@ -37,6 +38,34 @@ class EstiloUtils:
         'muy_pequeno': ('Segoe UI', 8)
     }
     
+    # Objetos de fuente de Tk compartidos (se crean una vez por nombre)
+    _fuentes_tk: Dict[str, tkfont.Font] = {}
+    
+    # Rueda del mouse: un único manejador global enruta al canvas bajo el puntero
+    _canvas_rueda_activo = None
+    _rueda_instalada = False
+    
+    # Widgets que usan la rueda para cambiar su propio valor (no deben desplazar el canvas)
+    _CLASES_CON_RUEDA_PROPIA = ('TCombobox', 'TSpinbox', 'Spinbox', 'TScale', 'Scale', 
+                                'Treeview', 'Listbox', 'Text')
+    
+    # Estados de simulación: clave de color, icono y estilo ttk precreado
+    ESTADOS = {
+        'detenido': ('gris_medio', '⏹️', 'EstadoDetenido.TLabel'),
+        'ejecutando': ('info', '▶️', 'EstadoEjecutando.TLabel'),
+        'pausado': ('advertencia', '⏸️', 'EstadoPausado.TLabel'),
+        'completado': ('exito', '✅', 'EstadoCompletado.TLabel'),
+        'error': ('peligro', '❌', 'EstadoError.TLabel')
+    }
+    
+    # Clave de color por tipo de estadística (el resto usa 'gris_oscuro')
+    COLORES_ESTADISTICA = {
+        'exito': 'exito',
+        'advertencia': 'advertencia',
+        'peligro': 'peligro',
+        'info': 'info'
+    }
+    
     # Configuraciones de padding
     PADDING = {
         'pequeno': 5,
@@ -60,6 +89,17 @@ class EstiloUtils:
         
         return style
     
+    @staticmethod
+    def obtener_fuente(nombre: str) -> tkfont.Font:
+        """Obtiene un objeto de fuente reutilizable a partir de FUENTES"""
+        fuente = EstiloUtils._fuentes_tk.get(nombre)
+        if fuente is None:
+            familia, tamano, *estilo = EstiloUtils.FUENTES[nombre]
+            fuente = tkfont.Font(family=familia, size=tamano,
+                                 weight='bold' if 'bold' in estilo else 'normal')
+            EstiloUtils._fuentes_tk[nombre] = fuente
+        return fuente
+    
     @staticmethod
     def _configurar_estilos_frame(style):
         """Configura estilos para frames"""
@@ -91,6 +131,12 @@ class EstiloUtils:
         style.configure('Danger.TLabel', 
                        font=EstiloUtils.FUENTES['normal'], 
                        foreground=EstiloUtils.COLORES['peligro'])
+        
+        # Un estilo por estado de simulación: cambiar de estado solo cambia el estilo
+        for clave_color, _, estilo in EstiloUtils.ESTADOS.values():
+            style.configure(estilo, 
+                           font=EstiloUtils.FUENTES['normal'], 
+                           foreground=EstiloUtils.COLORES[clave_color])
     
     @staticmethod
     def _configurar_estilos_button(style):
@@ -154,26 +200,18 @@ class EstiloUtils:
     @staticmethod
     def obtener_color_estado(estado: str) -> str:
         """Obtiene el color correspondiente a un estado"""
-        colores_estado = {
-            'detenido': EstiloUtils.COLORES['gris_medio'],
-            'ejecutando': EstiloUtils.COLORES['info'],
-            'pausado': EstiloUtils.COLORES['advertencia'],
-            'completado': EstiloUtils.COLORES['exito'],
-            'error': EstiloUtils.COLORES['peligro']
-        }
-        return colores_estado.get(estado, EstiloUtils.COLORES['gris_medio'])
+        clave_color = EstiloUtils.ESTADOS.get(estado, EstiloUtils.ESTADOS['detenido'])[0]
+        return EstiloUtils.COLORES[clave_color]
     
     @staticmethod
     def obtener_icono_estado(estado: str) -> str:
         """Obtiene el icono correspondiente a un estado"""
-        iconos_estado = {
-            'detenido': '⏹️',
-            'ejecutando': '▶️',
-            'pausado': '⏸️',
-            'completado': '✅',
-            'error': '❌'
-        }
-        return iconos_estado.get(estado, '❓')
+        return EstiloUtils.ESTADOS[estado][1] if estado in EstiloUtils.ESTADOS else '❓'
+    
+    @staticmethod
+    def obtener_estilo_estado(estado: str) -> str:
+        """Obtiene el estilo ttk (creado en configurar_estilo_ttk) de un estado"""
+        return EstiloUtils.ESTADOS.get(estado, EstiloUtils.ESTADOS['detenido'])[2]
     
     @staticmethod
     def crear_tooltip(widget, texto: str):
@@ -197,6 +235,56 @@ class EstiloUtils:
         
         widget.bind("<Enter>", mostrar_tooltip)
     
+    @staticmethod
+    def vincular_rueda_mouse(canvas, *widgets):
+        """Desplaza el canvas con la rueda del mouse mientras el puntero está sobre él
+        
+        Todos los canvas comparten un solo manejador global (instalado una vez);
+        <Enter>/<Leave> solo cambian cuál es el canvas activo.
+        """
+        if not EstiloUtils._rueda_instalada:
+            for secuencia in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+                canvas.bind_all(secuencia, EstiloUtils._on_rueda_mouse)
+            EstiloUtils._rueda_instalada = True
+        
+        def _on_enter(event):
+            EstiloUtils._canvas_rueda_activo = canvas
+        
+        def _on_leave(event):
+            # Pasar a un widget hijo también genera <Leave>: solo soltar si se salió del canvas
+            widget = canvas.winfo_containing(event.x_root, event.y_root)
+            if widget is None or not str(widget).startswith(str(canvas)):
+                if EstiloUtils._canvas_rueda_activo is canvas:
+                    EstiloUtils._canvas_rueda_activo = None
+        
+        for widget in (canvas,) + widgets:
+            widget.bind("<Enter>", _on_enter, add='+')
+            widget.bind("<Leave>", _on_leave, add='+')
+    
+    @staticmethod
+    def _on_rueda_mouse(event):
+        """Manejador global de la rueda: desplaza el canvas activo, si hay uno"""
+        canvas = EstiloUtils._canvas_rueda_activo
+        if canvas is None:
+            return
+        
+        widget = event.widget
+        if isinstance(widget, str) or widget.winfo_class() in EstiloUtils._CLASES_CON_RUEDA_PROPIA:
+            return
+        
+        try:
+            # Windows y MacOS
+            if event.delta:
+                canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+            # Linux
+            elif event.num == 4:
+                canvas.yview_scroll(-1, "units")
+            elif event.num == 5:
+                canvas.yview_scroll(1, "units")
+        except tk.TclError:
+            # El canvas fue destruido
+            EstiloUtils._canvas_rueda_activo = None
+    
     @staticmethod
     def centrar_ventana(ventana, ancho: int = 400, alto: int = 300):
         """Centra una ventana en la pantalla"""
@@ -217,26 +305,24 @@ class EstiloUtils:
         return ttk.Separator(parent, orient=orientacion)
     
     @staticmethod
-    def aplicar_estilo_estadistica(label, valor: Any, tipo: str = 'normal'):
-        """Aplica estilo específico a una estadística"""
-        if tipo == 'exito':
-            label.config(foreground=EstiloUtils.COLORES['exito'])
-        elif tipo == 'advertencia':
-            label.config(foreground=EstiloUtils.COLORES['advertencia'])
-        elif tipo == 'peligro':
-            label.config(foreground=EstiloUtils.COLORES['peligro'])
-        elif tipo == 'info':
-            label.config(foreground=EstiloUtils.COLORES['info'])
-        else:
-            label.config(foreground=EstiloUtils.COLORES['gris_oscuro'])
+    def aplicar_estilo_estadistica(label, valor: Any, tipo: str = 'normal', texto: Optional[str] = None):
+        """Aplica estilo específico a una estadística (texto y color en una sola llamada a Tk)
         
-        # Formatear valor según el tipo
+        Si ya se tiene el valor formateado puede pasarse en texto para no formatearlo de nuevo.
+        """
+        if texto is None:
+            texto = EstiloUtils.formatear_valor_estadistica(valor)
+        color = EstiloUtils.COLORES[EstiloUtils.COLORES_ESTADISTICA.get(tipo, 'gris_oscuro')]
+        label.config(text=texto, foreground=color)
+
+    @staticmethod
+    def formatear_valor_estadistica(valor: Any) -> str:
+        """Formatea el valor de una estadística con la precisión que se muestra"""
         if isinstance(valor, float):
             if valor >= 1000:
-                label.config(text=f"{valor:.0f}")
+                return f"{valor:.0f}"
             elif valor >= 1:
-                label.config(text=f"{valor:.1f}")
+                return f"{valor:.1f}"
             else:
-                label.config(text=f"{valor:.3f}")
-        else:
-            label.config(text=str(valor))
+                return f"{valor:.3f}"
+        return str(valor)
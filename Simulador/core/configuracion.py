@@ -34,6 +34,15 @@ class ConfiguracionSimulacion:
     alpha_ciclista: float = 0.95
     grosor_borde: int = 2
     
+    # Ritmo de la simulación en la interfaz: cada intervalo se ejecutan pasos_por_cuadro
+    # pasos de 0.5 s simulados y se refresca la interfaz una vez (0.1 s x 2 pasos = 10x)
+    intervalo_paso_interfaz: float = 0.1
+    pasos_por_cuadro: int = 2
+    
+    # Semilla del generador aleatorio de la simulación (None = distinta en cada corrida);
+    # con una semilla fija la misma configuración reproduce la misma corrida
+    semilla: Optional[int] = None
+    
     def __post_init__(self):
         """Validar configuración después de la inicialización"""
         self._validar_configuracion()
@@ -51,12 +60,24 @@ class ConfiguracionSimulacion:
         
         if self.max_ciclistas_simultaneos <= 0:
             raise ValueError("El máximo de ciclistas debe ser positivo")
+        
+        if self.intervalo_paso_interfaz <= 0 or self.pasos_por_cuadro < 1:
+            raise ValueError("El ritmo de la simulación en la interfaz debe ser positivo")
     
     def actualizar_velocidades(self, vel_min: float, vel_max: float):
-        """Actualiza las velocidades y valida la configuración"""
+        """Actualiza las velocidades y valida la configuración
+        
+        Ambos valores se validan antes de escribirse, de modo que un rango
+        inválido no deja la configuración a medias.
+        """
+        if vel_min >= vel_max:
+            raise ValueError("La velocidad mínima debe ser menor que la máxima")
+        
+        if vel_min < 0 or vel_max < 0:
+            raise ValueError("Las velocidades no pueden ser negativas")
+        
         self.velocidad_min = vel_min
         self.velocidad_max = vel_max
-        self._validar_configuracion()
     
     def actualizar_duracion(self, duracion: float):
         """Actualiza la duración de simulación"""
@@ -78,7 +99,10 @@ class ConfiguracionSimulacion:
             'intervalo_actualizacion_cache': self.intervalo_actualizacion_cache,
             'tamano_ciclista': self.tamano_ciclista,
             'alpha_ciclista': self.alpha_ciclista,
-            'grosor_borde': self.grosor_borde
+            'grosor_borde': self.grosor_borde,
+            'intervalo_paso_interfaz': self.intervalo_paso_interfaz,
+            'pasos_por_cuadro': self.pasos_por_cuadro,
+            'semilla': self.semilla
         }
     
     @classmethod
@@ -6,12 +6,10 @@ toda la simulación usando SimPy y NetworkX.
 """
 
 import simpy
-import random
 import numpy as np
 import networkx as nx
 import time
-import math
-from typing import List, Tuple, Dict, Optional, Any
+from typing import List, Tuple, Dict, Optional, Any, Callable
 
 from ..models.ciclista import Ciclista, PoolCiclistas
 from ..distributions.distribucion_nodo import DistribucionNodo, GestorDistribuciones
@@ -19,20 +17,91 @@ from ..utils.grafo_utils import GrafoUtils
 from ..utils.rutas_utils import RutasUtils
 from ..utils.estadisticas_utils import EstadisticasUtils
 from ..utils.generador_excel import GeneradorExcel
+from ..utils.cinematica_utils import CinematicaUtils, PASO_INTERPOLACION, PASOS_ENTRE_MUESTRAS
 from .configuracion import ConfiguracionSimulacion
 
 
+# Cache de conversión color hexadecimal -> RGBA (se parsea una sola vez por color)
+_CACHE_COLORES_RGBA: Dict[str, Tuple[float, float, float, float]] = {}
+
+# Color de los ciclistas cuyo nodo de origen no tiene color asignado
+COLOR_POR_DEFECTO = '#6C757D'
+
+# Posición de los ciclistas que aún no salen o ya terminaron (fuera del área visible)
+POSICION_INVISIBLE = -1000.0
+
+
+def _hex_a_rgba(color: str) -> Tuple[float, float, float, float]:
+    """Convierte un color '#RRGGBB' a tupla RGBA normalizada, usando cache"""
+    rgba = _CACHE_COLORES_RGBA.get(color)
+    if rgba is None:
+        try:
+            valor = color.lstrip('#')
+            rgba = (int(valor[0:2], 16) / 255.0, int(valor[2:4], 16) / 255.0,
+                    int(valor[4:6], 16) / 255.0, 1.0)
+        except (ValueError, AttributeError):
+            rgba = _hex_a_rgba(COLOR_POR_DEFECTO)
+        _CACHE_COLORES_RGBA[color] = rgba
+    return rgba
+
+
 class SimuladorCiclorutas:
     """Clase principal para manejar la simulación de ciclorutas"""
     
+    # Códigos de estado por ciclista en el arreglo _estado_codigo (0 = sin registrar)
+    CODIGOS_ESTADO = {'activo': 1, 'completado': 2}
+    
+    # Puntos de trayectoria que se guardan como máximo por ciclista
+    MAX_PUNTOS_TRAYECTORIA = 100
+    
+    # Números aleatorios uniformes que se sortean de una vez en cada reposición de la reserva
+    TAMANO_RESERVA_ALEATORIA = 1024
+    
+    # Simulación básica (sin grafo): rutas, color de cada ruta y trayectorias
+    # con inclinaciones simuladas como (punto, inclinación %)
+    RUTAS_BASICAS = ("A→B", "A→C", "B→A", "C→A")
+    COLORES_RUTAS_BASICAS = {
+        "A→B": '#FF6B35',  # Naranja
+        "A→C": '#FF1744',  # Rojo
+        "B→A": '#00E676',  # Verde
+        "C→A": '#2979FF'   # Azul
+    }
+    TRAYECTORIAS_BASICAS = {
+        "A→B": [
+            ((0, 0), 0),    # Punto inicial, inclinación 0%
+            ((25, 0), 2),   # Segmento plano con ligera inclinación
+            ((50, 0), 5),   # Segmento con inclinación 5%
+            ((50, 15), 3),  # Segmento con inclinación 3%
+            ((50, 30), 0)   # Punto final, inclinación 0%
+        ],
+        "A→C": [
+            ((0, 0), 0),     # Punto inicial, inclinación 0%
+            ((25, 0), 2),    # Segmento plano con ligera inclinación
+            ((50, 0), 4),    # Segmento con inclinación 4%
+            ((50, -15), 6),  # Segmento con inclinación 6%
+            ((50, -30), 0)   # Punto final, inclinación 0%
+        ],
+        "B→A": [
+            ((50, 30), 0),   # Punto inicial, inclinación 0%
+            ((50, 15), 3),   # Segmento con inclinación 3%
+            ((50, 0), 5),    # Segmento con inclinación 5%
+            ((25, 0), 2),    # Segmento plano con ligera inclinación
+            ((0, 0), 0)      # Punto final, inclinación 0%
+        ],
+        "C→A": [
+            ((50, -30), 0),  # Punto inicial, inclinación 0%
+            ((50, -15), 6),  # Segmento con inclinación 6%
+            ((50, 0), 4),    # Segmento con inclinación 4%
+            ((25, 0), 2),    # Segmento plano con ligera inclinación
+            ((0, 0), 0)      # Punto final, inclinación 0%
+        ]
+    }
+    TRAYECTORIA_BASICA_POR_DEFECTO = (((0, 0), 0), ((50, 0), 0))
+    
     def __init__(self, config: ConfiguracionSimulacion, grafo_networkx: Optional[nx.Graph] = None):
         self.config = config
         self.env = None
-        self.coordenadas = []
-        self.rutas = []
-        self.colores = []
-        self.trayectorias = []
-        self.velocidades = []
+        self._inicializar_arreglos_tramos(0)
         self.procesos = []
         self.estado = "detenido"  # detenido, ejecutando, pausado
         self.tiempo_actual = 0
@@ -45,6 +114,8 @@ class SimuladorCiclorutas:
         
         # Sistema de distribuciones de probabilidad
         self.gestor_distribuciones = GestorDistribuciones()
+        self._cache_distribuciones = None  # Resultado de obtener_distribuciones_nodos
+        self._version_cache_distribuciones = -1
         
         # Sistema de colores dinámico basado en nodos
         self.colores_nodos = {}  # Dict[nodo_id, color]
@@ -74,6 +145,7 @@ class SimuladorCiclorutas:
         # Sistema de perfiles y rutas
         self.perfiles_df = None  # DataFrame con perfiles de ciclistas
         self.rutas_df = None  # DataFrame con matriz de probabilidades de destino
+        self._destinos_por_origen = {}  # Nodo origen -> (destinos, probabilidades) de rutas_df
         self.perfiles_ciclistas = {}  # Dict[ciclista_id, perfil] para rastrear perfil de cada ciclista
         self.contador_perfiles = {}  # Dict[perfil_id, contador] para rastrear uso de perfiles
         
@@ -91,6 +163,12 @@ class SimuladorCiclorutas:
         # Cache inteligente de rutas
         self.rutas_por_perfil = {}  # Cache de rutas por perfil
         
+        # Geometría precalculada por arco dirigido (ver _precalcular_geometria_arcos)
+        self._geometria_arcos = {}
+        
+        # Segmentos de las rutas de la simulación básica (no dependen del grafo ni de la configuración)
+        self._segmentos_basicos = self._precalcular_segmentos_basicos()
+        
         # Pool de objetos para ciclistas
         self.pool_ciclistas = PoolCiclistas(
             tamaño_inicial=100,
@@ -132,6 +210,7 @@ class SimuladorCiclorutas:
         # Configurar perfiles y rutas si están disponibles
         self.perfiles_df = perfiles_df
         self.rutas_df = rutas_df
+        self._destinos_por_origen = self._indexar_matriz_rutas(rutas_df)
         
         # Validar probabilidades de perfiles si están disponibles
         if self.perfiles_df is not None:
@@ -153,11 +232,58 @@ class SimuladorCiclorutas:
         
         self._inicializar_grafo()
         
+        # Geometría y factores por arco: se reutilizan en cada tramo y en cada reinicio
+        self._precalcular_geometria_arcos()
+        
         # Inicializar distribuciones por defecto
         self._inicializar_distribuciones_por_defecto()
         
         return True
     
+    def _precalcular_geometria_arcos(self):
+        """Pre-calcula una vez por grafo lo que cada tramo necesita de su arco
+        
+        Para cada arco (en ambos sentidos) guarda las coordenadas de sus extremos,
+        la distancia real, los atributos y el factor de tiempo, de modo que
+        _ciclista_grafo_real no repita las búsquedas en NetworkX en cada tramo.
+        """
+        self._geometria_arcos = {}
+        if not self.grafo or not self.pos_grafo:
+            return
+        
+        for u, v, datos in self.grafo.edges(data=True):
+            pos_u = GrafoUtils.obtener_coordenada_nodo(self.pos_grafo, u)
+            pos_v = GrafoUtils.obtener_coordenada_nodo(self.pos_grafo, v)
+            distancia_real = GrafoUtils.obtener_distancia_arco(self.grafo, u, v)
+            atributos = dict(datos)
+            factor_tiempo = GrafoUtils.calcular_factor_tiempo_desplazamiento(atributos)
+            
+            self._geometria_arcos[(u, v)] = (pos_u, pos_v, distancia_real, atributos, factor_tiempo)
+            self._geometria_arcos[(v, u)] = (pos_v, pos_u, distancia_real, atributos, factor_tiempo)
+    
+    @classmethod
+    def _precalcular_segmentos_basicos(cls) -> Dict[Optional[str], Tuple]:
+        """Pre-calcula los segmentos de cada ruta de la simulación básica
+        
+        Returns:
+            Dict ruta -> tupla de (punto inicial, punto final, distancia, atributos del
+            segmento); la clave None tiene la trayectoria por defecto
+        """
+        trayectorias = dict(cls.TRAYECTORIAS_BASICAS)
+        trayectorias[None] = cls.TRAYECTORIA_BASICA_POR_DEFECTO
+        
+        segmentos = {}
+        for ruta, puntos in trayectorias.items():
+            # Puntos como floats: es el tipo que esperan los kernels de cinematica_utils
+            puntos = [((float(x), float(y)), inclinacion) for (x, y), inclinacion in puntos]
+            segmentos[ruta] = tuple(
+                (punto_actual, punto_siguiente,
+                 float(np.hypot(punto_siguiente[0] - punto_actual[0], punto_siguiente[1] - punto_actual[1])),
+                 {'inclinacion': inclinacion_siguiente})
+                for (punto_actual, _), (punto_siguiente, inclinacion_siguiente) in zip(puntos, puntos[1:])
+            )
+        return segmentos
+    
     def _inicializar_distribuciones_por_defecto(self):
         """Inicializa distribuciones por defecto para todos los nodos"""
         if not self.grafo:
@@ -338,14 +464,15 @@ class SimuladorCiclorutas:
     def inicializar_simulacion(self):
         """Inicializa una nueva simulación con los parámetros configurados"""
         # Limpiar datos anteriores
-        self.coordenadas = []
-        self.rutas = []
-        self.colores = []
-        self.trayectorias = []
-        self.velocidades = []
+        self._inicializar_arreglos_tramos(64)
         self.procesos = []
         self.ciclista_id_counter = 0
         
+        # Generador aleatorio único de la simulación (todos los sorteos salen de él, así que
+        # config.semilla reproduce la corrida) y reserva de uniformes en [0, 1) sorteados en bloque
+        self._rng = np.random.default_rng(self.config.semilla)
+        self._reserva_aleatoria = []
+        
         # Resetear flag de Excel para nueva simulación
         self.excel_generado = False
         self.ruta_excel_generado = None
@@ -392,7 +519,7 @@ class SimuladorCiclorutas:
         """Genera ciclistas para simulación básica sin grafo"""
         while self.estado != "completada":
             # Generar tiempo de arribo aleatorio
-            tiempo_arribo = np.random.exponential(2.0)  # 0.5 arribos por segundo
+            tiempo_arribo = self._rng.exponential(2.0)  # 0.5 arribos por segundo
             yield self.env.timeout(tiempo_arribo)
             
             # Crear nuevo ciclista
@@ -400,111 +527,293 @@ class SimuladorCiclorutas:
             self.ciclista_id_counter += 1
             
             # Generar ruta básica
-            rutas_basicas = ["A→B", "A→C", "B→A", "C→A"]
-            ruta = str(np.random.choice(rutas_basicas))
-            velocidad = random.uniform(self.config.velocidad_min, self.config.velocidad_max)
-            
-            # Colores para cada ruta
-            colores_rutas = {
-                "A→B": '#FF6B35',  # Naranja
-                "A→C": '#FF1744',  # Rojo
-                "B→A": '#00E676',  # Verde
-                "C→A": '#2979FF'   # Azul
-            }
+            ruta = self.RUTAS_BASICAS[int(self._uniforme() * len(self.RUTAS_BASICAS))]
+            velocidad = self._sortear_velocidad()
             
             # Agregar datos del ciclista
-            self.rutas.append(ruta)
-            self.colores.append(colores_rutas[ruta])
-            self.velocidades.append(velocidad)
-            self.coordenadas.append((-1000, -1000))  # Posición inicial invisible
-            self.trayectorias.append([])
+            self._registrar_ciclista(ciclista_id, ruta, self.COLORES_RUTAS_BASICAS[ruta], velocidad)
             
             # Marcar ciclista como activo
-            self.estado_ciclistas[ciclista_id] = 'activo'
+            self._establecer_estado_ciclista(ciclista_id, 'activo')
             
             # Crear proceso del ciclista
             proceso = self.env.process(self._ciclista_basico(ciclista_id, velocidad, ruta))
             self.procesos.append(proceso)
     
+    def _uniforme(self) -> float:
+        """Devuelve un número uniforme en [0, 1) tomado de la reserva
+        
+        La reserva se repone con una sola llamada al generador de NumPy, en lugar de
+        una llamada al módulo random por cada ciclista que llega.
+        """
+        if not self._reserva_aleatoria:
+            self._reserva_aleatoria = self._rng.random(self.TAMANO_RESERVA_ALEATORIA).tolist()
+        return self._reserva_aleatoria.pop()
+    
+    def _sortear_velocidad(self) -> float:
+        """Velocidad inicial de un nuevo ciclista, uniforme en el rango configurado"""
+        velocidad_minima = self.config.velocidad_min
+        return velocidad_minima + (self.config.velocidad_max - velocidad_minima) * self._uniforme()
+    
+    def _inicializar_arreglos_tramos(self, capacidad: int):
+        """Crea los arreglos contiguos (uno por campo) con el tramo en curso, la posición,
+        la velocidad, el estado, la ruta, el color y la trayectoria de cada ciclista
+        
+        Rutas y colores se guardan como códigos enteros sobre catálogos compartidos: hay
+        pocas rutas y colores distintos y muchos ciclistas. El código 0 de cada catálogo
+        es el valor por defecto, de modo que los arreglos recién ampliados con ceros son válidos.
+        """
+        self._tramo_origen_x = np.zeros(capacidad, dtype=np.float64)
+        self._tramo_origen_y = np.zeros(capacidad, dtype=np.float64)
+        self._tramo_delta_x = np.zeros(capacidad, dtype=np.float64)
+        self._tramo_delta_y = np.zeros(capacidad, dtype=np.float64)
+        self._tramo_t_inicio = np.zeros(capacidad, dtype=np.float64)
+        self._tramo_pasos = np.zeros(capacidad, dtype=np.float64)
+        self._tramo_en_curso = np.zeros(capacidad, dtype=np.bool_)
+        self._fijar_arreglo_posicion(np.full((2, capacidad), POSICION_INVISIBLE, dtype=np.float64))
+        self._tiempo_posiciones = None  # Instante para el que se calcularon las posiciones
+        self._velocidad = np.zeros(capacidad, dtype=np.float64)
+        self._estado_codigo = np.zeros(capacidad, dtype=np.int8)
+        self._ruta_codigo = np.zeros(capacidad, dtype=np.int32)
+        self._color_codigo = np.zeros(capacidad, dtype=np.int32)
+        self.num_ciclistas = 0  # Filas en uso: id más alto registrado + 1
+        self.ciclistas_registrados = 0  # Ciclistas efectivamente creados (sin ids consumidos sin ruta)
+        
+        # Trayectorias en un búfer preasignado (ciclista, punto, x/y) con su longitud por ciclista
+        self._trayectoria = np.zeros((capacidad, self.MAX_PUNTOS_TRAYECTORIA, 2), dtype=np.float64)
+        self._longitud_trayectoria = np.zeros(capacidad, dtype=np.int32)
+        
+        # Catálogos de rutas y colores (código -> valor y valor -> código)
+        self._catalogo_rutas = ['N/A']
+        self._codigos_rutas = {'N/A': 0}
+        self._paleta_colores = [COLOR_POR_DEFECTO]
+        self._codigos_colores = {COLOR_POR_DEFECTO: 0}
+        self._paleta_rgba = np.array([_hex_a_rgba(COLOR_POR_DEFECTO)], dtype=np.float32)
+    
+    def _fijar_arreglo_posicion(self, posicion: np.ndarray):
+        """Guarda el arreglo (2, capacidad) de posiciones y sus filas x/y como vistas contiguas"""
+        self._posicion = posicion
+        self._posicion_x = posicion[0]
+        self._posicion_y = posicion[1]
+    
+    def _asegurar_capacidad(self, indice: int):
+        """Amplía (por duplicación) los arreglos por ciclista para que admitan el índice dado"""
+        capacidad = len(self._tramo_en_curso)
+        if indice < capacidad:
+            return
+        
+        nueva_capacidad = max(64, 2 * capacidad, indice + 1)
+        for nombre in ('_tramo_origen_x', '_tramo_origen_y', '_tramo_delta_x', '_tramo_delta_y',
+                       '_tramo_t_inicio', '_tramo_pasos', '_tramo_en_curso',
+                       '_velocidad', '_estado_codigo', '_ruta_codigo', '_color_codigo',
+                       '_longitud_trayectoria'):
+            actual = getattr(self, nombre)
+            ampliado = np.zeros(nueva_capacidad, dtype=actual.dtype)
+            ampliado[:len(actual)] = actual
+            setattr(self, nombre, ampliado)
+        
+        posicion = np.full((2, nueva_capacidad), POSICION_INVISIBLE, dtype=np.float64)
+        posicion[:, :capacidad] = self._posicion
+        self._fijar_arreglo_posicion(posicion)
+        
+        trayectoria = np.zeros((nueva_capacidad, self.MAX_PUNTOS_TRAYECTORIA, 2), dtype=np.float64)
+        trayectoria[:capacidad] = self._trayectoria
+        self._trayectoria = trayectoria
+    
+    def _codigo_ruta(self, ruta: str) -> int:
+        """Código de la ruta en el catálogo (se agrega si es nueva)"""
+        codigo = self._codigos_rutas.get(ruta)
+        if codigo is None:
+            codigo = len(self._catalogo_rutas)
+            self._catalogo_rutas.append(ruta)
+            self._codigos_rutas[ruta] = codigo
+        return codigo
+    
+    def _codigo_color(self, color: str) -> int:
+        """Código del color en la paleta (se agrega, ya convertido a RGBA, si es nuevo)
+        
+        El RGBA se guarda una vez por color para que la visualización no tenga que
+        parsear cadenas de color en cada cuadro.
+        """
+        codigo = self._codigos_colores.get(color)
+        if codigo is None:
+            codigo = len(self._paleta_colores)
+            self._paleta_colores.append(color)
+            self._codigos_colores[color] = codigo
+            self._paleta_rgba = np.vstack([self._paleta_rgba,
+                                           np.array(_hex_a_rgba(color), dtype=np.float32)])
+        return codigo
+    
+    def _registrar_ciclista(self, ciclista_id: int, ruta: str, color: str, velocidad: float):
+        """Da de alta un nuevo ciclista en los arreglos por ciclista
+        
+        El índice en los arreglos es el propio id del ciclista, así que un id que se
+        consumió sin crear ciclista (ruta no asignada) deja una fila vacía y no
+        desalinea a los siguientes.
+        """
+        self._asegurar_capacidad(ciclista_id)
+        self._ruta_codigo[ciclista_id] = self._codigo_ruta(ruta)
+        self._color_codigo[ciclista_id] = self._codigo_color(color)
+        self._velocidad[ciclista_id] = velocidad
+        self._posicion[:, ciclista_id] = POSICION_INVISIBLE  # Posición inicial invisible
+        self._longitud_trayectoria[ciclista_id] = 0
+        self.num_ciclistas = max(self.num_ciclistas, ciclista_id + 1)
+        self.ciclistas_registrados += 1
+    
+    def _agregar_punto_trayectoria(self, ciclista_id: int, x: float, y: float):
+        """Escribe un punto en el búfer de trayectoria del ciclista (se ignora si está lleno)"""
+        k = self._longitud_trayectoria[ciclista_id]
+        if k < self.MAX_PUNTOS_TRAYECTORIA:
+            self._trayectoria[ciclista_id, k] = (x, y)
+            self._longitud_trayectoria[ciclista_id] = k + 1
+    
+    def _muestrear_trayectoria(self, ciclista_id: int, origen: Tuple[float, float],
+                               dx: float, dy: float, desde: int, hasta: int) -> int:
+        """Escribe con el kernel, directamente en el búfer, los puntos de trayectoria de los pasos desde..hasta
+        
+        El búfer se relee en cada llamada porque puede haberse ampliado mientras el
+        ciclista esperaba.
+        
+        Returns:
+            Próximo paso del tramo que corresponde muestrear
+        """
+        longitud = int(self._longitud_trayectoria[ciclista_id])
+        if desde > hasta or longitud >= self.MAX_PUNTOS_TRAYECTORIA:
+            return desde
+        
+        nueva_longitud = CinematicaUtils.muestrear_tramo(origen[0], origen[1], dx, dy, desde, hasta,
+                                                         self._trayectoria[ciclista_id], longitud)
+        self._longitud_trayectoria[ciclista_id] = nueva_longitud
+        return desde + (nueva_longitud - longitud) * PASOS_ENTRE_MUESTRAS
+    
+    def obtener_trayectoria(self, ciclista_id: int) -> np.ndarray:
+        """Vista (M, 2) sin copia de los puntos de trayectoria guardados de un ciclista"""
+        return self._trayectoria[ciclista_id, :self._longitud_trayectoria[ciclista_id]]
+    
+    @property
+    def coordenadas(self) -> np.ndarray:
+        """Vista (N, 2) sin copia de la posición de cada ciclista creado"""
+        return self._posicion[:, :self.num_ciclistas].T
+    
+    @property
+    def velocidades(self) -> np.ndarray:
+        """Vista sin copia de la velocidad actual de cada ciclista creado"""
+        return self._velocidad[:self.num_ciclistas]
+    
+    @property
+    def trayectorias(self) -> List[np.ndarray]:
+        """Trayectoria de cada ciclista creado, como lista de vistas (M, 2)"""
+        return [self.obtener_trayectoria(i) for i in range(self.num_ciclistas)]
+    
+    @property
+    def rutas(self) -> List[str]:
+        """Ruta ('origen->destino') de cada ciclista creado, como lista nueva"""
+        catalogo = self._catalogo_rutas
+        return [catalogo[codigo] for codigo in self._ruta_codigo[:self.num_ciclistas].tolist()]
+    
+    @property
+    def colores(self) -> List[str]:
+        """Color hexadecimal de cada ciclista creado, como lista nueva"""
+        paleta = self._paleta_colores
+        return [paleta[codigo] for codigo in self._color_codigo[:self.num_ciclistas].tolist()]
+    
+    def _establecer_estado_ciclista(self, ciclista_id: int, estado: str):
+        """Registra el estado ('activo'/'completado') de un ciclista en el diccionario y en el arreglo"""
+        self.estado_ciclistas[ciclista_id] = estado
+        self._asegurar_capacidad(ciclista_id)
+        self._estado_codigo[ciclista_id] = self.CODIGOS_ESTADO[estado]
+    
+    def _establecer_velocidad(self, ciclista_id: int, velocidad: float):
+        """Registra la velocidad actual de un ciclista en el arreglo de velocidades"""
+        self._asegurar_capacidad(ciclista_id)
+        self._velocidad[ciclista_id] = velocidad
+    
+    def obtener_arreglos_ciclistas(self) -> Dict[str, np.ndarray]:
+        """Retorna vistas de los arreglos por ciclista para cálculos vectorizados
+        
+        Returns:
+            Diccionario con 'velocidades' y las máscaras booleanas 'activos' y
+            'completados', todos de longitud igual al número de ciclistas creados
+        """
+        n = self.num_ciclistas
+        codigos = self._estado_codigo[:n]
+        return {
+            'velocidades': self._velocidad[:n],
+            'activos': codigos == self.CODIGOS_ESTADO['activo'],
+            'completados': codigos == self.CODIGOS_ESTADO['completado']
+        }
+    
+    def _registrar_tramo(self, ciclista_id: int, origen: Tuple[float, float], 
+                         dx: float, dy: float, pasos: int):
+        """Guarda la geometría del tramo que inicia un ciclista en los arreglos contiguos"""
+        self._asegurar_capacidad(ciclista_id)
+        self._tramo_origen_x[ciclista_id] = origen[0]
+        self._tramo_origen_y[ciclista_id] = origen[1]
+        self._tramo_delta_x[ciclista_id] = dx
+        self._tramo_delta_y[ciclista_id] = dy
+        self._tramo_t_inicio[ciclista_id] = self.env.now
+        self._tramo_pasos[ciclista_id] = pasos
+        self._tramo_en_curso[ciclista_id] = True
+        self._tiempo_posiciones = None
+    
+    def _actualizar_posiciones(self):
+        """Calcula en bloque la posición de todos los ciclistas en tramo (escribe en _posicion)"""
+        if self.env is None or self._tiempo_posiciones == self.env.now:
+            return
+        
+        n = self.num_ciclistas
+        if n == 0:
+            return
+        
+        en_tramo = self._tramo_en_curso[:n]
+        CinematicaUtils.calcular_posiciones(
+            self._tramo_origen_x[:n], self._tramo_origen_y[:n],
+            self._tramo_delta_x[:n], self._tramo_delta_y[:n],
+            self._tramo_t_inicio[:n], self._tramo_pasos[:n],
+            en_tramo, float(self.env.now),
+            self._posicion_x[:n], self._posicion_y[:n]
+        )
+        
+        self._tiempo_posiciones = self.env.now
+    
     def _ciclista_basico(self, id: int, velocidad: float, ruta: str):
         """Lógica de movimiento de un ciclista en simulación básica"""
         # Esperar tiempo de arribo
-        yield self.env.timeout(random.uniform(1.0, 3.0))
-        
-        # Definir trayectorias básicas para cada ruta con inclinaciones simuladas
-        trayectorias = {
-            "A→B": [
-                ((0, 0), 0),    # Punto inicial, inclinación 0%
-                ((25, 0), 2),   # Segmento plano con ligera inclinación
-                ((50, 0), 5),   # Segmento con inclinación 5%
-                ((50, 15), 3),  # Segmento con inclinación 3%
-                ((50, 30), 0)   # Punto final, inclinación 0%
-            ],
-            "A→C": [
-                ((0, 0), 0),     # Punto inicial, inclinación 0%
-                ((25, 0), 2),    # Segmento plano con ligera inclinación
-                ((50, 0), 4),    # Segmento con inclinación 4%
-                ((50, -15), 6),  # Segmento con inclinación 6%
-                ((50, -30), 0)   # Punto final, inclinación 0%
-            ],
-            "B→A": [
-                ((50, 30), 0),   # Punto inicial, inclinación 0%
-                ((50, 15), 3),   # Segmento con inclinación 3%
-                ((50, 0), 5),    # Segmento con inclinación 5%
-                ((25, 0), 2),    # Segmento plano con ligera inclinación
-                ((0, 0), 0)      # Punto final, inclinación 0%
-            ],
-            "C→A": [
-                ((50, -30), 0),  # Punto inicial, inclinación 0%
-                ((50, -15), 6),  # Segmento con inclinación 6%
-                ((50, 0), 4),    # Segmento con inclinación 4%
-                ((25, 0), 2),    # Segmento plano con ligera inclinación
-                ((0, 0), 0)      # Punto final, inclinación 0%
-            ]
-        }
+        yield self.env.timeout(1.0 + 2.0 * self._uniforme())
         
-        trayectoria = trayectorias.get(ruta, [((0, 0), 0), ((50, 0), 0)])
+        segmentos = self._segmentos_basicos.get(ruta, self._segmentos_basicos[None])
         
-        # Mover a través de la trayectoria
-        for i in range(len(trayectoria) - 1):
-            punto_actual, inclinacion_actual = trayectoria[i]
-            punto_siguiente, inclinacion_siguiente = trayectoria[i + 1]
-            
-            # Calcular distancia
-            distancia = np.sqrt((punto_siguiente[0] - punto_actual[0])**2 + 
-                              (punto_siguiente[1] - punto_actual[1])**2)
-            
+        # Mover a través de la trayectoria (segmentos con distancia ya calculada)
+        for punto_actual, punto_siguiente, distancia, atributos_arco in segmentos:
             # Calcular velocidad ajustada por inclinación
-            atributos_arco = {'inclinacion': inclinacion_siguiente}
             velocidad_ajustada = GrafoUtils.calcular_velocidad_ajustada(velocidad, atributos_arco)
             
             # Actualizar velocidad del ciclista para estadísticas
-            self.velocidades[id] = velocidad_ajustada
+            self._establecer_velocidad(id, velocidad_ajustada)
             
             # Calcular tiempo de movimiento con velocidad ajustada
             tiempo_movimiento = distancia / velocidad_ajustada
             
-            # Interpolar movimiento
-            pasos = max(1, int(tiempo_movimiento / 0.5))  # 0.5 segundos por paso
-            for paso in range(pasos + 1):
-                yield self.env.timeout(0.5)
-                
-                # Interpolación lineal
-                t = paso / pasos if pasos > 0 else 0
-                x = float(punto_actual[0] + t * (punto_siguiente[0] - punto_actual[0]))
-                y = float(punto_actual[1] + t * (punto_siguiente[1] - punto_actual[1]))
-                
-                # Actualizar posición
-                if id < len(self.coordenadas):
-                    self.coordenadas[id] = (x, y)
-                    self.trayectorias[id].append((x, y))
+            # Interpolar movimiento en pasos de PASO_INTERPOLACION segundos
+            pasos = max(1, int(tiempo_movimiento / PASO_INTERPOLACION))
+            dx = (punto_siguiente[0] - punto_actual[0]) / pasos
+            dy = (punto_siguiente[1] - punto_actual[1]) / pasos
+            
+            # Como en _interpolar_movimiento, la posición durante el segmento sale en forma
+            # cerrada de _actualizar_posiciones: solo se despierta al final del segmento
+            self._registrar_tramo(id, punto_actual, dx, dy, pasos)
+            yield self.env.timeout(PASO_INTERPOLACION * (pasos + 1))
+            
+            # Fin del segmento: posición final y puntos de trayectoria recorridos, en bloque
+            self._tramo_en_curso[id] = False
+            self._posicion[:, id] = punto_siguiente
+            self._muestrear_trayectoria(id, punto_actual, dx, dy, 0, pasos)
         
         # Marcar ciclista como completado
-        self.estado_ciclistas[id] = 'completado'
+        self._establecer_estado_ciclista(id, 'completado')
         
         # Mover ciclista fuera de la vista
-        if id < len(self.coordenadas):
-            self.coordenadas[id] = (-1000, -1000)
+        self._posicion[:, id] = POSICION_INVISIBLE
     
     def _detener_por_tiempo(self):
         """Detiene la simulación después del tiempo configurado"""
@@ -543,7 +852,7 @@ class SimuladorCiclorutas:
         """
         while self.estado != "completada":
             # Generar tiempo de arribo para este nodo específico
-            tiempo_arribo = self.gestor_distribuciones.generar_tiempo_arribo(nodo_origen)
+            tiempo_arribo = self.gestor_distribuciones.generar_tiempo_arribo(nodo_origen, self._rng)
             
             # Si el tiempo es infinito, significa que este nodo no genera arribos
             if tiempo_arribo == float('inf') or tiempo_arribo <= 0:
@@ -561,7 +870,7 @@ class SimuladorCiclorutas:
             # Generar ruta usando perfiles y matriz de rutas
             origen, destino, ruta_nodos = self._asignar_ruta_desde_nodo(nodo_origen, ciclista_id)
             if origen and destino:
-                velocidad = random.uniform(self.config.velocidad_min, self.config.velocidad_max)
+                velocidad = self._sortear_velocidad()
                 
                 # Crear representación de la ruta para almacenar
                 ruta_str = f"{origen}->{destino}"
@@ -598,7 +907,7 @@ class SimuladorCiclorutas:
                 self.arcos_por_ciclista[ciclista_id] = arcos_ciclista
                 
                 # Marcar ciclista como activo
-                self.estado_ciclistas[ciclista_id] = 'activo'
+                self._establecer_estado_ciclista(ciclista_id, 'activo')
                 
                 # Rastrear ciclistas por nodo de origen
                 if nodo_origen not in self.ciclistas_por_nodo:
@@ -606,11 +915,8 @@ class SimuladorCiclorutas:
                 self.ciclistas_por_nodo[nodo_origen] += 1
                 
                 # Agregar datos del ciclista
-                self.rutas.append(ruta_str)
-                self.colores.append(self.colores_nodos.get(nodo_origen, '#6C757D'))
-                self.velocidades.append(velocidad)
-                self.coordenadas.append((-1000, -1000))  # Posición inicial invisible
-                self.trayectorias.append([])
+                self._registrar_ciclista(ciclista_id, ruta_str,
+                                         self.colores_nodos.get(nodo_origen, COLOR_POR_DEFECTO), velocidad)
                 
                 # Crear proceso del ciclista
                 proceso = self.env.process(self._ciclista(ciclista_id, velocidad))
@@ -686,7 +992,7 @@ class SimuladorCiclorutas:
             total_tasa = sum(tasas)
             if total_tasa > 0:
                 probabilidades = [tasa / total_tasa for tasa in tasas]
-                return str(np.random.choice(nodos, p=probabilidades))
+                return str(self._rng.choice(nodos, p=probabilidades))
             else:
                 # Si todas las tasas son 0, filtrar nodos activos
                 # Un nodo está activo si su distribución puede generar arribos
@@ -714,11 +1020,11 @@ class SimuladorCiclorutas:
                 
                 # Si hay nodos activos, seleccionar uno aleatoriamente
                 if nodos_activos:
-                    return random.choice(nodos_activos)
+                    return nodos_activos[self._rng.integers(len(nodos_activos))]
                 # Si no hay nodos activos, retornar None (no generar ciclistas)
                 return None
         
-        return random.choice(nodos) if nodos else None
+        return nodos[self._rng.integers(len(nodos))] if nodos else None
     
     def _asignar_ruta_desde_nodo(self, nodo_origen: str, ciclista_id: int) -> tuple:
         """Genera una ruta desde el nodo origen usando perfiles y matriz de rutas"""
@@ -790,7 +1096,7 @@ class SimuladorCiclorutas:
         # Verificar que existe la columna PROBABILIDAD
         if 'PROBABILIDAD' not in self.perfiles_df.columns:
             print("⚠️ Advertencia: No se encontró columna PROBABILIDAD, usando selección uniforme")
-            perfil_id = int(np.random.choice(self.perfiles_df['PERFILES']))
+            perfil_id = int(self._rng.choice(self.perfiles_df['PERFILES'].to_numpy()))
         else:
             # Usar probabilidades de la tabla para seleccionar perfil
             perfiles = self.perfiles_df['PERFILES'].values
@@ -806,7 +1112,7 @@ class SimuladorCiclorutas:
                 print("⚠️ Advertencia: Todas las probabilidades son 0, usando distribución uniforme")
             
             # Seleccionar perfil basado en probabilidades
-            perfil_id = int(np.random.choice(perfiles, p=probabilidades_normalizadas))
+            perfil_id = int(self._rng.choice(perfiles, p=probabilidades_normalizadas))
         
         perfil_data = self.perfiles_df[self.perfiles_df['PERFILES'] == perfil_id].iloc[0]
         
@@ -826,51 +1132,74 @@ class SimuladorCiclorutas:
             'pesos': pesos
         }
     
-    def _seleccionar_destino(self, nodo_origen: str) -> str:
-        """Selecciona un destino basado en las probabilidades de la matriz RUTAS"""
-        if self.rutas_df is None:
-            # Selección aleatoria simple si no hay matriz de rutas
-            nodos_destino = [nodo for nodo in self.grafo.nodes() if nodo != nodo_origen]
-            return str(np.random.choice(nodos_destino)) if nodos_destino else None
+    @staticmethod
+    def _indexar_matriz_rutas(rutas_df) -> Dict:
+        """Resuelve una sola vez la matriz RUTAS: origen -> (destinos, probabilidades)
+        
+        Las columnas de destino, la fila de cada origen y la normalización de sus
+        probabilidades no cambian durante la simulación, así que no se recalculan
+        en cada llegada. Las probabilidades quedan en None si la fila suma <= 0
+        (el destino se elige entonces de forma uniforme).
+        """
+        if rutas_df is None:
+            return {}
         
         try:
-            # Buscar la fila correspondiente al nodo origen
-            fila_origen = self.rutas_df[self.rutas_df['NODO'] == nodo_origen]
-            if fila_origen.empty:
-                # Fallback si no se encuentra el nodo
-                nodos_destino = [nodo for nodo in self.grafo.nodes() if nodo != nodo_origen]
-                return str(np.random.choice(nodos_destino)) if nodos_destino else None
+            import pandas as pd
             
-            fila_origen = fila_origen.iloc[0]
-            nodos_destino = [col for col in self.rutas_df.columns if col != 'NODO']
-            probabilidades = [fila_origen[nodo] for nodo in nodos_destino]
+            nodos_destino = [col for col in rutas_df.columns if col != 'NODO']
+            destinos = np.asarray(nodos_destino)
+            # Celdas no numéricas o vacías cuentan como probabilidad 0: una fila mal
+            # formada solo afecta a su propio origen, no a toda la matriz
+            valores = rutas_df[nodos_destino].apply(pd.to_numeric, errors='coerce')
+            celdas_invalidas = valores.isna().any(axis=1).to_numpy()
+            matriz = valores.fillna(0.0).to_numpy(dtype=np.float64)
             
-            # Validar y normalizar probabilidades
-            suma_probabilidades = np.sum(probabilidades)
-            if suma_probabilidades <= 0:
-                print(f"⚠️ Advertencia: Probabilidades de destino para {nodo_origen} suman {suma_probabilidades}")
-                # Fallback: selección uniforme
-                return str(np.random.choice(nodos_destino))
-            
-            # Normalizar probabilidades para que sumen 1.0
-            if abs(suma_probabilidades - 1.0) > 0.01:
-                probabilidades_normalizadas = np.array(probabilidades) / suma_probabilidades
-                print(f"ℹ️ Probabilidades de destino para {nodo_origen} normalizadas: {suma_probabilidades:.4f} → 1.0")
-            else:
-                probabilidades_normalizadas = probabilidades
+            destinos_por_origen = {}
+            for nodo_origen, probabilidades, invalida in zip(rutas_df['NODO'].tolist(), matriz, celdas_invalidas):
+                if nodo_origen in destinos_por_origen:
+                    continue  # Como antes, vale la primera fila de cada origen
+                
+                if invalida:
+                    print(f"⚠️ Advertencia: Fila de RUTAS para {nodo_origen} con valores no numéricos (se toman como 0)")
+                
+                suma_probabilidades = probabilidades.sum()
+                if not np.isfinite(suma_probabilidades) or suma_probabilidades <= 0:
+                    print(f"⚠️ Advertencia: Probabilidades de destino para {nodo_origen} suman {suma_probabilidades}")
+                    probabilidades = None
+                elif abs(suma_probabilidades - 1.0) > 0.01:
+                    # Normalizar probabilidades para que sumen 1.0
+                    probabilidades = probabilidades / suma_probabilidades
+                    print(f"ℹ️ Probabilidades de destino para {nodo_origen} normalizadas: {suma_probabilidades:.4f} → 1.0")
+                destinos_por_origen[nodo_origen] = (destinos, probabilidades)
             
-            # Seleccionar destino basado en probabilidades normalizadas
-            return str(np.random.choice(nodos_destino, p=probabilidades_normalizadas))
+            return destinos_por_origen
+        except Exception as e:
+            print(f"⚠️ Error indexando la matriz RUTAS ({e}), se usará selección uniforme")
+            return {}
+    
+    def _seleccionar_destino(self, nodo_origen: str) -> str:
+        """Selecciona un destino basado en las probabilidades de la matriz RUTAS"""
+        entrada = self._destinos_por_origen.get(nodo_origen)
+        if entrada is None:
+            # Selección aleatoria simple si no hay matriz de rutas o el origen no figura en ella
+            nodos_destino = [nodo for nodo in self.grafo.nodes() if nodo != nodo_origen]
+            return str(self._rng.choice(nodos_destino)) if nodos_destino else None
+        
+        try:
+            # Seleccionar destino basado en probabilidades ya normalizadas
+            nodos_destino, probabilidades = entrada
+            return str(self._rng.choice(nodos_destino, p=probabilidades))
             
         except Exception as e:
             print(f"⚠️ Error seleccionando destino: {e}")
             # Fallback en caso de error
             nodos_destino = [nodo for nodo in self.grafo.nodes() if nodo != nodo_origen]
-            return str(np.random.choice(nodos_destino)) if nodos_destino else None
+            return str(self._rng.choice(nodos_destino)) if nodos_destino else None
     
     def _ciclista(self, id: int, velocidad: float):
         """Lógica de movimiento de un ciclista individual usando grafo real"""
-        ruta = self.rutas[id]
+        ruta = self._catalogo_rutas[self._ruta_codigo[id]]
         if not ruta or ruta == "N/A":
             return
             
@@ -897,8 +1226,8 @@ class SimuladorCiclorutas:
         
         # Posición inicial en el nodo origen
         pos_inicial = GrafoUtils.obtener_coordenada_nodo(self.pos_grafo, nodos_ruta[0])
-        self.coordenadas[id] = pos_inicial
-        self.trayectorias[id].append(pos_inicial)
+        self._posicion[:, id] = pos_inicial
+        self._agregar_punto_trayectoria(id, *pos_inicial)
         
         # Mover a través de cada segmento de la ruta
         for i in range(len(nodos_ruta) - 1):
@@ -908,12 +1237,16 @@ class SimuladorCiclorutas:
             # Crear identificador del arco
             arco_str = f"{nodo_actual}->{nodo_siguiente}"
             
-            # Obtener coordenadas de los nodos
-            pos_actual = GrafoUtils.obtener_coordenada_nodo(self.pos_grafo, nodo_actual)
-            pos_siguiente = GrafoUtils.obtener_coordenada_nodo(self.pos_grafo, nodo_siguiente)
-            
-            # Obtener distancia real del arco
-            distancia_real = GrafoUtils.obtener_distancia_arco(self.grafo, nodo_actual, nodo_siguiente)
+            # Coordenadas, distancia, atributos y factor de tiempo precalculados del arco
+            geometria = self._geometria_arcos.get((nodo_actual, nodo_siguiente))
+            if geometria is not None:
+                pos_actual, pos_siguiente, distancia_real, atributos_arco, factor_tiempo = geometria
+            else:
+                pos_actual = GrafoUtils.obtener_coordenada_nodo(self.pos_grafo, nodo_actual)
+                pos_siguiente = GrafoUtils.obtener_coordenada_nodo(self.pos_grafo, nodo_siguiente)
+                distancia_real = GrafoUtils.obtener_distancia_arco(self.grafo, nodo_actual, nodo_siguiente)
+                atributos_arco = GrafoUtils.obtener_atributos_arco(self.grafo, nodo_actual, nodo_siguiente)
+                factor_tiempo = GrafoUtils.calcular_factor_tiempo_desplazamiento(atributos_arco)
             
             # Calcular y almacenar capacidad del arco si no está calculada
             if arco_str not in self.capacidad_arcos:
@@ -923,10 +1256,8 @@ class SimuladorCiclorutas:
                 if arco_str not in self.bicicletas_en_arco:
                     self.bicicletas_en_arco[arco_str] = set()
             
-            # Obtener atributos del arco para ajustar velocidad y tiempo
-            atributos_arco = GrafoUtils.obtener_atributos_arco(self.grafo, nodo_actual, nodo_siguiente)
+            # Ajustar la velocidad del ciclista según los atributos del arco
             velocidad_ajustada_inclinacion = GrafoUtils.calcular_velocidad_ajustada(velocidad, atributos_arco)
-            factor_tiempo = GrafoUtils.calcular_factor_tiempo_desplazamiento(atributos_arco)
             
             # El factor de densidad se calculará dinámicamente dentro de _interpolar_movimiento
             # después de que la bicicleta entre al arco, para considerar su propia presencia
@@ -936,7 +1267,7 @@ class SimuladorCiclorutas:
                                                  velocidad_ajustada_inclinacion, id, factor_tiempo, arco_str)
         
         # Marcar ciclista como completado cuando termine su ruta
-        self.estado_ciclistas[id] = 'completado'
+        self._establecer_estado_ciclista(id, 'completado')
         
         # Calcular tiempo total de viaje
         if id in self.tiempo_inicio_viaje:
@@ -944,7 +1275,7 @@ class SimuladorCiclorutas:
             self.tiempos_por_ciclista[id] = tiempo_total_viaje
         
         # Mover ciclista fuera de la vista (posición invisible)
-        self.coordenadas[id] = (-1000, -1000)  # Posición fuera del área visible
+        self._posicion[:, id] = POSICION_INVISIBLE  # Posición fuera del área visible
     
     def _calcular_factor_densidad(self, arco_str: str) -> float:
         """Calcula el factor de reducción de velocidad basado en la densidad de bicicletas en el arco
@@ -1018,7 +1349,7 @@ class SimuladorCiclorutas:
         tiempo_total = tiempo_base * factor_tiempo
         
         # Actualizar velocidad del ciclista para estadísticas
-        self.velocidades[ciclista_id] = velocidad_con_densidad
+        self._establecer_velocidad(ciclista_id, velocidad_con_densidad)
         
         # Inicializar tiempo de viaje si es el primer tramo
         if ciclista_id not in self.tiempo_inicio_viaje:
@@ -1026,7 +1357,7 @@ class SimuladorCiclorutas:
             self.tiempos_por_tramo[ciclista_id] = []
         
         # Calcular pasos fijos para movimiento eficiente (menos recursos computacionales)
-        pasos = max(1, min(int(tiempo_total / 0.5), 200))  # Máximo 200 pasos
+        pasos = max(1, min(int(tiempo_total / PASO_INTERPOLACION), 200))  # Máximo 200 pasos
         
         # Pre-calcular incrementos para eficiencia
         dx = (destino[0] - origen[0]) / pasos
@@ -1038,32 +1369,36 @@ class SimuladorCiclorutas:
         
         # Guardar velocidad base (sin densidad) para recalcular durante el movimiento
         velocidad_base_sin_densidad = velocidad
-        velocidad_actual = velocidad_con_densidad
-        
-        # Factor de densidad actual - inicializar con el factor calculado al entrar
-        factor_densidad_actual = factor_densidad if arco_str else 1.0
         
-        for i in range(pasos + 1):
-            yield self.env.timeout(0.5)  # Tiempo fijo por paso
+        # La posición se calcula en bloque y en forma cerrada para todos los ciclistas
+        # (ver _actualizar_posiciones), así que el tramo no necesita un evento cada 0.5 s:
+        # solo se despierta en los pasos donde se revisa la densidad y en el último
+        self._registrar_tramo(ciclista_id, origen, dx, dy, pasos)
+        
+        hitos = list(range(pasos_entre_actualizaciones, pasos + 1, pasos_entre_actualizaciones)) if arco_str else []
+        if not hitos or hitos[-1] != pasos:
+            hitos.append(pasos)
+        
+        paso_anterior = -1
+        proxima_muestra = 0  # Se guarda cada PASOS_ENTRE_MUESTRAS pasos (con tope por ciclista)
+        for i in hitos:
+            # El paso i ocurre tras (i + 1) intervalos de PASO_INTERPOLACION desde el inicio del tramo
+            yield self.env.timeout(PASO_INTERPOLACION * (i - paso_anterior))
+            paso_anterior = i
             
             # Recalcular factor de densidad periódicamente (menos frecuente para eficiencia)
-            if arco_str and i > 0 and i % pasos_entre_actualizaciones == 0:
+            if arco_str and i % pasos_entre_actualizaciones == 0:
                 # Calcular nuevo factor directamente (sin suavizado)
                 factor_densidad_actual = self._calcular_factor_densidad(arco_str)
-                # Ajustar velocidad basada en el factor de densidad
-                velocidad_actual = velocidad_base_sin_densidad * factor_densidad_actual
-                # Actualizar velocidad para estadísticas
-                self.velocidades[ciclista_id] = velocidad_actual
+                # Ajustar velocidad basada en el factor de densidad (para estadísticas)
+                self._establecer_velocidad(ciclista_id, velocidad_base_sin_densidad * factor_densidad_actual)
             
-            # Interpolación lineal optimizada (más eficiente que cálculos de distancia)
-            x = float(origen[0] + i * dx)
-            y = float(origen[1] + i * dy)
-            
-            self.coordenadas[ciclista_id] = (x, y)
-            
-            # Solo guardar cada 5to punto para reducir memoria
-            if i % 5 == 0 and len(self.trayectorias[ciclista_id]) < 100:
-                self.trayectorias[ciclista_id].append((x, y))
+            # Puntos de trayectoria recorridos hasta el paso i, en bloque
+            proxima_muestra = self._muestrear_trayectoria(ciclista_id, origen, dx, dy, proxima_muestra, i)
+        
+        # Fin del tramo: fijar la posición final y sacarlo del cálculo en bloque
+        self._tramo_en_curso[ciclista_id] = False
+        self._posicion[:, ciclista_id] = (origen[0] + pasos * dx, origen[1] + pasos * dy)
         
         # Registrar tiempo real del tramo
         tiempo_fin_tramo = self.env.now
@@ -1080,16 +1415,50 @@ class SimuladorCiclorutas:
     
     def ejecutar_paso(self):
         """Ejecuta un paso de la simulación"""
-        if self.env and self.estado == "ejecutando":
-            self.env.step()
-            self.tiempo_actual = self.env.now
-            
-            # Gestión inteligente de memoria cada 10 pasos
-            if int(self.tiempo_actual) % 10 == 0:
-                self._gestionar_memoria_inteligente()
-            
-            return True
-        return False
+        return self.ejecutar_n_pasos(1)
+    
+    def ejecutar_n_pasos(self, n: int) -> bool:
+        """Avanza la simulación n pasos de PASO_INTERPOLACION segundos sin volver a la interfaz
+        
+        El paso es de tiempo simulado y no de eventos: los tramos ya no generan un
+        evento cada 0.5 s, así que avanzar evento a evento daría saltos de tiempo
+        irregulares (y dependientes del número de ciclistas) en la animación.
+        
+        Returns:
+            True si la simulación sigue ejecutándose tras los n pasos
+        """
+        if not self.env or self.estado != "ejecutando":
+            return False
+        
+        env = self.env
+        inicio = env.now
+        limite = inicio + n * PASO_INTERPOLACION
+        while env.peek() <= limite:
+            env.step()
+            if self.estado != "ejecutando":
+                break
+        else:
+            # Sin más eventos hasta el límite: adelantar el reloj hasta él
+            if env.now < limite:
+                env.run(until=limite)
+        
+        self.tiempo_actual = env.now
+        
+        # La gestión de memoria se hace una sola vez por lote, al cruzar un múltiplo de 10 s
+        if int(env.now // 10) != int(inicio // 10):
+            self._gestionar_memoria_inteligente()
+        
+        return self.estado == "ejecutando"
+    
+    def ejecutar_hasta_final(self, pasos_por_lote: int = 1000, al_avanzar: Optional[Callable] = None):
+        """Ejecuta la simulación hasta que deja de estar en ejecución (normalmente, completada)
+        
+        Avanza por lotes de ejecutar_n_pasos; entre lote y lote llama a al_avanzar (si
+        se indica) para que quien la invoca pueda, por ejemplo, repintar la interfaz.
+        """
+        while self.ejecutar_n_pasos(pasos_por_lote):
+            if al_avanzar is not None:
+                al_avanzar()
     
     def pausar_simulacion(self):
         """Pausa la simulación"""
@@ -1119,59 +1488,51 @@ class SimuladorCiclorutas:
     
     def obtener_estado_actual(self) -> Dict:
         """Retorna el estado actual de la simulación"""
+        self._actualizar_posiciones()
         return {
             'estado': self.estado,
             'tiempo_actual': self.tiempo_actual,
             'coordenadas': self.coordenadas.copy(),
-            'colores': self.colores.copy(),
-            'ruta_actual': self.rutas.copy()
+            'colores': self.colores,
+            'colores_rgba': self._paleta_rgba[self._color_codigo[:self.num_ciclistas]],
+            'ruta_actual': self.rutas
         }
     
     def obtener_ciclistas_activos(self) -> Dict:
         """Retorna solo los ciclistas que están activos (no completados)"""
+        self._actualizar_posiciones()
         ciclistas_activos = {
-            'coordenadas': [],
+            'coordenadas': np.empty((0, 2), dtype=np.float64),
             'colores': [],
+            'colores_rgba': np.empty((0, 4), dtype=np.float32),
             'ruta_actual': [],
-            'velocidades': [],
+            'velocidades': np.empty(0, dtype=np.float64),
             'trayectorias': []
         }
         
-        # Verificar que todas las listas tengan la misma longitud
-        if not self.coordenadas or not self.colores or not self.rutas or not self.velocidades or not self.trayectorias:
+        # Índices de ciclistas activos en una sola comparación sobre el arreglo de estados
+        n = self.num_ciclistas
+        indices_activos = np.flatnonzero(self._estado_codigo[:n] == self.CODIGOS_ESTADO['activo'])
+        if indices_activos.size == 0:
             return ciclistas_activos
         
-        # Verificar que todas las listas tengan la misma longitud
-        min_length = min(len(self.coordenadas), len(self.colores), len(self.rutas), 
-                        len(self.velocidades), len(self.trayectorias))
+        # Coordenadas de los activos como un único arreglo (N, 2) que la visualización
+        # usa directamente como offsets del scatter
+        coordenadas = self._posicion[:, indices_activos].T
         
-        if min_length == 0:
-            return ciclistas_activos
+        # Pares con NaN o infinitos pasan al origen, como antes
+        coordenadas[~np.isfinite(coordenadas).all(axis=1)] = 0.0
         
-        for i in range(min_length):
-            # Solo incluir si el ciclista está activo
-            if i in self.estado_ciclistas and self.estado_ciclistas[i] == 'activo':
-                # Asegurar que las coordenadas sean una tupla de floats válida
-                coords = self.coordenadas[i]
-                coords_tuple = (0.0, 0.0)  # Valor por defecto
-                
-                try:
-                    if hasattr(coords, '__iter__') and len(coords) == 2:
-                        x_val = float(coords[0])
-                        y_val = float(coords[1])
-                        # Verificar que los valores sean números válidos
-                        if not (math.isnan(x_val) or math.isnan(y_val) or 
-                               math.isinf(x_val) or math.isinf(y_val)):
-                            coords_tuple = (x_val, y_val)
-                except (ValueError, TypeError, IndexError) as e:
-                    print(f"⚠️ Error procesando coordenadas del ciclista {i}: {e}")
-                    coords_tuple = (0.0, 0.0)
-                
-                ciclistas_activos['coordenadas'].append(coords_tuple)
-                ciclistas_activos['colores'].append(self.colores[i])
-                ciclistas_activos['ruta_actual'].append(self.rutas[i])
-                ciclistas_activos['velocidades'].append(self.velocidades[i])
-                ciclistas_activos['trayectorias'].append(self.trayectorias[i])
+        # Rutas y colores salen de sus catálogos; el RGBA en una sola indexación de la paleta
+        codigos_color = self._color_codigo[indices_activos]
+        paleta = self._paleta_colores
+        catalogo = self._catalogo_rutas
+        ciclistas_activos['coordenadas'] = coordenadas
+        ciclistas_activos['colores'] = [paleta[codigo] for codigo in codigos_color.tolist()]
+        ciclistas_activos['colores_rgba'] = self._paleta_rgba[codigos_color]
+        ciclistas_activos['ruta_actual'] = [catalogo[codigo] for codigo in self._ruta_codigo[indices_activos].tolist()]
+        ciclistas_activos['velocidades'] = self._velocidad[indices_activos]
+        ciclistas_activos['trayectorias'] = [self.obtener_trayectoria(i) for i in indices_activos.tolist()]
         
         return ciclistas_activos
     
@@ -1193,9 +1554,18 @@ class SimuladorCiclorutas:
         self.gestor_distribuciones.configurar_desde_dict(distribuciones)
         print(f"✅ Distribuciones configuradas para {len(distribuciones)} nodos")
     
+    @property
+    def config_version(self) -> int:
+        """Versión de la configuración de distribuciones (cambia con cada modificación)"""
+        return self.gestor_distribuciones.version
+    
     def obtener_distribuciones_nodos(self) -> Dict[str, Dict]:
         """Retorna la configuración actual de distribuciones"""
-        return self.gestor_distribuciones.obtener_todas_distribuciones()
+        # Reconstruir el diccionario solo si la configuración cambió desde la última consulta
+        if self._version_cache_distribuciones != self.config_version:
+            self._cache_distribuciones = self.gestor_distribuciones.obtener_todas_distribuciones()
+            self._version_cache_distribuciones = self.config_version
+        return self._cache_distribuciones
     
     def actualizar_distribucion_nodo(self, nodo_id: str, tipo: str, parametros: Dict):
         """Actualiza la distribución de un nodo específico"""
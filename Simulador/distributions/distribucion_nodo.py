@@ -10,6 +10,11 @@ from typing import Dict, List, Optional
 from abc import ABC, abstractmethod
 
 
+def _generador(rng: Optional[np.random.Generator]):
+    """Generador a usar para un sorteo: el recibido o, si no hay, el global de NumPy"""
+    return np.random if rng is None else rng
+
+
 class DistribucionBase(ABC):
     """Clase base abstracta para distribuciones de probabilidad"""
     
@@ -23,8 +28,12 @@ class DistribucionBase(ABC):
         pass
     
     @abstractmethod
-    def generar_tiempo_arribo(self) -> float:
-        """Genera un tiempo de arribo basado en la distribución"""
+    def generar_tiempo_arribo(self, rng: Optional[np.random.Generator] = None) -> float:
+        """Genera un tiempo de arribo basado en la distribución
+        
+        Args:
+            rng: Generador de NumPy a usar (por defecto el global de np.random)
+        """
         pass
     
     @abstractmethod
@@ -43,13 +52,13 @@ class DistribucionExponencial(DistribucionBase):
         if self.parametros['lambda'] < 0:
             self.parametros['lambda'] = 0.5
     
-    def generar_tiempo_arribo(self) -> float:
+    def generar_tiempo_arribo(self, rng: Optional[np.random.Generator] = None) -> float:
         """Genera tiempo de arribo usando distribución exponencial"""
         try:
             # Si lambda es 0, retornar tiempo infinito (no generar arribos)
             if self.parametros['lambda'] == 0:
                 return float('inf')
-            return np.random.exponential(1.0 / self.parametros['lambda'])
+            return _generador(rng).exponential(1.0 / self.parametros['lambda'])
         except Exception:
             return 1.0  # Fallback
     
@@ -68,13 +77,13 @@ class DistribucionPoisson(DistribucionBase):
         if self.parametros['lambda'] < 0:
             self.parametros['lambda'] = 2.0
     
-    def generar_tiempo_arribo(self) -> float:
+    def generar_tiempo_arribo(self, rng: Optional[np.random.Generator] = None) -> float:
         """Genera tiempo de arribo usando distribución de Poisson"""
         try:
             # Si lambda es 0, retornar tiempo infinito (no generar arribos)
             if self.parametros['lambda'] == 0:
                 return float('inf')
-            eventos = np.random.poisson(self.parametros['lambda'])
+            eventos = _generador(rng).poisson(self.parametros['lambda'])
             return max(0.1, eventos)  # Mínimo 0.1 segundos
         except Exception:
             return 1.0  # Fallback
@@ -95,10 +104,10 @@ class DistribucionUniforme(DistribucionBase):
             self.parametros['min'] = 1.0
             self.parametros['max'] = 5.0
     
-    def generar_tiempo_arribo(self) -> float:
+    def generar_tiempo_arribo(self, rng: Optional[np.random.Generator] = None) -> float:
         """Genera tiempo de arribo usando distribución uniforme"""
         try:
-            return np.random.uniform(self.parametros['min'], self.parametros['max'])
+            return _generador(rng).uniform(self.parametros['min'], self.parametros['max'])
         except Exception:
             return 1.0  # Fallback
     
@@ -118,13 +127,13 @@ class DistribucionNormal(DistribucionBase):
         if self.parametros['desviacion'] < 0:
             self.parametros['desviacion'] = 1.0
     
-    def generar_tiempo_arribo(self) -> float:
+    def generar_tiempo_arribo(self, rng: Optional[np.random.Generator] = None) -> float:
         """Genera tiempo de arribo usando distribución normal"""
         try:
             # Si desviación es 0, retornar tiempo infinito (no generar arribos)
             if self.parametros['desviacion'] == 0:
                 return float('inf')
-            tiempo = np.random.normal(self.parametros['media'], self.parametros['desviacion'])
+            tiempo = _generador(rng).normal(self.parametros['media'], self.parametros['desviacion'])
             return max(0.1, tiempo)  # Asegurar valor positivo mínimo
         except Exception:
             return 1.0  # Fallback
@@ -145,13 +154,13 @@ class DistribucionLogNormal(DistribucionBase):
         if self.parametros['sigma'] < 0:
             self.parametros['sigma'] = 1.0
     
-    def generar_tiempo_arribo(self) -> float:
+    def generar_tiempo_arribo(self, rng: Optional[np.random.Generator] = None) -> float:
         """Genera tiempo de arribo usando distribución log-normal"""
         try:
             # Si sigma es 0, retornar tiempo infinito (no generar arribos)
             if self.parametros['sigma'] == 0:
                 return float('inf')
-            tiempo = np.random.lognormal(self.parametros['mu'], self.parametros['sigma'])
+            tiempo = _generador(rng).lognormal(self.parametros['mu'], self.parametros['sigma'])
             return max(0.1, tiempo)  # Asegurar valor positivo mínimo
         except Exception:
             return 1.0  # Fallback
@@ -174,13 +183,13 @@ class DistribucionGamma(DistribucionBase):
         if self.parametros['escala'] < 0:
             self.parametros['escala'] = 1.0
     
-    def generar_tiempo_arribo(self) -> float:
+    def generar_tiempo_arribo(self, rng: Optional[np.random.Generator] = None) -> float:
         """Genera tiempo de arribo usando distribución gamma"""
         try:
             # Si forma o escala es 0, retornar tiempo infinito (no generar arribos)
             if self.parametros['forma'] == 0 or self.parametros['escala'] == 0:
                 return float('inf')
-            tiempo = np.random.gamma(self.parametros['forma'], self.parametros['escala'])
+            tiempo = _generador(rng).gamma(self.parametros['forma'], self.parametros['escala'])
             return max(0.1, tiempo)  # Asegurar valor positivo mínimo
         except Exception:
             return 1.0  # Fallback
@@ -203,13 +212,13 @@ class DistribucionWeibull(DistribucionBase):
         if self.parametros['escala'] < 0:
             self.parametros['escala'] = 1.0
     
-    def generar_tiempo_arribo(self) -> float:
+    def generar_tiempo_arribo(self, rng: Optional[np.random.Generator] = None) -> float:
         """Genera tiempo de arribo usando distribución Weibull"""
         try:
             # Si forma o escala es 0, retornar tiempo infinito (no generar arribos)
             if self.parametros['forma'] == 0 or self.parametros['escala'] == 0:
                 return float('inf')
-            tiempo = np.random.weibull(self.parametros['forma']) * self.parametros['escala']
+            tiempo = _generador(rng).weibull(self.parametros['forma']) * self.parametros['escala']
             return max(0.1, tiempo)  # Asegurar valor positivo mínimo
         except Exception:
             return 1.0  # Fallback
@@ -245,9 +254,9 @@ class DistribucionNodo:
         clase_distribucion = self.TIPOS_DISTRIBUCION[self.tipo]
         return clase_distribucion(self.parametros)
     
-    def generar_tiempo_arribo(self) -> float:
+    def generar_tiempo_arribo(self, rng: Optional[np.random.Generator] = None) -> float:
         """Genera un tiempo de arribo basado en la distribución configurada"""
-        return self._distribucion.generar_tiempo_arribo()
+        return self._distribucion.generar_tiempo_arribo(rng)
     
     def obtener_descripcion(self) -> str:
         """Retorna una descripción legible de la distribución"""
@@ -301,10 +310,12 @@ class GestorDistribuciones:
     
     def __init__(self):
         self.distribuciones = {}  # Dict[nodo_id, DistribucionNodo]
+        self.version = 0  # Se incrementa en cada cambio de configuración
     
     def configurar_nodo(self, nodo_id: str, tipo: str, parametros: Dict):
         """Configura la distribución para un nodo específico"""
         self.distribuciones[nodo_id] = DistribucionNodo(tipo, parametros)
+        self.version += 1
     
     def configurar_distribucion(self, nodo_id: str, tipo: str, parametros: Dict):
         """Configura la distribución para un nodo específico (alias de configurar_nodo)"""
@@ -314,14 +325,15 @@ class GestorDistribuciones:
         """Configura múltiples nodos desde un diccionario de configuraciones"""
         for nodo_id, config in configuraciones.items():
             self.distribuciones[nodo_id] = DistribucionNodo.crear_desde_configuracion(config)
+        self.version += 1
     
-    def generar_tiempo_arribo(self, nodo_id: str) -> float:
-        """Genera tiempo de arribo para un nodo específico"""
+    def generar_tiempo_arribo(self, nodo_id: str, rng: Optional[np.random.Generator] = None) -> float:
+        """Genera tiempo de arribo para un nodo específico (con el generador rng si se indica)"""
         if nodo_id in self.distribuciones:
-            return self.distribuciones[nodo_id].generar_tiempo_arribo()
+            return self.distribuciones[nodo_id].generar_tiempo_arribo(rng)
         else:
             # Distribución por defecto si no está configurada
-            return np.random.exponential(2.0)  # 0.5 arribos por segundo
+            return _generador(rng).exponential(2.0)  # 0.5 arribos por segundo
     
     def obtener_distribucion(self, nodo_id: str) -> Optional[DistribucionNodo]:
         """Obtiene la distribución de un nodo específico"""
@@ -343,10 +355,12 @@ class GestorDistribuciones:
         for i, nodo in enumerate(nodos):
             if nodo not in self.distribuciones:
                 self.distribuciones[nodo] = DistribucionNodo.crear_por_defecto(nodo, i)
+        self.version += 1
     
     def limpiar(self):
         """Limpia todas las distribuciones"""
         self.distribuciones.clear()
+        self.version += 1
     
     def tiene_distribucion(self, nodo_id: str) -> bool:
         """Verifica si un nodo tiene distribución configurada"""
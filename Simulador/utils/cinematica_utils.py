@@ -0,0 +1,186 @@
+"""
+Utilidades de cinemática vectorizada para los ciclistas.
+
+Este módulo calcula en bloque las posiciones de todos los ciclistas que
+están recorriendo un tramo, a partir de arreglos contiguos (estructura de
+arreglos) con la geometría de cada tramo, y los puntos de trayectoria que
+se guardan de cada tramo. Si Numba está instalado los cálculos se compilan
+con JIT (y el de posiciones se paraleliza); si no, se usa NumPy vectorizado.
+"""
+
+import math
+import os
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_DISPONIBLE = True
+except ImportError:  # Numba es opcional
+    NUMBA_DISPONIBLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Decorador neutro cuando Numba no está disponible"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda funcion: funcion
+
+
+# Duración fija de cada paso de interpolación (segundos de simulación)
+PASO_INTERPOLACION = 0.5
+
+# Tolerancia para absorber el error de redondeo al acumular pasos de 0.5 s
+_EPSILON_PASO = 1e-6
+
+# Cada cuántos pasos de interpolación se guarda un punto de trayectoria
+PASOS_ENTRE_MUESTRAS = 5
+
+# Firmas explícitas de los kernels (arreglos contiguos de float64, enteros de 64 bits):
+# son exactamente las versiones que usa el simulador, así que precompilar() puede
+# compilarlas (o cargarlas de la cache en disco) sin llamar a los kernels con datos de prueba
+FIRMA_POSICIONES = ('void(float64[::1], float64[::1], float64[::1], float64[::1], float64[::1], '
+                    'float64[::1], boolean[::1], float64, float64[::1], float64[::1])')
+FIRMA_MUESTREO = 'int64(float64, float64, float64, float64, int64, int64, float64[:, ::1], int64)'
+
+# Variable de entorno que desactiva la compilación anticipada (p. ej. en scripts de prueba)
+VARIABLE_SIN_PRECOMPILAR = 'CICLORUTAS_SKIP_WARMUP'
+
+# Ciclistas en tramo a partir de los cuales compensa repartir el cálculo entre hilos
+# (por debajo, arrancar los hilos cuesta más que el propio cálculo)
+UMBRAL_PARALELO = 2048
+
+
+@njit(fastmath=True, cache=True)
+def _posicion_en_tramo(i, origen_x, origen_y, delta_x, delta_y, t_inicio, pasos,
+                       tiempo, salida_x, salida_y):
+    """Kernel JIT: posición del ciclista i en su tramo para el instante dado"""
+    k = math.floor((tiempo - t_inicio[i]) / PASO_INTERPOLACION + _EPSILON_PASO) - 1.0
+    if k < 0.0:
+        k = 0.0
+    elif k > pasos[i]:
+        k = pasos[i]
+    salida_x[i] = origen_x[i] + k * delta_x[i]
+    salida_y[i] = origen_y[i] + k * delta_y[i]
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _calcular_posiciones_jit(origen_x, origen_y, delta_x, delta_y, t_inicio, pasos,
+                             en_tramo, tiempo, salida_x, salida_y):
+    """Kernel JIT: posición de cada ciclista en su tramo, repartiendo los ciclistas entre hilos"""
+    for i in prange(origen_x.shape[0]):
+        if en_tramo[i]:
+            _posicion_en_tramo(i, origen_x, origen_y, delta_x, delta_y, t_inicio, pasos,
+                               tiempo, salida_x, salida_y)
+
+
+@njit(fastmath=True, cache=True)
+def _calcular_posiciones_serie_jit(origen_x, origen_y, delta_x, delta_y, t_inicio, pasos,
+                                   en_tramo, tiempo, salida_x, salida_y):
+    """Kernel JIT: posición de cada ciclista en su tramo, en un solo hilo"""
+    for i in range(origen_x.shape[0]):
+        if en_tramo[i]:
+            _posicion_en_tramo(i, origen_x, origen_y, delta_x, delta_y, t_inicio, pasos,
+                               tiempo, salida_x, salida_y)
+
+
+@njit(fastmath=True, cache=True)
+def _muestrear_tramo_jit(origen_x, origen_y, delta_x, delta_y, desde, hasta, salida, inicio):
+    """Kernel JIT: escribe desde salida[inicio] los puntos de trayectoria de los pasos desde..hasta"""
+    k = inicio
+    paso = desde
+    while paso <= hasta and k < salida.shape[0]:
+        salida[k, 0] = origen_x + paso * delta_x
+        salida[k, 1] = origen_y + paso * delta_y
+        k += 1
+        paso += PASOS_ENTRE_MUESTRAS
+    return k
+
+
+class CinematicaUtils:
+    """Utilidades para calcular posiciones de ciclistas en bloque"""
+
+    @staticmethod
+    def calcular_posiciones(origen_x: np.ndarray, origen_y: np.ndarray,
+                            delta_x: np.ndarray, delta_y: np.ndarray,
+                            t_inicio: np.ndarray, pasos: np.ndarray,
+                            en_tramo: np.ndarray, tiempo: float,
+                            salida_x: np.ndarray, salida_y: np.ndarray):
+        """Escribe en salida_x/salida_y la posición actual de los ciclistas en tramo
+
+        La posición sigue exactamente la interpolación por pasos de 0.5 s del
+        simulador: tras el paso k (k = 0..pasos) el ciclista está en
+        origen + k * delta.
+
+        Args:
+            origen_x, origen_y: Coordenadas de inicio del tramo de cada ciclista
+            delta_x, delta_y: Incremento por paso de interpolación
+            t_inicio: Instante de simulación en que el ciclista entró al tramo
+            pasos: Número de pasos del tramo
+            en_tramo: Máscara booleana de ciclistas que están recorriendo un tramo
+            tiempo: Instante de simulación actual
+            salida_x, salida_y: Arreglos de salida (se modifican en el lugar)
+        """
+        if NUMBA_DISPONIBLE:
+            # Los ciclistas son independientes en este cálculo (cada uno escribe su propia
+            # fila): con muchos se reparten entre hilos, con pocos se recorren en serie
+            # (cuentan solo los que están en tramo, no las filas completadas o vacías)
+            kernel = (_calcular_posiciones_jit if np.count_nonzero(en_tramo) >= UMBRAL_PARALELO
+                      else _calcular_posiciones_serie_jit)
+            kernel(origen_x, origen_y, delta_x, delta_y, t_inicio, pasos,
+                   en_tramo, tiempo, salida_x, salida_y)
+            return
+
+        # Ruta NumPy vectorizada (sin bucle de Python por ciclista)
+        indices = np.flatnonzero(en_tramo)
+        if indices.size == 0:
+            return
+
+        k = np.floor((tiempo - t_inicio[indices]) / PASO_INTERPOLACION + _EPSILON_PASO) - 1.0
+        k = np.clip(k, 0.0, pasos[indices])
+        salida_x[indices] = origen_x[indices] + k * delta_x[indices]
+        salida_y[indices] = origen_y[indices] + k * delta_y[indices]
+
+    @staticmethod
+    def muestrear_tramo(origen_x: float, origen_y: float, delta_x: float, delta_y: float,
+                        desde: int, hasta: int, salida: np.ndarray, inicio: int) -> int:
+        """Escribe los puntos de trayectoria de un tramo en un búfer preasignado
+        
+        Se guarda un punto cada PASOS_ENTRE_MUESTRAS pasos, empezando en el paso
+        desde y sin pasar del paso hasta; la escritura se corta al llenarse el búfer.
+        
+        Args:
+            origen_x, origen_y: Coordenadas de inicio del tramo
+            delta_x, delta_y: Incremento por paso de interpolación
+            desde, hasta: Primer y último paso a considerar
+            salida: Búfer (M, 2) donde se escriben los puntos (se modifica en el lugar)
+            inicio: Primera fila libre del búfer
+        
+        Returns:
+            Fila libre siguiente tras escribir los puntos
+        """
+        if NUMBA_DISPONIBLE:
+            return _muestrear_tramo_jit(origen_x, origen_y, delta_x, delta_y,
+                                        desde, hasta, salida, inicio)
+        
+        pasos = np.arange(desde, hasta + 1, PASOS_ENTRE_MUESTRAS)[:max(0, salida.shape[0] - inicio)]
+        fin = inicio + pasos.size
+        salida[inicio:fin, 0] = origen_x + pasos * delta_x
+        salida[inicio:fin, 1] = origen_y + pasos * delta_y
+        return fin
+    
+    @staticmethod
+    def precompilar():
+        """Compila los kernels JIT para sus firmas explícitas
+        
+        Pensado para llamarse desde un hilo en segundo plano al iniciar la
+        aplicación, de modo que el primer paso de simulación no pague la
+        compilación. Con cache=True la primera ejecución deja el código compilado
+        en __pycache__ y las siguientes solo lo cargan. No hace nada sin Numba o
+        si está definida la variable de entorno CICLORUTAS_SKIP_WARMUP.
+        """
+        if not NUMBA_DISPONIBLE or os.environ.get(VARIABLE_SIN_PRECOMPILAR):
+            return
+        
+        for kernel in (_calcular_posiciones_jit, _calcular_posiciones_serie_jit):
+            kernel.compile(FIRMA_POSICIONES)
+        _muestrear_tramo_jit.compile(FIRMA_MUESTREO)
@@ -8,7 +8,6 @@ desacoplada del simulador principal para mejor mantenibilidad.
 import numpy as np
 import networkx as nx
 from typing import Dict, List, Tuple, Optional, Any
-from collections import Counter
 
 
 class EstadisticasUtils:
@@ -18,23 +17,71 @@ class EstadisticasUtils:
     def calcular_estadisticas_basicas(coordenadas: List, velocidades: List, 
                                      estado_ciclistas: Dict, config) -> Dict:
         """Calcula estadísticas básicas de la simulación"""
-        # Contar ciclistas por estado
-        ciclistas_activos = sum(1 for estado in estado_ciclistas.values() if estado == 'activo')
-        ciclistas_completados = sum(1 for estado in estado_ciclistas.values() if estado == 'completado')
+        # Una sola pasada por los estados: conteos e índices de ciclistas activos/completados
+        ciclistas_activos = 0
+        ciclistas_completados = 0
+        indices = []
+        num_velocidades = len(velocidades)
+        for i, estado in estado_ciclistas.items():
+            if estado == 'activo':
+                ciclistas_activos += 1
+            elif estado == 'completado':
+                ciclistas_completados += 1
+            else:
+                continue
+            if 0 <= i < num_velocidades:
+                indices.append(i)
         
-        # Obtener velocidades de TODOS los ciclistas (activos y completados)
-        velocidades_todos = []
-        for i, velocidad in enumerate(velocidades):
-            if i in estado_ciclistas and estado_ciclistas[i] in ['activo', 'completado']:
-                velocidades_todos.append(velocidad)
+        # Velocidades de TODOS los ciclistas (activos y completados) agregadas con NumPy
+        if indices:
+            velocidades_todos = np.asarray(velocidades, dtype=float)[indices]
+            velocidad_promedio = float(velocidades_todos.mean())
+            velocidad_minima = float(velocidades_todos.min())
+            velocidad_maxima = float(velocidades_todos.max())
+        else:
+            velocidad_promedio = velocidad_minima = velocidad_maxima = 0
         
         return {
             'total_ciclistas': len(coordenadas),
             'ciclistas_activos': ciclistas_activos,
             'ciclistas_completados': ciclistas_completados,
-            'velocidad_promedio': np.mean(velocidades_todos) if velocidades_todos else 0,
-            'velocidad_minima': min(velocidades_todos) if velocidades_todos else 0,
-            'velocidad_maxima': max(velocidades_todos) if velocidades_todos else 0,
+            'velocidad_promedio': velocidad_promedio,
+            'velocidad_minima': velocidad_minima,
+            'velocidad_maxima': velocidad_maxima,
+            'usando_grafo_real': hasattr(config, 'usar_grafo_real') and config.usar_grafo_real,
+            'duracion_simulacion': getattr(config, 'duracion_simulacion', 0)
+        }
+    
+    @staticmethod
+    def calcular_estadisticas_basicas_arreglos(total_ciclistas: int, arreglos: Dict[str, np.ndarray],
+                                               config) -> Dict:
+        """Calcula las estadísticas básicas a partir de los arreglos por ciclista
+        
+        Args:
+            total_ciclistas: Número de ciclistas creados
+            arreglos: 'velocidades' y máscaras 'activos'/'completados' (ver
+                SimuladorCiclorutas.obtener_arreglos_ciclistas)
+            config: Configuración de la simulación
+        """
+        activos = arreglos['activos']
+        completados = arreglos['completados']
+        
+        # Velocidades de TODOS los ciclistas (activos y completados)
+        velocidades_todos = arreglos['velocidades'][activos | completados]
+        if velocidades_todos.size:
+            velocidad_promedio = float(velocidades_todos.mean())
+            velocidad_minima = float(velocidades_todos.min())
+            velocidad_maxima = float(velocidades_todos.max())
+        else:
+            velocidad_promedio = velocidad_minima = velocidad_maxima = 0
+        
+        return {
+            'total_ciclistas': total_ciclistas,
+            'ciclistas_activos': int(np.count_nonzero(activos)),
+            'ciclistas_completados': int(np.count_nonzero(completados)),
+            'velocidad_promedio': velocidad_promedio,
+            'velocidad_minima': velocidad_minima,
+            'velocidad_maxima': velocidad_maxima,
             'usando_grafo_real': hasattr(config, 'usar_grafo_real') and config.usar_grafo_real,
             'duracion_simulacion': getattr(config, 'duracion_simulacion', 0)
         }
@@ -119,11 +166,10 @@ class EstadisticasUtils:
         """Calcula todas las estadísticas del simulador de forma integrada"""
         stats = {}
         
-        # Estadísticas básicas
-        stats.update(EstadisticasUtils.calcular_estadisticas_basicas(
-            simulador.coordenadas, 
-            simulador.velocidades, 
-            simulador.estado_ciclistas, 
+        # Estadísticas básicas (vectorizadas sobre los arreglos por ciclista)
+        stats.update(EstadisticasUtils.calcular_estadisticas_basicas_arreglos(
+            simulador.ciclistas_registrados,
+            simulador.obtener_arreglos_ciclistas(),
             simulador.config
         ))
         
@@ -224,7 +270,7 @@ class EstadisticasUtils:
             'tiempo_actual': simulador.tiempo_actual,
             'estado_simulacion': simulador.estado,
             'ciclistas_activos_count': len(ciclistas_activos['coordenadas']),
-            'velocidad_promedio_activos': np.mean(ciclistas_activos['velocidades']) if ciclistas_activos['velocidades'] else 0,
+            'velocidad_promedio_activos': float(np.mean(ciclistas_activos['velocidades'])) if len(ciclistas_activos['velocidades']) else 0,
             'rutas_unicas_activas': len(set(ciclistas_activos['ruta_actual']))
         }
     
@@ -5,11 +5,11 @@ Este módulo contiene la funcionalidad para exportar los resultados
 de la simulación a archivos Excel con múltiples hojas.
 """
 
-import pandas as pd
 import os
 from datetime import datetime
-from typing import Dict, List, Optional, Any
-import networkx as nx
+from typing import Dict, List
+
+# pandas se importa dentro de cada método: solo se paga al exportar resultados
 
 
 class GeneradorExcel:
@@ -42,6 +42,8 @@ class GeneradorExcel:
         
         # Crear el archivo Excel con múltiples hojas
         try:
+            import pandas as pd
+            
             with pd.ExcelWriter(ruta_archivo, engine='openpyxl') as writer:
                 
                 # Hoja 1: Información General de la Simulación
@@ -69,6 +71,7 @@ class GeneradorExcel:
     
     def _crear_hoja_info_simulacion(self, simulador, writer):
         """Crea la hoja con información general de la simulación"""
+        import pandas as pd
         
         # Obtener estadísticas completas
         from ..utils.estadisticas_utils import EstadisticasUtils
@@ -160,6 +163,7 @@ class GeneradorExcel:
     
     def _crear_hoja_tramos(self, simulador, writer):
         """Crea la hoja con información detallada de los tramos"""
+        import pandas as pd
         
         datos_tramos = []
         
@@ -273,6 +277,7 @@ class GeneradorExcel:
     
     def _crear_hoja_ciclistas(self, simulador, writer):
         """Crea la hoja con información detallada de los ciclistas"""
+        import pandas as pd
         
         try:
             # Obtener TODOS los ciclistas que participaron en la simulación
@@ -452,6 +457,7 @@ class GeneradorExcel:
     
     def _crear_hoja_tiempos(self, simulador, writer):
         """Crea la hoja con estadísticas de tiempos de desplazamiento"""
+        import pandas as pd
         
         datos_tiempos = []
         
@@ -8,13 +8,29 @@ en el contexto de la simulación de ciclorutas.
 import networkx as nx
 import numpy as np
 import math
-from typing import Dict, List, Tuple, Optional, Any
-import pandas as pd
+import hashlib
+import os
+import pickle
+from typing import TYPE_CHECKING, Dict, List, Tuple, Optional, Any
+
+# pandas tarda en importarse: solo lo necesita crear_grafo_desde_excel
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 class GrafoUtils:
     """Utilidades para manejo de grafos"""
     
+    # Layouts automáticos ya calculados, por huella de la topología del grafo
+    _cache_layouts: Dict[bytes, Dict] = {}
+    
+    # Directorio donde se persisten los layouts entre ejecuciones
+    DIRECTORIO_CACHE_LAYOUTS = os.path.join(os.path.expanduser('~'), '.cache', 'ciclorutas')
+    
+    # Umbrales de tamaño (nodos) para elegir la estrategia de layout automático
+    NODOS_LAYOUT_PEQUENO = 50
+    NODOS_LAYOUT_GRANDE = 200
+    
     @staticmethod
     def validar_grafo(grafo: nx.Graph) -> bool:
         """Valida que el grafo sea adecuado para la simulación"""
@@ -34,7 +50,7 @@ class GrafoUtils:
         return True
     
     @staticmethod
-    def calcular_posiciones_grafo(grafo: nx.Graph, seed: int = 42) -> Dict:
+    def calcular_posiciones_grafo(grafo: nx.Graph, seed: int = 42, recalcular: bool = False) -> Dict:
         """Calcula posiciones para visualización del grafo
         
         Si el grafo tiene coordenadas LAT/LON en los nodos, las usa directamente
@@ -44,6 +60,8 @@ class GrafoUtils:
         Args:
             grafo: Grafo NetworkX con posibles atributos 'lat' y 'lon' en los nodos
             seed: Semilla para layouts aleatorios (solo si no hay coordenadas)
+            recalcular: Si es True, el layout automático se resuelve de nuevo con una
+                semilla aleatoria y reemplaza al cacheado para (grafo, seed)
             
         Returns:
             Diccionario con posiciones (x, y) para cada nodo
@@ -79,51 +97,40 @@ class GrafoUtils:
             es_geografico = (abs(min_lat) < 1000 and abs(max_lat) < 1000 and 
                            abs(min_lon) < 1000 and abs(max_lon) < 1000)
             
-            pos = {}
-            for nodo in grafo.nodes():
-                # Todos los nodos tienen coordenadas (ya validado arriba)
-                lat = float(grafo.nodes[nodo]['lat'])
-                lon = float(grafo.nodes[nodo]['lon'])
+            # Todos los nodos tienen coordenadas (ya validado arriba): se transforman
+            # en bloque con NumPy en lugar de releer y convertir nodo por nodo
+            lat_arr = np.asarray(lats, dtype=np.float64)
+            lon_arr = np.asarray(lons, dtype=np.float64)
+            
+            if es_geografico:
+                # Coordenadas geográficas: mapear al espacio de visualización
+                # RESPETANDO ORIENTACIÓN ESPACIAL REAL:
+                # - LAT (latitud) → Y (eje vertical) → Norte-Sur
+                #   * Valores mayores de LAT = más al norte = más arriba en pantalla
+                #   * Valores menores de LAT = más al sur = más abajo en pantalla
+                # - LON (longitud) → X (eje horizontal) → Este-Oeste  
+                #   * Valores mayores de LON = más al este = más a la derecha en pantalla
+                #   * Valores menores de LON = más al oeste = más a la izquierda en pantalla
+                # Esto garantiza que los nodos y arcos respeten las direcciones geográficas reales
                 
-                if es_geografico:
-                    # Coordenadas geográficas: mapear al espacio de visualización
-                    # RESPETANDO ORIENTACIÓN ESPACIAL REAL:
-                    # - LAT (latitud) → Y (eje vertical) → Norte-Sur
-                    #   * Valores mayores de LAT = más al norte = más arriba en pantalla
-                    #   * Valores menores de LAT = más al sur = más abajo en pantalla
-                    # - LON (longitud) → X (eje horizontal) → Este-Oeste  
-                    #   * Valores mayores de LON = más al este = más a la derecha en pantalla
-                    #   * Valores menores de LON = más al oeste = más a la izquierda en pantalla
-                    # Esto garantiza que los nodos y arcos respeten las direcciones geográficas reales
-                    
-                    # Calcular rangos
-                    rango_lat = max_lat - min_lat if max_lat - min_lat > 0 else 1.0
-                    rango_lon = max_lon - min_lon if max_lon - min_lon > 0 else 1.0
-                    
-                    # Convertir coordenadas geográficas a metros (aproximación)
-                    # 1 grado de latitud ≈ 111,000 metros (constante en todo el mundo)
-                    # 1 grado de longitud ≈ 111,000 * cos(latitud_promedio) metros (varía con latitud)
-                    lat_promedio = (min_lat + max_lat) / 2.0
-                    metros_por_grado_lat = 111000.0
-                    metros_por_grado_lon = 111000.0 * abs(math.cos(math.radians(lat_promedio)))
-                    
-                    # Convertir a metros relativos al punto mínimo (suroeste)
-                    # Esto mantiene las proporciones espaciales reales
-                    x_metros = (lon - min_lon) * metros_por_grado_lon  # Este-Oeste: mayor LON = mayor X
-                    y_metros = (lat - min_lat) * metros_por_grado_lat  # Norte-Sur: mayor LAT = mayor Y
-                    
-                    # Usar las coordenadas en metros directamente
-                    # El punto (0,0) corresponde al nodo más al sur y más al oeste
-                    # Los arcos se dibujarán como líneas rectas respetando estas posiciones espaciales
-                    x = x_metros
-                    y = y_metros
-                    
-                else:
-                    # Coordenadas ya en metros/UTM: usar directamente
-                    x = lon
-                    y = lat
+                # Convertir coordenadas geográficas a metros (aproximación)
+                # 1 grado de latitud ≈ 111,000 metros (constante en todo el mundo)
+                # 1 grado de longitud ≈ 111,000 * cos(latitud_promedio) metros (varía con latitud)
+                lat_promedio = (min_lat + max_lat) / 2.0
+                metros_por_grado_lat = 111000.0
+                metros_por_grado_lon = 111000.0 * abs(math.cos(math.radians(lat_promedio)))
                 
-                pos[nodo] = (x, y)
+                # Convertir a metros relativos al punto mínimo (suroeste)
+                # Esto mantiene las proporciones espaciales reales: el punto (0,0)
+                # corresponde al nodo más al sur y más al oeste
+                xs = (lon_arr - min_lon) * metros_por_grado_lon  # Este-Oeste: mayor LON = mayor X
+                ys = (lat_arr - min_lat) * metros_por_grado_lat  # Norte-Sur: mayor LAT = mayor Y
+            else:
+                # Coordenadas ya en metros/UTM: usar directamente
+                xs = lon_arr
+                ys = lat_arr
+            
+            pos = dict(zip(nodos_con_coordenadas, zip(xs.tolist(), ys.tolist())))
             
             print(f"   Rango LAT: {min_lat:.6f} a {max_lat:.6f}")
             print(f"   Rango LON: {min_lon:.6f} a {max_lon:.6f}")
@@ -148,7 +155,107 @@ class GrafoUtils:
             print(f"   • Usando layout automático (spring_layout)")
             print(f"   💡 Para usar organización geográfica, TODOS los nodos deben tener columnas LAT y LON")
             
-            return nx.spring_layout(grafo, seed=seed, k=2, iterations=50)
+            return GrafoUtils._calcular_layout_automatico(grafo, seed, recalcular)
+    
+    @staticmethod
+    def _calcular_layout_automatico(grafo: nx.Graph, seed: int, recalcular: bool = False) -> Dict:
+        """Calcula el spring_layout del grafo reutilizando el resultado si ya se calculó
+        
+        Con semilla fija el layout solo depende de los nodos y arcos (y su orden),
+        así que recargar el mismo archivo no vuelve a resolver el sistema de fuerzas.
+        Al recalcular se usa una semilla nueva (con la misma saldría el mismo layout),
+        pero el resultado se guarda bajo la clave de seed: así recargar el archivo
+        conserva el layout recalculado y no quedan archivos de cache huérfanos.
+        """
+        huella = repr((list(grafo.nodes()), list(grafo.edges(data='weight')), seed))
+        clave = hashlib.blake2b(huella.encode(), digest_size=16).digest()
+        
+        pos = None if recalcular else GrafoUtils._cache_layouts.get(clave)
+        if recalcular:
+            semilla_nueva = int(np.random.default_rng().integers(2**31))
+            pos = GrafoUtils._resolver_layout_automatico(grafo, semilla_nueva)
+            GrafoUtils._guardar_layout_disco(clave, pos)
+            GrafoUtils._cache_layouts[clave] = pos
+        elif pos is not None:
+            print("♻️ Layout reutilizado desde cache")
+        else:
+            pos = GrafoUtils._cargar_layout_disco(clave)
+            if pos is None:
+                pos = GrafoUtils._resolver_layout_automatico(grafo, seed)
+                GrafoUtils._guardar_layout_disco(clave, pos)
+            GrafoUtils._cache_layouts[clave] = pos
+        
+        # Copia profunda (tuplas nuevas, no las coordenadas del cache) para que
+        # modificar las posiciones no altere el layout de otros grafos iguales
+        return {nodo: (float(p[0]), float(p[1])) for nodo, p in pos.items()}
+    
+    @staticmethod
+    def _ruta_layout_disco(clave: bytes) -> str:
+        """Ruta del archivo de cache en disco para una huella de grafo"""
+        return os.path.join(GrafoUtils.DIRECTORIO_CACHE_LAYOUTS, f"layout_{clave.hex()}.pkl")
+    
+    @staticmethod
+    def _cargar_layout_disco(clave: bytes) -> Optional[Dict]:
+        """Carga un layout persistido en disco, o None si no existe o no se puede leer"""
+        ruta = GrafoUtils._ruta_layout_disco(clave)
+        if not os.path.exists(ruta):
+            return None
+        try:
+            with open(ruta, 'rb') as archivo:
+                pos = pickle.load(archivo)
+            print("♻️ Layout cargado desde cache en disco")
+            return pos
+        except Exception as e:
+            print(f"⚠️ No se pudo leer el layout en cache ({e}), se recalculará")
+            return None
+    
+    @staticmethod
+    def _guardar_layout_disco(clave: bytes, pos: Dict):
+        """Persiste un layout en disco (si falla, solo se pierde el cache)"""
+        try:
+            os.makedirs(GrafoUtils.DIRECTORIO_CACHE_LAYOUTS, exist_ok=True)
+            with open(GrafoUtils._ruta_layout_disco(clave), 'wb') as archivo:
+                pickle.dump(pos, archivo, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            print(f"⚠️ No se pudo guardar el layout en cache: {e}")
+    
+    @staticmethod
+    def limpiar_cache_layouts():
+        """Elimina los layouts cacheados en memoria y en disco"""
+        GrafoUtils._cache_layouts.clear()
+        directorio = GrafoUtils.DIRECTORIO_CACHE_LAYOUTS
+        if not os.path.isdir(directorio):
+            return
+        for nombre in os.listdir(directorio):
+            if nombre.startswith('layout_') and nombre.endswith('.pkl'):
+                try:
+                    os.remove(os.path.join(directorio, nombre))
+                except OSError as e:
+                    print(f"⚠️ No se pudo eliminar {nombre}: {e}")
+        print("✅ Cache de layouts limpiado")
+    
+    @staticmethod
+    def _resolver_layout_automatico(grafo: nx.Graph, seed: int) -> Dict:
+        """Resuelve el layout automático con un costo acorde al tamaño del grafo
+        
+        - Grafos pequeños: spring_layout con menos iteraciones (el resultado es
+          visualmente igual).
+        - Grafos grandes: layout espectral (álgebra lineal vectorizada) como punto
+          de partida, refinado con pocas iteraciones de spring_layout.
+        """
+        num_nodos = grafo.number_of_nodes()
+        
+        if num_nodos <= GrafoUtils.NODOS_LAYOUT_PEQUENO:
+            return nx.spring_layout(grafo, seed=seed, k=2, iterations=30)
+        
+        if num_nodos > GrafoUtils.NODOS_LAYOUT_GRANDE:
+            try:
+                pos_inicial = nx.spectral_layout(grafo)
+                return nx.spring_layout(grafo, pos=pos_inicial, seed=seed, k=2, iterations=10)
+            except Exception as e:
+                print(f"⚠️ Layout espectral no disponible ({e}), usando spring_layout completo")
+        
+        return nx.spring_layout(grafo, seed=seed, k=2, iterations=50)
     
     @staticmethod
     def obtener_coordenada_nodo(pos_grafo: Dict, nodo_id: str) -> Tuple[float, float]:
@@ -393,22 +500,58 @@ class GrafoUtils:
         return distancia
     
     @staticmethod
-    def crear_grafo_desde_excel(archivo_excel: str) -> Tuple[nx.Graph, Dict, Optional[pd.DataFrame], Optional[pd.DataFrame]]:
-        """Crea un grafo NetworkX desde un archivo Excel"""
-        # Leer datos del Excel
-        nodos_df = pd.read_excel(archivo_excel, sheet_name="NODOS", engine="openpyxl")
-        arcos_df = pd.read_excel(archivo_excel, sheet_name="ARCOS", engine="openpyxl")
+    def calcular_distancias_arcos(origenes, destinos, coordenadas_nodos: Dict,
+                                  distancia_por_defecto: float = 100.0) -> Tuple[np.ndarray, int]:
+        """Calcula en bloque la distancia de cada arco a partir de las coordenadas de sus nodos
         
-        # Verificar si hay hojas adicionales
-        excel_file = pd.ExcelFile(archivo_excel)
-        perfiles_df = None
-        rutas_df = None
+        Aplica por arco el mismo criterio que _calcular_distancia_euclidiana (Haversine si
+        las cuatro coordenadas están en grados, euclidiana plana si no), pero con
+        operaciones de NumPy sobre todos los arcos a la vez.
         
-        if "PERFILES" in excel_file.sheet_names:
-            perfiles_df = pd.read_excel(archivo_excel, sheet_name="PERFILES", engine="openpyxl")
+        Args:
+            origenes, destinos: Nodos extremos de cada arco (secuencias del mismo largo)
+            coordenadas_nodos: Dict nodo -> (lat, lon)
+            distancia_por_defecto: Distancia para arcos con algún extremo sin coordenadas
+            
+        Returns:
+            (distancias en metros, número de arcos sin coordenadas)
+        """
+        faltante = (np.nan, np.nan)
+        extremos = np.array(
+            [coordenadas_nodos.get(origen, faltante) + coordenadas_nodos.get(destino, faltante)
+             for origen, destino in zip(origenes, destinos)],
+            dtype=float
+        ).reshape(-1, 4)
+        lat1, lon1, lat2, lon2 = extremos.T
+        
+        # Haversine (coordenadas geográficas en grados)
+        R = 6371000
+        a = (np.sin(np.radians(lat2 - lat1) / 2) ** 2 +
+             np.cos(np.radians(lat1)) * np.cos(np.radians(lat2)) *
+             np.sin(np.radians(lon2 - lon1) / 2) ** 2)
+        haversine = 2 * R * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+        
+        # Euclidiana plana (coordenadas en metros o UTM)
+        euclidiana = np.hypot(lat2 - lat1, lon2 - lon1)
+        
+        distancias = np.where((np.abs(extremos) < 1000).all(axis=1), haversine, euclidiana)
+        sin_coordenadas = np.isnan(extremos).any(axis=1)
+        distancias[sin_coordenadas] = distancia_por_defecto
+        return distancias, int(sin_coordenadas.sum())
+    
+    @staticmethod
+    def crear_grafo_desde_excel(archivo_excel: str) -> Tuple[nx.Graph, Dict, Optional['pd.DataFrame'], Optional['pd.DataFrame']]:
+        """Crea un grafo NetworkX desde un archivo Excel"""
+        import pandas as pd
         
-        if "RUTAS" in excel_file.sheet_names:
-            rutas_df = pd.read_excel(archivo_excel, sheet_name="RUTAS", engine="openpyxl")
+        # Leer datos del Excel abriendo el libro una sola vez
+        with pd.ExcelFile(archivo_excel, engine="openpyxl") as excel_file:
+            nodos_df = excel_file.parse("NODOS")
+            arcos_df = excel_file.parse("ARCOS")
+            
+            # Hojas adicionales (opcionales)
+            perfiles_df = excel_file.parse("PERFILES") if "PERFILES" in excel_file.sheet_names else None
+            rutas_df = excel_file.parse("RUTAS") if "RUTAS" in excel_file.sheet_names else None
         
         # Crear grafo NetworkX
         G = nx.Graph()
@@ -417,22 +560,21 @@ class GrafoUtils:
         tiene_lat_lon = 'LAT' in nodos_df.columns and 'LON' in nodos_df.columns
         coordenadas_nodos = {}
         
-        # Agregar nodos y almacenar coordenadas si existen
+        # Agregar nodos en bloque y almacenar coordenadas si existen
         columna_nodos = nodos_df.columns[0]  # Primera columna es la de nodos
-        for idx, fila in nodos_df.iterrows():
-            nodo = fila[columna_nodos]
-            G.add_node(nodo)
-            
-            # Guardar coordenadas si existen
-            if tiene_lat_lon:
+        nodos = nodos_df[columna_nodos].tolist()
+        G.add_nodes_from(nodos)
+        
+        if tiene_lat_lon:
+            for nodo, lat, lon in zip(nodos, nodos_df['LAT'].tolist(), nodos_df['LON'].tolist()):
                 try:
-                    lat = float(fila['LAT'])
-                    lon = float(fila['LON'])
-                    coordenadas_nodos[nodo] = (lat, lon)
-                    G.nodes[nodo]['lat'] = lat
-                    G.nodes[nodo]['lon'] = lon
-                except (ValueError, KeyError):
-                    pass
+                    lat = float(lat)
+                    lon = float(lon)
+                except (ValueError, TypeError):
+                    continue
+                coordenadas_nodos[nodo] = (lat, lon)
+                G.nodes[nodo]['lat'] = lat
+                G.nodes[nodo]['lon'] = lon
         
         # Verificar atributos disponibles en arcos
         atributos_disponibles = []
@@ -452,44 +594,37 @@ class GrafoUtils:
             # Calcular distancias euclidianas desde coordenadas
             col_origen = arcos_df.columns[0]
             col_destino = arcos_df.columns[1]
-            distancias_calculadas = []
-            
-            for _, fila in arcos_df.iterrows():
-                origen = fila[col_origen]
-                destino = fila[col_destino]
-                
-                if origen in coordenadas_nodos and destino in coordenadas_nodos:
-                    lat1, lon1 = coordenadas_nodos[origen]
-                    lat2, lon2 = coordenadas_nodos[destino]
-                    distancia = GrafoUtils._calcular_distancia_euclidiana(lat1, lon1, lat2, lon2)
-                    distancias_calculadas.append(distancia)
-                else:
-                    distancias_calculadas.append(100.0)  # Distancia por defecto
+            distancias_calculadas, _ = GrafoUtils.calcular_distancias_arcos(
+                arcos_df[col_origen].tolist(), arcos_df[col_destino].tolist(), coordenadas_nodos
+            )
             
             # Reemplazar/Agregar columna DISTANCIA con valores calculados
             arcos_df['DISTANCIA'] = distancias_calculadas
             if 'DISTANCIA' not in atributos_disponibles:
                 atributos_disponibles.append('DISTANCIA')
         
-        # Agregar arcos con todos los atributos
-        for _, fila in arcos_df.iterrows():
-            origen, destino = fila[0], fila[1]
-            
-            # Crear diccionario de atributos
-            atributos = {}
-            for col in arcos_df.columns:
-                if col not in ['ORIGEN', 'DESTINO']:
-                    atributos[col.lower()] = fila[col]
-            
-            # Configurar pesos para diferentes usos
-            if 'distancia' in atributos:
-                atributos['weight'] = atributos['distancia']
-            
-            # Asegurar que siempre tengamos distancia_real para simulación
-            if 'distancia_real' not in atributos and 'distancia' in atributos:
-                atributos['distancia_real'] = atributos['distancia']
-            
-            G.add_edge(origen, destino, **atributos)
+        # Agregar arcos con todos los atributos en bloque (columnas resueltas una sola vez)
+        columnas_atributos = [col for col in arcos_df.columns if col not in ('ORIGEN', 'DESTINO')]
+        claves_atributos = [col.lower() for col in columnas_atributos]
+        usar_distancia_como_peso = 'distancia' in claves_atributos
+        copiar_distancia_real = usar_distancia_como_peso and 'distancia_real' not in claves_atributos
+        
+        def _generar_arcos():
+            columnas = list(arcos_df.columns[:2]) + columnas_atributos
+            for origen, destino, *valores in arcos_df[columnas].itertuples(index=False, name=None):
+                atributos = dict(zip(claves_atributos, valores))
+                
+                # Configurar pesos para diferentes usos
+                if usar_distancia_como_peso:
+                    atributos['weight'] = atributos['distancia']
+                
+                # Asegurar que siempre tengamos distancia_real para simulación
+                if copiar_distancia_real:
+                    atributos['distancia_real'] = atributos['distancia']
+                
+                yield origen, destino, atributos
+        
+        G.add_edges_from(_generar_arcos())
         
         # Calcular posiciones del grafo
         pos = GrafoUtils.calcular_posiciones_grafo(G)
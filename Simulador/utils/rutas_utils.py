@@ -8,8 +8,6 @@ basadas en perfiles de ciclistas y atributos del grafo.
 import networkx as nx
 import numpy as np
 from typing import Dict, List, Tuple, Optional, Any
-from scipy.optimize import minimize
-import heapq
 
 
 class RutasUtils:
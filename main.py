@@ -15,6 +15,7 @@ Versión inicial: 1.0.0 (Tesis de Pregrado, Universidad de los Andes, Colombia,
 
 import sys
 import os
+import importlib.util
 
 def verificar_dependencias():
     """Verifica que todas las dependencias estén instaladas"""
@@ -30,13 +31,10 @@ def verificar_dependencias():
     
     faltantes = []
     
+    # find_spec localiza el paquete sin importarlo: pandas, scipy, etc. solo se
+    # cargan cuando se usan (la ventana no espera por ellos al arrancar)
     for dep in dependencias:
-        try:
-            if dep == 'tkinter':
-                import tkinter
-            else:
-                __import__(dep)
-        except ImportError:
+        if importlib.util.find_spec(dep) is None:
             faltantes.append(dep)
     
     if faltantes:
@@ -110,7 +108,7 @@ def main():
         
         root = tk.Tk()
         app = InterfazSimulacion(root)
-        root.mainloop()
+        app.ejecutar()
         
     except ImportError as e:
         print(f"❌ ERROR: No se pudo importar la interfaz: {e}")